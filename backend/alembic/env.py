@@ -4,7 +4,7 @@ from alembic import context
 
 from app.core.config import settings
 from app.core.database import Base
-from app.models import user, interview, calendar_event
+from app.models import user, interview, calendar_event, calendar_sync_job, calendar_sync_cursor, interview_tombstone, daily_user_activity, interview_status_event, user_funnel_stat, salary_benchmark, cohort_benchmark, cohort_refresh, interview_signature, interview_tag, saved_view, idempotency_key
 
 config = context.config
 config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
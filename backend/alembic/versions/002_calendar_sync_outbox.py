@@ -0,0 +1,48 @@
+"""Calendar sync outbox
+
+Revision ID: 002_calendar_sync_outbox
+Revises: 001_initial_migration
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '002_calendar_sync_outbox'
+down_revision = '001_initial_migration'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('calendar_sync_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('interview_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('calendar_event_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('external_event_id', sa.String(length=255), nullable=True),
+        sa.Column('calendar_provider', sa.String(length=50), nullable=False),
+        sa.Column('action', sa.Enum('UPSERT', 'DELETE', name='syncjobaction'), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'PROCESSING', 'DONE', 'FAILED', name='syncjobstatus'), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('available_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # Workers poll on (status, available_at); keep the index small by only
+    # covering rows that can still be claimed
+    op.create_index(
+        'ix_calendar_sync_jobs_claim', 'calendar_sync_jobs', ['status', 'available_at'],
+        postgresql_where=sa.text("status IN ('PENDING', 'PROCESSING')")
+    )
+
+def downgrade():
+    op.drop_index('ix_calendar_sync_jobs_claim')
+    op.drop_table('calendar_sync_jobs')
+    op.execute('DROP TYPE IF EXISTS syncjobstatus')
+    op.execute('DROP TYPE IF EXISTS syncjobaction')
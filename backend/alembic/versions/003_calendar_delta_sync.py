@@ -0,0 +1,53 @@
+"""Calendar delta sync cursors and interview tombstones
+
+Revision ID: 003_calendar_delta_sync
+Revises: 002_calendar_sync_outbox
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '003_calendar_delta_sync'
+down_revision = '002_calendar_sync_outbox'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('calendar_sync_cursors',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('calendar_provider', sa.String(length=50), nullable=False),
+        sa.Column('synced_until', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'calendar_provider', name='uq_calendar_sync_cursors_user_provider')
+    )
+
+    op.create_table('interview_tombstones',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('interview_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    # Changed-since indexes backing the delta sync query
+    op.create_index('ix_interview_tombstones_user_deleted_at', 'interview_tombstones', ['user_id', 'deleted_at'])
+    op.create_index('ix_interviews_user_updated_at', 'interviews', ['user_id', 'updated_at'])
+    op.create_index(
+        'ix_calendar_events_unsynced', 'calendar_events', ['calendar_provider', 'updated_at'],
+        postgresql_where=sa.text('is_synced = false')
+    )
+
+def downgrade():
+    op.drop_index('ix_calendar_events_unsynced')
+    op.drop_index('ix_interviews_user_updated_at')
+    op.drop_index('ix_interview_tombstones_user_deleted_at')
+    op.drop_table('interview_tombstones')
+    op.drop_table('calendar_sync_cursors')
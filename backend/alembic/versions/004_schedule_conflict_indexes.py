@@ -0,0 +1,28 @@
+"""Schedule conflict indexes
+
+Revision ID: 004_schedule_conflict_indexes
+Revises: 003_calendar_delta_sync
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '004_schedule_conflict_indexes'
+down_revision = '003_calendar_delta_sync'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Interval lookups for conflict detection: interviews by (user, date) and
+    # their calendar events by (interview, start, end)
+    op.create_index('ix_interviews_user_interview_date', 'interviews', ['user_id', 'interview_date'])
+    op.create_index(
+        'ix_calendar_events_interview_start_end', 'calendar_events',
+        ['interview_id', 'start_time', 'end_time']
+    )
+
+def downgrade():
+    op.drop_index('ix_calendar_events_interview_start_end')
+    op.drop_index('ix_interviews_user_interview_date')
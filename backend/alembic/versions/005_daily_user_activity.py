@@ -0,0 +1,66 @@
+"""Daily user activity rollup
+
+Revision ID: 005_daily_user_activity
+Revises: 004_schedule_conflict_indexes
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '005_daily_user_activity'
+down_revision = '004_schedule_conflict_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('daily_user_activity',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('company_name', sa.String(length=100), nullable=False),
+        sa.Column('applications', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('interviews', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('offers', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rejections', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('responses', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('response_days_total', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('last_status', postgresql.ENUM(name='applicationstatus', create_type=False), nullable=True),
+        sa.Column('last_activity', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_daily_user_activity_user_day', 'daily_user_activity', ['user_id', 'day'])
+    op.create_index('ix_daily_user_activity_user_company', 'daily_user_activity', ['user_id', 'company_name'])
+
+    # Backfill from existing interviews (one compacted row per key)
+    op.execute("""
+        INSERT INTO daily_user_activity (
+            id, user_id, day, company_name, applications, interviews, offers,
+            rejections, responses, response_days_total, last_status, last_activity
+        )
+        SELECT
+            gen_random_uuid(),
+            user_id,
+            (created_at AT TIME ZONE 'UTC')::date,
+            company_name,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE application_status IN ('HR_INTERVIEW', 'TECH_INTERVIEW', 'MANAGER_INTERVIEW')),
+            COUNT(*) FILTER (WHERE application_status = 'OFFER'),
+            COUNT(*) FILTER (WHERE application_status = 'REJECTED'),
+            COUNT(*) FILTER (WHERE application_status <> 'APPLIED'),
+            COALESCE(SUM(EXTRACT(EPOCH FROM updated_at - created_at) / 86400)
+                FILTER (WHERE application_status <> 'APPLIED'), 0),
+            (ARRAY_AGG(application_status ORDER BY updated_at DESC))[1],
+            MAX(updated_at)
+        FROM interviews
+        GROUP BY user_id, (created_at AT TIME ZONE 'UTC')::date, company_name
+    """)
+
+def downgrade():
+    op.drop_index('ix_daily_user_activity_user_company')
+    op.drop_index('ix_daily_user_activity_user_day')
+    op.drop_table('daily_user_activity')
@@ -0,0 +1,62 @@
+"""Interview status events and per-user funnel aggregate
+
+Revision ID: 006_interview_status_funnel
+Revises: 005_daily_user_activity
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '006_interview_status_funnel'
+down_revision = '005_daily_user_activity'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('interview_status_events',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('interview_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('from_status', postgresql.ENUM(name='applicationstatus', create_type=False), nullable=True),
+        sa.Column('to_status', postgresql.ENUM(name='applicationstatus', create_type=False), nullable=False),
+        sa.Column('days_in_previous', sa.Float(), nullable=True),
+        sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_interview_status_events_interview_changed_at', 'interview_status_events', ['interview_id', 'changed_at'])
+    op.create_index('ix_interview_status_events_user_changed_at', 'interview_status_events', ['user_id', 'changed_at'])
+
+    op.create_table('user_funnel_stats',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('from_status', sa.String(length=20), nullable=False),
+        sa.Column('to_status', sa.String(length=20), nullable=False),
+        sa.Column('duration_bucket', sa.Integer(), nullable=False),
+        sa.Column('transitions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'from_status', 'to_status', 'duration_bucket')
+    )
+
+    # Backfill: earlier transitions were never recorded, so each existing
+    # interview enters the funnel directly at its current status
+    op.execute("""
+        INSERT INTO interview_status_events (id, user_id, interview_id, to_status, changed_at)
+        SELECT gen_random_uuid(), user_id, id, COALESCE(application_status, 'APPLIED'), created_at
+        FROM interviews
+    """)
+    op.execute("""
+        INSERT INTO user_funnel_stats (user_id, from_status, to_status, duration_bucket, transitions)
+        SELECT user_id, 'NEW', to_status::text, 0, COUNT(*)
+        FROM interview_status_events
+        GROUP BY user_id, to_status
+    """)
+
+def downgrade():
+    op.drop_table('user_funnel_stats')
+    op.drop_index('ix_interview_status_events_user_changed_at')
+    op.drop_index('ix_interview_status_events_interview_changed_at')
+    op.drop_table('interview_status_events')
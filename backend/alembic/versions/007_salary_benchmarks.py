@@ -0,0 +1,31 @@
+"""Platform-wide salary benchmarks
+
+Revision ID: 007_salary_benchmarks
+Revises: 006_interview_status_funnel
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '007_salary_benchmarks'
+down_revision = '006_interview_status_funnel'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('salary_benchmarks',
+        sa.Column('role_key', sa.String(length=100), nullable=False),
+        sa.Column('location_key', sa.String(length=100), nullable=False),
+        sa.Column('sample_size', sa.Integer(), nullable=False),
+        sa.Column('p25', sa.Float(), nullable=False),
+        sa.Column('p50', sa.Float(), nullable=False),
+        sa.Column('p75', sa.Float(), nullable=False),
+        sa.Column('p90', sa.Float(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('role_key', 'location_key')
+    )
+
+def downgrade():
+    op.drop_table('salary_benchmarks')
@@ -0,0 +1,50 @@
+"""Cohort funnel benchmarks and refresh queue
+
+Revision ID: 008_cohort_benchmarks
+Revises: 007_salary_benchmarks
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '008_cohort_benchmarks'
+down_revision = '007_salary_benchmarks'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('cohort_benchmarks',
+        sa.Column('work_mode', sa.String(length=10), nullable=False),
+        sa.Column('period', sa.String(length=10), nullable=False),
+        sa.Column('week_start', sa.Date(), nullable=True),
+        sa.Column('applications', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('users', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('interviews', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('offers', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('interview_rate', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('offer_rate', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('applications_per_user', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('velocity', sa.Float(), nullable=True),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('work_mode', 'period')
+    )
+
+    op.create_table('cohort_refresh_queue',
+        sa.Column('work_mode', sa.String(length=10), nullable=False),
+        sa.Column('week_start', sa.Date(), nullable=False),
+        sa.Column('queued_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('work_mode', 'week_start')
+    )
+
+    # Queue every existing cohort so the first job run builds the full history
+    op.execute("""
+        INSERT INTO cohort_refresh_queue (work_mode, week_start)
+        SELECT DISTINCT work_mode::text, date_trunc('week', created_at AT TIME ZONE 'UTC')::date
+        FROM interviews
+    """)
+
+def downgrade():
+    op.drop_table('cohort_refresh_queue')
+    op.drop_table('cohort_benchmarks')
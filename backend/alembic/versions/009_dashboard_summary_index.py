@@ -0,0 +1,24 @@
+"""Covering index for the dashboard summary counts
+
+Revision ID: 009_dashboard_summary_index
+Revises: 008_cohort_benchmarks
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '009_dashboard_summary_index'
+down_revision = '008_cohort_benchmarks'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index(
+        'ix_interviews_user_status_mode',
+        'interviews',
+        ['user_id', 'application_status', 'work_mode', 'created_at', 'interview_date']
+    )
+
+def downgrade():
+    op.drop_index('ix_interviews_user_status_mode')
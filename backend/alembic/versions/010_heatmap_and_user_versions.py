@@ -0,0 +1,41 @@
+"""User timezone and data version, hour-of-week expression indexes
+
+Revision ID: 010_heatmap_and_user_versions
+Revises: 009_dashboard_summary_index
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '010_heatmap_and_user_versions'
+down_revision = '009_dashboard_summary_index'
+branch_labels = None
+depends_on = None
+
+def _utc_hour_of_week(column):
+    # Must match app.models.interview.utc_hour_of_week for the planner to use it
+    return sa.text(
+        f"(CAST(EXTRACT(DOW FROM timezone('UTC', {column})) AS INTEGER) * 24"
+        f" + CAST(EXTRACT(HOUR FROM timezone('UTC', {column})) AS INTEGER))"
+    )
+
+def upgrade():
+    op.add_column('users', sa.Column('timezone', sa.String(length=64), nullable=True, server_default='UTC'))
+    op.add_column('users', sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'))
+
+    op.create_index(
+        'ix_interviews_user_hour_of_week', 'interviews',
+        ['user_id', _utc_hour_of_week('created_at')]
+    )
+    op.create_index(
+        'ix_interview_status_events_user_hour_of_week', 'interview_status_events',
+        ['user_id', _utc_hour_of_week('changed_at')]
+    )
+
+def downgrade():
+    op.drop_index('ix_interview_status_events_user_hour_of_week')
+    op.drop_index('ix_interviews_user_hour_of_week')
+    op.drop_column('users', 'data_version')
+    op.drop_column('users', 'timezone')
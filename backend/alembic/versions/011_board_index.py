@@ -0,0 +1,25 @@
+"""Board column index
+
+Revision ID: 011_board_index
+Revises: 010_heatmap_and_user_versions
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '011_board_index'
+down_revision = '010_heatmap_and_user_versions'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # ROW_NUMBER() OVER (PARTITION BY application_status ORDER BY updated_at)
+    # and per-column cursor pages read this index in order
+    op.create_index(
+        'ix_interviews_user_status_updated_at', 'interviews',
+        ['user_id', 'application_status', 'updated_at']
+    )
+
+def downgrade():
+    op.drop_index('ix_interviews_user_status_updated_at')
@@ -0,0 +1,49 @@
+"""Replace hour-of-week expression indexes with 15-minute UTC slot indexes
+
+Revision ID: 012_heatmap_quarter_hour_index
+Revises: 011_board_index
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '012_heatmap_quarter_hour_index'
+down_revision = '011_board_index'
+branch_labels = None
+depends_on = None
+
+def _utc_quarter_hour(column):
+    # Must match app.models.interview.utc_quarter_hour for the planner to use it
+    return sa.text(f"CAST(FLOOR(EXTRACT(EPOCH FROM timezone('UTC', {column})) / 900) AS BIGINT)")
+
+def _utc_hour_of_week(column):
+    return sa.text(
+        f"(CAST(EXTRACT(DOW FROM timezone('UTC', {column})) AS INTEGER) * 24"
+        f" + CAST(EXTRACT(HOUR FROM timezone('UTC', {column})) AS INTEGER))"
+    )
+
+def upgrade():
+    op.drop_index('ix_interview_status_events_user_hour_of_week')
+    op.drop_index('ix_interviews_user_hour_of_week')
+    op.create_index(
+        'ix_interviews_user_quarter_hour', 'interviews',
+        ['user_id', _utc_quarter_hour('created_at')]
+    )
+    op.create_index(
+        'ix_interview_status_events_user_quarter_hour', 'interview_status_events',
+        ['user_id', _utc_quarter_hour('changed_at')]
+    )
+
+def downgrade():
+    op.drop_index('ix_interview_status_events_user_quarter_hour')
+    op.drop_index('ix_interviews_user_quarter_hour')
+    op.create_index(
+        'ix_interviews_user_hour_of_week', 'interviews',
+        ['user_id', _utc_hour_of_week('created_at')]
+    )
+    op.create_index(
+        'ix_interview_status_events_user_hour_of_week', 'interview_status_events',
+        ['user_id', _utc_hour_of_week('changed_at')]
+    )
@@ -0,0 +1,47 @@
+"""Fractional board ranks
+
+Revision ID: 013_board_rank
+Revises: 012_heatmap_quarter_hour_index
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '013_board_rank'
+down_revision = '012_heatmap_quarter_hour_index'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('interviews', sa.Column('board_rank', sa.String(255), nullable=True))
+    # Keep the current board order (most recently updated first); zero-padded
+    # digits are valid base-36 ranks and the rebalance worker respaces them
+    op.execute(
+        """
+        UPDATE interviews SET board_rank = ranked.board_rank
+        FROM (
+            SELECT id, lpad(row_number() OVER (
+                PARTITION BY user_id, COALESCE(application_status, 'APPLIED')
+                ORDER BY updated_at DESC, id DESC
+            )::text, 10, '0') AS board_rank
+            FROM interviews
+        ) AS ranked
+        WHERE interviews.id = ranked.id
+        """
+    )
+    op.alter_column('interviews', 'board_rank', nullable=False)
+    op.drop_index('ix_interviews_user_status_updated_at')
+    op.create_index(
+        'ix_interviews_user_status_rank', 'interviews',
+        ['user_id', 'application_status', 'board_rank']
+    )
+
+def downgrade():
+    op.drop_index('ix_interviews_user_status_rank')
+    op.create_index(
+        'ix_interviews_user_status_updated_at', 'interviews',
+        ['user_id', 'application_status', 'updated_at']
+    )
+    op.drop_column('interviews', 'board_rank')
@@ -0,0 +1,25 @@
+"""Company name prefix index for autocomplete
+
+Revision ID: 014_company_prefix_index
+Revises: 013_board_rank
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '014_company_prefix_index'
+down_revision = '013_board_rank'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # text_pattern_ops lets LIKE 'prefix%' use the index under any collation
+    op.create_index(
+        'ix_interviews_user_company_prefix', 'interviews',
+        ['user_id', sa.text('lower(company_name) text_pattern_ops')]
+    )
+
+def downgrade():
+    op.drop_index('ix_interviews_user_company_prefix')
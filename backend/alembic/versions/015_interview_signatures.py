@@ -0,0 +1,59 @@
+"""Interview signatures for duplicate detection
+
+Revision ID: 015_interview_signatures
+Revises: 014_company_prefix_index
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.utils.duplicates import normalize_company
+from app.utils.salary import normalize_role
+
+# revision identifiers
+revision = '015_interview_signatures'
+down_revision = '014_company_prefix_index'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+def upgrade():
+    signatures = op.create_table('interview_signatures',
+        sa.Column('interview_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('company_key', sa.String(length=100), nullable=False),
+        sa.Column('role_key', sa.String(length=100), nullable=False),
+        sa.ForeignKeyConstraint(['interview_id'], ['interviews.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('interview_id')
+    )
+    op.create_index(
+        'ix_interview_signatures_user_company_role', 'interview_signatures',
+        ['user_id', 'company_key', 'role_key']
+    )
+
+    # Keys are normalized in Python (role aliases), so backfill from here
+    bind = op.get_bind()
+    rows = bind.execution_options(stream_results=True).execute(
+        sa.text("SELECT id, user_id, company_name, role_title FROM interviews")
+    )
+    while True:
+        batch = rows.fetchmany(BACKFILL_BATCH_SIZE)
+        if not batch:
+            break
+        op.bulk_insert(signatures, [
+            {
+                "interview_id": interview_id,
+                "user_id": user_id,
+                "company_key": normalize_company(company_name),
+                "role_key": normalize_role(role_title),
+            }
+            for interview_id, user_id, company_name, role_title in batch
+        ])
+
+def downgrade():
+    op.drop_index('ix_interview_signatures_user_company_role')
+    op.drop_table('interview_signatures')
@@ -0,0 +1,32 @@
+"""Interview tags
+
+Revision ID: 016_interview_tags
+Revises: 015_interview_signatures
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '016_interview_tags'
+down_revision = '015_interview_signatures'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('interview_tags',
+        sa.Column('interview_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tag', sa.String(length=50), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(['interview_id'], ['interviews.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('interview_id', 'tag')
+    )
+    # Covers tags_any/tags_all lookups and tag facet counts
+    op.create_index('ix_interview_tags_user_tag', 'interview_tags', ['user_id', 'tag', 'interview_id'])
+
+def downgrade():
+    op.drop_index('ix_interview_tags_user_tag')
+    op.drop_table('interview_tags')
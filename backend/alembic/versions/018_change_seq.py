@@ -0,0 +1,30 @@
+"""Interview change feed sequence
+
+Revision ID: 018_change_seq
+Revises: 017_saved_views
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '018_change_seq'
+down_revision = '017_saved_views'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('interviews', sa.Column('change_seq', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('interview_tombstones', sa.Column('change_seq', sa.Integer(), server_default='0', nullable=False))
+    # Existing rows sort before every later write; clients start with a full sync
+    op.create_index('ix_interviews_user_change_seq', 'interviews', ['user_id', 'change_seq', 'id'])
+    op.create_index(
+        'ix_interview_tombstones_user_change_seq', 'interview_tombstones', ['user_id', 'change_seq', 'interview_id']
+    )
+
+def downgrade():
+    op.drop_index('ix_interview_tombstones_user_change_seq', table_name='interview_tombstones')
+    op.drop_index('ix_interviews_user_change_seq', table_name='interviews')
+    op.drop_column('interview_tombstones', 'change_seq')
+    op.drop_column('interviews', 'change_seq')
@@ -0,0 +1,46 @@
+"""Count distinct interviews per funnel stage; drop deleted interviews from the funnel
+
+Revision ID: 020_funnel_reached
+Revises: 019_idempotency_keys
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '020_funnel_reached'
+down_revision = '019_idempotency_keys'
+branch_labels = None
+depends_on = None
+
+# app.repositories.funnel.DURATION_BUCKET_BOUNDS when this revision was written
+DURATION_BUCKET_BOUNDS = (1, 2, 3, 5, 7, 10, 14, 21, 30, 45, 60, 90)
+
+def _duration_bucket(column):
+    whens = " ".join(
+        f"WHEN COALESCE({column}, 0) < {bound} THEN {index}" for index, bound in enumerate(DURATION_BUCKET_BOUNDS)
+    )
+    return f"CASE {whens} ELSE {len(DURATION_BUCKET_BOUNDS)} END"
+
+def upgrade():
+    # Rebuilt from the status log: deletes never reversed the aggregate, and
+    # the log outlives deleted interviews, so only existing ones are counted
+    op.execute("DELETE FROM user_funnel_stats")
+    op.execute(f"""
+        INSERT INTO user_funnel_stats (user_id, from_status, to_status, duration_bucket, transitions, updated_at)
+        SELECT e.user_id, COALESCE(CAST(e.from_status AS VARCHAR), 'NEW'), CAST(e.to_status AS VARCHAR),
+               {_duration_bucket('e.days_in_previous')}, count(*), now()
+        FROM interview_status_events e
+        JOIN interviews i ON i.id = e.interview_id
+        GROUP BY 1, 2, 3, 4
+    """)
+    op.execute("""
+        INSERT INTO user_funnel_stats (user_id, from_status, to_status, duration_bucket, transitions, updated_at)
+        SELECT e.user_id, 'REACHED', CAST(e.to_status AS VARCHAR), 0, count(DISTINCT e.interview_id), now()
+        FROM interview_status_events e
+        JOIN interviews i ON i.id = e.interview_id
+        GROUP BY e.user_id, e.to_status
+    """)
+
+def downgrade():
+    op.execute("DELETE FROM user_funnel_stats WHERE from_status = 'REACHED'")
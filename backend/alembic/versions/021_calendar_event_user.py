@@ -0,0 +1,35 @@
+"""Owner on calendar events, indexed for per-user time-window scans
+
+Revision ID: 021_calendar_event_user
+Revises: 020_funnel_reached
+Create Date: 2026-10-19 18:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '021_calendar_event_user'
+down_revision = '020_funnel_reached'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('calendar_events', sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.execute("""
+        UPDATE calendar_events SET user_id = interviews.user_id
+        FROM interviews WHERE interviews.id = calendar_events.interview_id
+    """)
+    op.alter_column('calendar_events', 'user_id', nullable=False)
+    op.create_foreign_key(
+        'calendar_events_user_id_fkey', 'calendar_events', 'users', ['user_id'], ['id'], ondelete='CASCADE'
+    )
+    op.create_index(
+        'ix_calendar_events_user_start_end', 'calendar_events', ['user_id', 'start_time', 'end_time']
+    )
+
+def downgrade():
+    op.drop_index('ix_calendar_events_user_start_end')
+    op.drop_constraint('calendar_events_user_id_fkey', 'calendar_events', type_='foreignkey')
+    op.drop_column('calendar_events', 'user_id')
@@ -1,18 +1,82 @@
+import asyncio
+import functools
+import threading
+from typing import Any, Callable
 from fastapi import Depends, HTTPException, status, Request
+from fastapi.routing import APIRoute
 from fastapi.security import HTTPBearer
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import BATCH_USER, LazySession, get_db, release_connection
 from app.core.security import decode_token
 from app.repositories.user import UserRepository
 from app.models.user import User
 
 security = HTTPBearer()
 
+# Bounds the connections run_db's threads hold at once; the rest wait for a slot
+_db_slots = threading.BoundedSemaphore(settings.DB_THREAD_LIMIT)
+
+def _release_connections(values: dict) -> None:
+    for value in values.values():
+        if isinstance(value, (Session, LazySession)):
+            release_connection(value)
+
+def _releasing_connection(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    # Same signature as the endpoint, so FastAPI resolves the same dependencies
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            result = await endpoint(*args, **kwargs)
+            _release_connections(kwargs)
+            return result
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            result = endpoint(*args, **kwargs)
+            _release_connections(kwargs)
+            return result
+    return wrapper
+
+async def run_db(db: Session, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run ``fn`` (blocking database work) in the threadpool, leaving the event
+    loop free to notice the client disconnecting and cancel its query.
+    Sub-requests of POST /batch share their session, so they run inline.
+    """
+    if getattr(db, "shared", False):
+        return fn(*args, **kwargs)
+    # Don't hold a connection (from authentication) while waiting for a thread
+    release_connection(db)
+    return await run_in_threadpool(_with_db_slot, db, fn, *args, **kwargs)
+
+def _with_db_slot(db: Session, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    with _db_slots:
+        result = fn(*args, **kwargs)
+        release_connection(db)
+        return result
+
+class DBSessionRoute(APIRoute):
+    """
+    Gives the request's database connection back to the pool as soon as the
+    endpoint returns, instead of after the response is serialized and sent
+    (when get_db's cleanup runs).
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, _releasing_connection(endpoint), **kwargs)
+
 async def get_current_user(
     request: Request,
     token: str = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
+    # Sub-requests of POST /batch reuse the user it authenticated
+    shared = request.scope.get(BATCH_USER)
+    if shared is not None:
+        return shared
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -0,0 +1,101 @@
+"""
+Idempotency-Key support for mutating endpoints.
+
+The first request carrying a key claims it and runs; its response is stored
+with the key. Retries of the same request get the stored response back after
+one primary-key lookup, without reaching the service layer, and a retry that
+arrives while the first request is still running gets 409 instead of running
+twice. Keys expire after IDEMPOTENCY_KEY_TTL_HOURS.
+"""
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from uuid import UUID
+from fastapi import Depends, Header, HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.repositories.idempotency_key import IdempotencyKeyRepository
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; stored values are UTC
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+class IdempotencyGuard:
+    def __init__(self, db: Session, user_id: UUID, key: Optional[str] = None, replay: Optional[Response] = None):
+        self.db = db
+        self.user_id = user_id
+        self.key = key
+        # Set when the key was already used: return it as-is
+        self.replay = replay
+        self.completed = False
+
+    def respond(self, content: Any, status_code: int) -> JSONResponse:
+        """The endpoint's JSON response, stored under the key for replays"""
+        response = JSONResponse(content=jsonable_encoder(content), status_code=status_code)
+        if self.key:
+            IdempotencyKeyRepository(self.db).complete(self.user_id, self.key, status_code, response.body)
+            self.db.commit()
+            self.completed = True
+        return response
+
+async def idempotency(
+    request: Request,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if not idempotency_key:
+        yield IdempotencyGuard(db, current_user.id)
+        return
+    
+    body = await request.body()
+    fingerprint = hashlib.sha256(b"\n".join((request.method.encode(), request.url.path.encode(), body))).hexdigest()
+    repo = IdempotencyKeyRepository(db)
+    now = datetime.now(timezone.utc)
+    
+    existing = repo.get_key(current_user.id, idempotency_key)
+    if existing is not None and _as_utc(existing.expires_at) > now:
+        if existing.fingerprint != fingerprint:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used for a different request"
+            )
+        if existing.status_code is not None:
+            yield IdempotencyGuard(db, current_user.id, replay=Response(
+                content=existing.response_body,
+                status_code=existing.status_code,
+                media_type="application/json",
+                headers={"Idempotent-Replayed": "true"}
+            ))
+            return
+    
+    # Only one request can hold the claim; concurrent duplicates get 409
+    claimed = repo.claim(
+        current_user.id, idempotency_key, fingerprint, now,
+        locked_until=now + timedelta(seconds=settings.IDEMPOTENCY_LOCK_SECONDS),
+        expires_at=now + timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS)
+    )
+    if not claimed:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A request with this Idempotency-Key is still in progress"
+        )
+    db.commit()
+    
+    guard = IdempotencyGuard(db, current_user.id, idempotency_key)
+    try:
+        yield guard
+    finally:
+        if not guard.completed:
+            # Failed requests don't keep the key; the client may retry
+            db.rollback()
+            repo.release(current_user.id, idempotency_key)
+            db.commit()
@@ -13,9 +13,9 @@ from app.core.security import (
 )
 from app.schemas.user import User, UserCreate, UserLogin, Token
 from app.services.auth import AuthService
-from app.api.deps import get_current_user
+from app.api.deps import DBSessionRoute, get_current_user
 
-router = APIRouter()
+router = APIRouter(route_class=DBSessionRoute)
 
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register(
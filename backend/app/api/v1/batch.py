@@ -0,0 +1,85 @@
+import asyncio
+import json
+import logging
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import Response
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import BATCH_SESSION, BATCH_USER, get_db
+from app.api.deps import DBSessionRoute, get_current_user
+from app.models.user import User
+from app.schemas.batch import BatchRequest, BatchRequestItem, BatchResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=DBSessionRoute)
+
+# Sub-requests that would recurse or never finish
+UNBATCHABLE_PATHS = frozenset({"/batch", "/dashboard/stream"})
+
+def _response_item(item_id: str, status_code: int, body: bytes) -> bytes:
+    return b'{"id":%s,"status":%d,"body":%s}' % (json.dumps(item_id).encode(), status_code, body)
+
+async def _dispatch(request: Request, item: BatchRequestItem, db: Session, user: User) -> bytes:
+    """Run one sub-request through the app and return its response entry"""
+    path, _, query = item.path.partition("?")
+    if path in UNBATCHABLE_PATHS:
+        return _response_item(item.id, 400, json.dumps({"detail": f"{path} cannot be batched"}).encode())
+    
+    full_path = settings.API_V1_STR + path
+    scope = {
+        **request.scope,
+        "method": "GET",
+        "path": full_path,
+        "raw_path": full_path.encode(),
+        "query_string": query.encode(),
+        "headers": [
+            (name, value) for name, value in request.scope["headers"]
+            # Sub-responses are spliced into the batch body, so they must not be encoded
+            if name not in (b"content-length", b"content-type", b"accept-encoding")
+        ],
+        BATCH_SESSION: db,
+        BATCH_USER: user,
+    }
+    response = {"status": 500, "json": False, "body": []}
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["json"] = any(
+                name == b"content-type" and value.startswith(b"application/json")
+                for name, value in message.get("headers", ())
+            )
+        elif message["type"] == "http.response.body":
+            response["body"].append(message.get("body", b""))
+    
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # The app has already answered 500; keep the session usable for the rest
+        logger.exception("Batched request %s failed", item.path)
+        db.rollback()
+    body = b"".join(response["body"])
+    if not response["json"]:
+        body = json.dumps(body.decode(errors="replace")).encode()
+    return _response_item(item.id, response["status"], body or b"null")
+
+@router.post("", response_model=BatchResponse)
+async def batch(
+    batch_request: BatchRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Run several GET requests with one authentication and one database session"""
+    # Handlers interleave on the event loop; their synchronous DB calls
+    # never yield, so the shared session serves one of them at a time
+    db.shared = True
+    items = await asyncio.gather(*(
+        _dispatch(request, item, db, current_user) for item in batch_request.requests
+    ))
+    return Response(content=b'{"responses":[%s]}' % b",".join(items), media_type="application/json")
@@ -1,22 +1,30 @@
 from typing import Dict, Any
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query, UploadFile, File
 from sqlalchemy.orm import Session
 
+from app.core.compression import cached_body
+from app.core.config import settings
 from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import DBSessionRoute, get_current_user
+from app.api.idempotency import IdempotencyGuard, idempotency
 from app.models.user import User
+from app.schemas.calendar import ScheduleConflictsResponse
 from app.services.calendar import CalendarService
+from app.utils.ics import IcsTooLargeError
 
-router = APIRouter()
+router = APIRouter(route_class=DBSessionRoute)
 
-@router.post("/google/sync")
+@router.post("/google/sync", status_code=status.HTTP_202_ACCEPTED)
 async def sync_with_google_calendar(
     request: Dict[str, UUID],
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    idempotency_guard: IdempotencyGuard = Depends(idempotency)
 ) -> Dict[str, str]:
-    """Sync interview with Google Calendar"""
+    """Queue interview for Google Calendar sync; retries with the same Idempotency-Key replay the first response"""
+    if idempotency_guard.replay:
+        return idempotency_guard.replay
     calendar_service = CalendarService(db)
     
     interview_id = request.get("interview_id")
@@ -28,7 +36,6 @@ async def sync_with_google_calendar(
     
     try:
         result = calendar_service.sync_with_google_calendar(current_user, interview_id)
-        return result
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -37,12 +44,23 @@ async def sync_with_google_calendar(
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to sync with Google Calendar: {str(e)}"
+            detail=f"Failed to queue Google Calendar sync: {str(e)}"
         )
+    return idempotency_guard.respond(result, status.HTTP_202_ACCEPTED)
+
+@router.post("/google/delta-sync", status_code=status.HTTP_202_ACCEPTED)
+async def delta_sync_google_calendar(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> Dict[str, Any]:
+    """Queue Google Calendar sync for everything changed since the last cycle"""
+    calendar_service = CalendarService(db)
+    
+    return calendar_service.delta_sync(current_user, "google")
 
 @router.get("/ics")
 async def export_ics_feed(
-    response: Response,
+    request: Request,
     days_ahead: int = Query(90, ge=1, le=365, description="Number of days ahead to include"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -51,13 +69,17 @@ async def export_ics_feed(
     calendar_service = CalendarService(db)
     
     try:
-        ics_content = calendar_service.generate_ics_feed(current_user, days_ahead)
-        
-        response.headers["Content-Type"] = "text/calendar; charset=utf-8"
-        response.headers["Content-Disposition"] = "attachment; filename=jobsift_interviews.ics"
-        response.headers["Cache-Control"] = "no-cache"
-        
-        return Response(content=ics_content, media_type="text/calendar")
+        # Cached with its compressed encodings until the next interview write
+        feed = cached_body(
+            ("ics", current_user.id, days_ahead),
+            current_user.data_version,
+            lambda: calendar_service.generate_ics_feed(current_user, days_ahead).encode(),
+            media_type="text/calendar; charset=utf-8"
+        )
+        return feed.response(request, headers={
+            "Content-Disposition": "attachment; filename=jobsift_interviews.ics",
+            "Cache-Control": "no-cache"
+        })
     
     except Exception as e:
         raise HTTPException(
@@ -65,6 +87,35 @@ async def export_ics_feed(
             detail=f"Failed to generate ICS feed: {str(e)}"
         )
 
+@router.post("/ics/import")
+def import_ics_file(
+    file: UploadFile = File(..., description="iCalendar (.ics) file"),
+    only_interviews: bool = Query(True, description="Only import events that look like interviews"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> Dict[str, int]:
+    """Import interviews from an ICS calendar export"""
+    if file.size is not None and file.size > settings.ICS_IMPORT_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="ICS file is too large"
+        )
+    
+    calendar_service = CalendarService(db)
+    
+    try:
+        return calendar_service.import_ics(current_user, file.file, only_interviews)
+    except IcsTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid ICS file: {str(e)}"
+        )
+
 @router.get("/events")
 async def get_calendar_events(
     days_ahead: int = Query(30, ge=1, le=365, description="Number of days ahead to include"),
@@ -115,6 +166,23 @@ async def delete_calendar_event(
     
     return {"message": "Calendar event deleted successfully"}
 
+@router.get("/conflicts", response_model=ScheduleConflictsResponse)
+async def get_schedule_conflicts(
+    days_ahead: int = Query(30, ge=1, le=365, description="Number of days ahead to check"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get overlapping interviews and calendar events"""
+    calendar_service = CalendarService(db)
+    
+    conflicts = calendar_service.get_schedule_conflicts(current_user, days_ahead)
+    
+    return {
+        "conflicts": conflicts,
+        "total": len(conflicts),
+        "days_ahead": days_ahead
+    }
+
 @router.get("/integration-status")
 async def get_calendar_integration_status(
     current_user: User = Depends(get_current_user),
@@ -182,7 +250,9 @@ async def calendar_health_check():
         "status": "healthy",
         "features": {
             "ics_export": "available",
+            "ics_import": "available",
             "google_sync": "mock_available",
+            "background_sync": "available",
             "microsoft_sync": "planned"
         }
     }
@@ -1,25 +1,124 @@
-from fastapi import APIRouter, Depends
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+from uuid import UUID
 from sqlalchemy.orm import Session
 
+from app.core.compression import cached_body
+from app.core.config import settings
 from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.core.events import broker
+from app.api.deps import DBSessionRoute, get_current_user, run_db
 from app.models.user import User
-from app.schemas.dashboard import DashboardSummary
+from app.schemas.dashboard import DashboardSummary, DashboardAnalytics, Funnel, Heatmap
 from app.services.dashboard import DashboardService
+from app.services.funnel import FunnelService
 
-router = APIRouter()
+router = APIRouter(route_class=DBSessionRoute)
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+def _live_snapshot(db: Session, user_id: UUID, topics: Iterable[str]) -> Dict[str, Any]:
+    try:
+        # Reloaded for the current data_version
+        user = db.get(User, user_id)
+        return DashboardService(db).get_live_snapshot(user, topics) if user else {}
+    finally:
+        # Give the connection back while the stream idles
+        db.close()
+
+async def dashboard_events(db: Session, user_id: UUID) -> AsyncIterator[str]:
+    """A full snapshot, then only the changed keys after each write, with heartbeats in between"""
+    # Subscribed before the first snapshot so no write falls in between
+    subscription = broker.subscribe(user_id)
+    try:
+        snapshot = await run_in_threadpool(_live_snapshot, db, user_id, ("interviews", "calendar"))
+        yield f"retry: {settings.DASHBOARD_STREAM_RETRY_MILLISECONDS}\n" + _sse("snapshot", snapshot)
+        while True:
+            changed = await subscription.next(settings.DASHBOARD_STREAM_HEARTBEAT_SECONDS)
+            if not changed:
+                yield ": heartbeat\n\n"
+                continue
+            current = await run_in_threadpool(_live_snapshot, db, user_id, changed)
+            diff = {key: value for key, value in current.items() if snapshot.get(key) != value}
+            if diff:
+                snapshot.update(diff)
+                yield _sse("diff", diff)
+    finally:
+        broker.unsubscribe(subscription)
 
 @router.get("/summary", response_model=DashboardSummary)
 async def get_dashboard_summary(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get dashboard summary with statistics and recent activity"""
     dashboard_service = DashboardService(db)
     
-    summary = dashboard_service.get_dashboard_summary(current_user)
+    # Cached with its compressed encodings until the next write; built off
+    # the event loop, so a client that disconnects cancels its queries
+    summary = await run_db(
+        db,
+        cached_body,
+        ("dashboard_summary", current_user.id),
+        current_user.data_version,
+        lambda: DashboardSummary(**dashboard_service.get_dashboard_summary(current_user)).model_dump_json().encode(),
+        media_type="application/json"
+    )
+    return summary.response(request)
+
+@router.get("/stream")
+async def stream_dashboard(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Server-Sent Events: the dashboard, then diffs as interviews or calendar events change"""
+    return StreamingResponse(
+        dashboard_events(db, current_user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/analytics", response_model=DashboardAnalytics)
+async def get_dashboard_analytics(
+    months: int = Query(12, ge=1, le=36, description="Number of months of trends"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get dashboard summary with monthly trends and company analytics"""
+    dashboard_service = DashboardService(db)
     
-    return summary
+    return {
+        "summary": dashboard_service.get_dashboard_summary(current_user),
+        "analytics": dashboard_service.get_analytics(current_user, months)
+    }
+
+@router.get("/funnel", response_model=Funnel)
+async def get_dashboard_funnel(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get stage-to-stage conversion and median days per stage"""
+    return FunnelService(db).get_funnel(current_user)
+
+@router.get("/heatmap", response_model=Heatmap)
+async def get_dashboard_heatmap(
+    tz: Optional[str] = Query(None, description="IANA timezone; defaults to the user's"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get applications and positive status changes by weekday and hour"""
+    try:
+        return DashboardService(db).get_heatmap(current_user, tz)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 @router.get("/stats")
 async def get_detailed_stats(
@@ -5,19 +5,49 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import DBSessionRoute, get_current_user, run_db
+from app.api.idempotency import IdempotencyGuard, idempotency
+from app.models.interview import ApplicationStatus
 from app.models.user import User
 from app.schemas.interview import (
+    Board,
+    BoardColumn,
+    CompanySuggestion,
+    DuplicateCandidate,
+    DuplicateGroup,
     Interview,
+    InterviewChanges,
     InterviewCreate,
+    InterviewMove,
+    InterviewTagsResult,
+    InterviewTagsUpdate,
     InterviewUpdate,
+    InterviewWithConflicts,
     InterviewsResponse,
+    SavedView,
+    SavedViewCreate,
+    SavedViewPage,
+    SavedViewUpdate,
+    SalaryBenchmark,
     DEFAULT_INTERVIEW_METADATA,
     InterviewMetadata
 )
+from app.schemas.calendar import ScheduleItem
 from app.services.interview import InterviewService
+from app.services.saved_view import SavedViewService
+from app.utils.tags import parse_tags
 
-router = APIRouter()
+router = APIRouter(route_class=DBSessionRoute)
+
+def _with_conflicts(
+    interview_service: InterviewService, user: User, interview
+) -> InterviewWithConflicts:
+    response = InterviewWithConflicts.model_validate(interview)
+    response.conflicts = [
+        ScheduleItem(**conflict._asdict())
+        for conflict in interview_service.get_schedule_conflicts(user, interview)
+    ]
+    return response
 
 @router.get("/metadata", response_model=InterviewMetadata)
 async def get_interview_metadata():
@@ -26,44 +56,86 @@ async def get_interview_metadata():
 
 @router.get("", response_model=InterviewsResponse)
 async def get_interviews(
-    status: Optional[str] = Query(None, description="Filter by application status"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by application status"),
     company: Optional[str] = Query(None, description="Filter by company name"),
     from_date: Optional[date] = Query(None, description="Filter interviews created from this date"),
     to_date: Optional[date] = Query(None, description="Filter interviews created until this date"),
     skip: int = Query(0, ge=0, description="Number of interviews to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of interviews to return"),
+    tags_any: Optional[str] = Query(None, description="Comma-separated tags; interviews with any of them"),
+    tags_all: Optional[str] = Query(None, description="Comma-separated tags; interviews with all of them"),
+    facets: Optional[str] = Query(
+        None, description="Comma-separated facets (status, work_mode, currency, language, location, tags) or 'all'"
+    ),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's interviews with optional filtering"""
     interview_service = InterviewService(db)
     
-    interviews = interview_service.get_user_interviews(
-        user=current_user,
-        status=status,
-        company=company,
-        from_date=from_date,
-        to_date=to_date,
-        skip=skip,
-        limit=limit
-    )
+    try:
+        any_tags, all_tags = parse_tags(tags_any), parse_tags(tags_all)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
-    total = interview_service.count_user_interviews(current_user)
+    def load():
+        interviews = interview_service.get_user_interviews(
+            user=current_user,
+            status=status_filter,
+            company=company,
+            from_date=from_date,
+            to_date=to_date,
+            tags_any=any_tags,
+            tags_all=all_tags,
+            skip=skip,
+            limit=limit
+        )
+        total = interview_service.count_user_interviews(current_user)
+        
+        facet_counts = None
+        if facets:
+            facet_counts = interview_service.get_interview_facets(
+                user=current_user,
+                facets=facets,
+                status=status_filter,
+                company=company,
+                from_date=from_date,
+                to_date=to_date,
+                tags_any=any_tags,
+                tags_all=all_tags
+            )
+        return interviews, total, facet_counts
+    
+    # Off the event loop, so a client that gives up on a large page cancels its query
+    try:
+        interviews, total, facet_counts = await run_db(db, load)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     return InterviewsResponse(
         interviews=interviews,
         total=total,
         skip=skip,
-        limit=limit
+        limit=limit,
+        facets=facet_counts
     )
 
-@router.post("", response_model=Interview, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=InterviewWithConflicts, status_code=status.HTTP_201_CREATED)
 async def create_interview(
     interview_data: InterviewCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    idempotency_guard: IdempotencyGuard = Depends(idempotency)
 ):
-    """Create a new interview"""
+    """Create a new interview; retries with the same Idempotency-Key replay the first response"""
+    if idempotency_guard.replay:
+        return idempotency_guard.replay
     interview_service = InterviewService(db)
     
     interview = interview_service.create_interview(
@@ -71,7 +143,154 @@ async def create_interview(
         interview_data=interview_data
     )
     
-    return interview
+    response = _with_conflicts(interview_service, current_user, interview)
+    response.duplicates = [
+        DuplicateCandidate(**match)
+        for match in interview_service.find_duplicates(
+            current_user, interview.company_name, interview.role_title, exclude_id=interview.id
+        )
+    ]
+    return idempotency_guard.respond(response, status.HTTP_201_CREATED)
+
+@router.post("/tags", response_model=InterviewTagsResult)
+async def update_interview_tags(
+    tags_update: InterviewTagsUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Add and remove tags on many interviews at once"""
+    interview_service = InterviewService(db)
+    updated = interview_service.update_tags(
+        current_user, tags_update.interview_ids, tags_update.add, tags_update.remove
+    )
+    return InterviewTagsResult(updated=updated)
+
+@router.get("/board", response_model=Board)
+async def get_board(
+    per_column: int = Query(20, ge=1, le=100, description="Cards per status column"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the pipeline board: first cards and total of every status column"""
+    interview_service = InterviewService(db)
+    return interview_service.get_board(current_user, per_column)
+
+@router.get("/board/{column}", response_model=BoardColumn)
+async def get_board_column(
+    column: ApplicationStatus,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(20, ge=1, le=100, description="Cards to return"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Load more cards for one board column"""
+    interview_service = InterviewService(db)
+    try:
+        return interview_service.get_board_column(current_user, column, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/changes", response_model=InterviewChanges)
+async def get_interview_changes(
+    since: Optional[str] = Query(None, description="cursor from the previous response; omit for a full sync"),
+    limit: int = Query(100, ge=1, le=500, description="Changes to return"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Interviews created, updated or deleted since the cursor"""
+    interview_service = InterviewService(db)
+    try:
+        return interview_service.get_changes(current_user, since, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/companies/suggest", response_model=List[CompanySuggestion])
+async def suggest_companies(
+    q: str = Query(..., min_length=1, max_length=100, description="Company name prefix"),
+    limit: int = Query(10, ge=1, le=50, description="Suggestions to return"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Autocomplete company names from the user's own interviews"""
+    interview_service = InterviewService(db)
+    return interview_service.suggest_companies(current_user, q, limit)
+
+@router.get("/duplicates", response_model=List[DuplicateGroup])
+async def get_duplicate_interviews(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Groups of interviews that look like the same application"""
+    interview_service = InterviewService(db)
+    return interview_service.get_duplicate_groups(current_user)
+
+@router.get("/views", response_model=List[SavedView])
+async def get_saved_views(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """List saved views with their current counts"""
+    return SavedViewService(db).list_views(current_user)
+
+@router.post("/views", response_model=SavedView, status_code=status.HTTP_201_CREATED)
+async def create_saved_view(
+    view_data: SavedViewCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Save a named interview filter"""
+    return SavedViewService(db).create_view(current_user, view_data)
+
+@router.get("/views/{view_id}", response_model=SavedViewPage)
+async def get_saved_view(
+    view_id: UUID,
+    limit: int = Query(50, ge=1, le=100, description="Interviews to return"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get a saved view with its first page of interviews"""
+    page = SavedViewService(db).get_view_page(current_user, view_id, limit)
+    if not page:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Saved view not found"
+        )
+    return page
+
+@router.put("/views/{view_id}", response_model=SavedView)
+async def update_saved_view(
+    view_id: UUID,
+    view_data: SavedViewUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Rename a saved view or change its filters"""
+    view = SavedViewService(db).update_view(current_user, view_id, view_data)
+    if not view:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Saved view not found"
+        )
+    return view
+
+@router.delete("/views/{view_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_saved_view(
+    view_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete a saved view"""
+    if not SavedViewService(db).delete_view(current_user, view_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Saved view not found"
+        )
 
 @router.get("/{interview_id}", response_model=Interview)
 async def get_interview(
@@ -95,7 +314,7 @@ async def get_interview(
     
     return interview
 
-@router.put("/{interview_id}", response_model=Interview)
+@router.put("/{interview_id}", response_model=InterviewWithConflicts)
 async def update_interview(
     interview_id: UUID,
     interview_data: InterviewUpdate,
@@ -111,6 +330,37 @@ async def update_interview(
         interview_data=interview_data
     )
     
+    if not interview:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Interview not found"
+        )
+    
+    return _with_conflicts(interview_service, current_user, interview)
+
+@router.post("/{interview_id}/move", response_model=Interview)
+async def move_interview(
+    interview_id: UUID,
+    move: InterviewMove,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Move a board card between two neighbours, optionally to another column"""
+    interview_service = InterviewService(db)
+    try:
+        interview = interview_service.move_interview(
+            user=current_user,
+            interview_id=interview_id,
+            status=move.application_status,
+            before_id=move.before_id,
+            after_id=move.after_id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
     if not interview:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -168,3 +418,38 @@ async def get_interview_stats(
         "has_contact_info": interview.contact_email is not None or interview.contact_phone is not None,
         "has_interview_date": interview.interview_date is not None
     }
+
+@router.get("/{interview_id}/salary-benchmark", response_model=SalaryBenchmark)
+async def get_salary_benchmark(
+    interview_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Compare the interview's salary range with platform-wide percentiles"""
+    interview_service = InterviewService(db)
+    
+    interview = interview_service.get_interview_by_id(
+        user=current_user,
+        interview_id=interview_id
+    )
+    
+    if not interview:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Interview not found"
+        )
+    
+    try:
+        benchmark = interview_service.get_salary_benchmark(current_user, interview)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    if not benchmark:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No salary benchmark available for this role yet"
+        )
+    
+    return benchmark
\ No newline at end of file
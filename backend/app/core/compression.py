@@ -0,0 +1,193 @@
+"""
+App-level response compression (gzip, and brotli when installed).
+
+CompressionMiddleware compresses complete responses of compressible types
+above COMPRESSION_MIN_BYTES; streamed responses (SSE) and bodies that are
+already encoded pass through untouched. Hot cached responses are stored as
+PrecompressedBody, which keeps each encoding next to the cache entry, so
+they are compressed once per cache entry rather than once per request.
+"""
+
+import gzip
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import cache
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+# Sent as a stream; must reach the client unbuffered
+STREAMED_TYPES = ("text/event-stream",)
+
+class CompressionStats:
+    """Per-encoding totals: CPU spent compressing vs bytes saved"""
+
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, float]] = {}
+        self._lock = Lock()
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int, cpu_seconds: float) -> None:
+        with self._lock:
+            totals = self._totals.setdefault(
+                encoding, {"compressions": 0, "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0}
+            )
+            totals["compressions"] += 1
+            totals["bytes_in"] += bytes_in
+            totals["bytes_out"] += bytes_out
+            totals["cpu_seconds"] += cpu_seconds
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            report = {}
+            for encoding, totals in self._totals.items():
+                saved = totals["bytes_in"] - totals["bytes_out"]
+                cpu_ms = totals["cpu_seconds"] * 1000
+                report[encoding] = {
+                    "compressions": totals["compressions"],
+                    "bytes_in": totals["bytes_in"],
+                    "bytes_out": totals["bytes_out"],
+                    "bytes_saved": saved,
+                    "ratio": round(totals["bytes_in"] / totals["bytes_out"], 2) if totals["bytes_out"] else None,
+                    "cpu_ms": round(cpu_ms, 3),
+                    "bytes_saved_per_cpu_ms": round(saved / cpu_ms) if cpu_ms else None,
+                }
+            return report
+
+    def clear(self) -> None:
+        with self._lock:
+            self._totals.clear()
+
+stats = CompressionStats()
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """Best encoding the client accepts: br, then gzip; None for identity"""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding.strip())
+    if brotli is not None and ("br" in accepted or "*" in accepted):
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+def compress(body: bytes, encoding: str) -> bytes:
+    started = time.thread_time()
+    if encoding == "br":
+        compressed = brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+    stats.record(encoding, len(body), len(compressed), time.thread_time() - started)
+    return compressed
+
+def _compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_TYPES) and not content_type.startswith(STREAMED_TYPES)
+
+class PrecompressedBody:
+    """A cacheable response body plus each encoding, compressed on first request"""
+
+    __slots__ = ("body", "media_type", "_encoded", "_lock")
+
+    def __init__(self, body: bytes, media_type: str):
+        self.body = body
+        self.media_type = media_type
+        self._encoded: Dict[str, bytes] = {}
+        self._lock = Lock()
+
+    def encoded(self, encoding: str) -> bytes:
+        with self._lock:
+            if encoding not in self._encoded:
+                self._encoded[encoding] = compress(self.body, encoding)
+            return self._encoded[encoding]
+
+    def response(self, request: Request, headers: Optional[Dict[str, str]] = None) -> Response:
+        """The body in the best encoding the request accepts; the middleware leaves it alone"""
+        headers = {**(headers or {}), "Vary": "Accept-Encoding"}
+        encoding = negotiate(request.headers.get("accept-encoding", ""))
+        if encoding is None or len(self.body) < settings.COMPRESSION_MIN_BYTES:
+            return Response(content=self.body, media_type=self.media_type, headers=headers)
+        headers["Content-Encoding"] = encoding
+        return Response(content=self.encoded(encoding), media_type=self.media_type, headers=headers)
+
+def cached_body(
+    key: Hashable, version: int, render: Callable[[], bytes], media_type: str
+) -> PrecompressedBody:
+    """
+    Body cached under ``key`` until the user's data_version moves or the
+    RESPONSE_CACHE_SECONDS window rolls over (for bodies relative to now).
+    Bodies over RESPONSE_CACHE_MAX_BYTES are rendered but not kept.
+    """
+    key = (key, int(time.time() // settings.RESPONSE_CACHE_SECONDS))
+    body = cache.get(key, version)
+    if body is None:
+        body = PrecompressedBody(render(), media_type)
+        if len(body.body) <= settings.RESPONSE_CACHE_MAX_BYTES:
+            cache.set(key, version, body)
+    return body
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+            elif message["type"] == "http.response.start":
+                # Held until the first body chunk shows whether it's worth it
+                start = message
+            elif message["type"] == "http.response.body":
+                headers = MutableHeaders(raw=start["headers"])
+                body = message.get("body", b"")
+                if (
+                    message.get("more_body", False)
+                    or "content-encoding" in headers
+                    or not _compressible(headers.get("content-type", ""))
+                    or len(body) < settings.COMPRESSION_MIN_BYTES
+                ):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                compressed = compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(compressed))
+                headers.add_vary_header("Accept-Encoding")
+                await send(start)
+                await send({"type": "http.response.body", "body": compressed})
+            else:
+                await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -29,6 +29,82 @@ class Settings(BaseSettings):
     GOOGLE_CLIENT_SECRET: str = ""
     GOOGLE_REDIRECT_URI: str = ""
     
+    # Scheduling
+    DEFAULT_INTERVIEW_DURATION_MINUTES: int = 60
+    
+    # ICS import
+    ICS_IMPORT_MAX_BYTES: int = 64 * 1024 * 1024
+    ICS_IMPORT_BATCH_SIZE: int = 500
+    
+    # Analytics rollups
+    ROLLUP_COMPACTION_GRACE_DAYS: int = 1
+    
+    # Salary benchmarks (memory ~ MAX_BUCKETS x BINS x 4 bytes + one chunk)
+    SALARY_BENCHMARK_CHUNK_SIZE: int = 50000
+    SALARY_BENCHMARK_BINS: int = 1024
+    SALARY_BENCHMARK_MAX_BUCKETS: int = 20000
+    SALARY_BENCHMARK_MIN_SAMPLES: int = 5
+    
+    # Cohort funnel benchmarks
+    COHORT_BENCHMARK_CHUNK_SIZE: int = 50000
+    COHORT_BENCHMARK_TRAILING_WEEKS: int = 12
+    COHORT_BENCHMARK_MIN_USERS: int = 5
+    
+    # Board ordering: columns whose rank keys outgrow this are respaced
+    BOARD_RANK_MAX_LENGTH: int = 48
+    
+    # Company autocomplete: users with more distinct companies use the DB index
+    COMPANY_TRIE_MAX_NAMES: int = 20000
+    
+    # Duplicate detection: role trigram similarity at the same company
+    DUPLICATE_SIMILARITY_THRESHOLD: float = 0.6
+    
+    # Per-user result cache (entries, in-process)
+    CACHE_MAX_ENTRIES: int = 10000
+    
+    # Live dashboard (SSE): comment line sent on idle connections so proxies keep them open
+    DASHBOARD_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    DASHBOARD_STREAM_RETRY_MILLISECONDS: int = 5000
+    
+    # POST /batch: sub-requests per call
+    BATCH_MAX_REQUESTS: int = 20
+    
+    # Idempotency-Key: how long responses are replayed, and how long a claim
+    # blocks duplicates before a crashed request's key can be taken over
+    IDEMPOTENCY_KEY_TTL_HOURS: int = 24
+    IDEMPOTENCY_LOCK_SECONDS: int = 60
+    
+    # Response compression (gzip; brotli when installed)
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    
+    # Cached responses relative to now (dashboard summary, ICS feed) live this
+    # long or until the next write; larger bodies are not kept
+    RESPONSE_CACHE_SECONDS: int = 60
+    RESPONSE_CACHE_MAX_BYTES: int = 1024 * 1024
+    
+    # Database time budget per route, "METHOD /path" as declared -> ms (a
+    # statement_timeout on PostgreSQL); routes not listed run unbounded
+    ROUTE_TIME_BUDGETS_MS: Dict[str, int] = {
+        "GET /api/v1/dashboard/summary": 5000,
+        "GET /api/v1/interviews": 5000,
+    }
+    # Requests running their database work off the event loop at once
+    # (app.api.deps.run_db); matches the engine's pool_size
+    DB_THREAD_LIMIT: int = 10
+    
+    # Calendar sync worker
+    CALENDAR_SYNC_BATCH_SIZE: int = 50
+    CALENDAR_SYNC_POLL_INTERVAL_SECONDS: float = 2.0
+    CALENDAR_SYNC_MAX_ATTEMPTS: int = 8
+    CALENDAR_SYNC_BACKOFF_BASE_SECONDS: int = 5
+    # Delta sync re-reads this far behind its cursor: now() is the transaction
+    # start, so a write can commit after the cursor passed its timestamp
+    CALENDAR_SYNC_CURSOR_OVERLAP_SECONDS: int = 300
+    CALENDAR_SYNC_BACKOFF_MAX_SECONDS: int = 3600
+    CALENDAR_SYNC_LOCK_TIMEOUT_SECONDS: int = 300
+    
     # Environment
     ENVIRONMENT: str = "development"
     LOG_LEVEL: str = "INFO"
@@ -1,7 +1,14 @@
+import logging
+from typing import Any, Callable, Optional, Union
+from fastapi import HTTPException, Request, status
 from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
+from app.core.timeouts import BUDGET_KEY, REQUEST_SESSION, interrupt, is_interruption, route_budget_ms
+
+logger = logging.getLogger(__name__)
 
 engine = create_engine(
     settings.DATABASE_URL,
@@ -13,9 +20,98 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+# Scope keys set by POST /batch: its sub-requests share one session and user
+BATCH_SESSION = "batch_session"
+BATCH_USER = "batch_user"
+
+class LazySession:
+    """
+    Stands in for a request's Session and builds it on first use, so
+    requests answered without the database (cache hits, replays) never
+    create one. The Session itself checks out a connection only when its
+    first statement runs.
+    """
+
+    __slots__ = ("_factory", "_session", "time_budget_ms", "cancelled", "shared")
+
+    def __init__(self, factory: Callable[[], Session] = SessionLocal, time_budget_ms: int = 0):
+        self._factory = factory
+        self._session: Optional[Session] = None
+        self.time_budget_ms = time_budget_ms
+        self.cancelled = False
+        # Set by POST /batch, whose sub-requests all use this session
+        self.shared = False
+
+    def __getattr__(self, name: str) -> Any:
+        if self._session is None:
+            self._session = self._factory()
+            if self.time_budget_ms:
+                self._session.info[BUDGET_KEY] = self.time_budget_ms
+        return getattr(self._session, name)
+
+    @property
+    def session(self) -> Optional[Session]:
+        return self._session
+
+    def cancel(self) -> None:
+        """Stop the running statement; called from the event loop when the client disconnects"""
+        self.cancelled = True
+        if self._session is not None:
+            interrupt(self._session)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+def release_connection(db: Union[Session, LazySession]) -> None:
+    """
+    End a transaction that has nothing left to write, returning its
+    connection to the pool. Loaded objects are not expired, so the response
+    can still be serialized from them; anything lazy-loaded later opens a
+    new short transaction.
+    """
+    session = db.session if isinstance(db, LazySession) else db
+    if session is None or not session.in_transaction() or session.new or session.dirty or session.deleted:
+        return
+    expire_on_commit = session.expire_on_commit
+    session.expire_on_commit = False
     try:
-        yield db
+        session.commit()
     finally:
-        db.close()
\ No newline at end of file
+        session.expire_on_commit = expire_on_commit
+
+def session_dependency(factory: Callable[[], Session]) -> Callable[[Request], Any]:
+    """
+    The get_db dependency for sessions from ``factory``. A query stopped by
+    the route's time budget or by the client disconnecting answers 503, and
+    is logged with the route it belongs to.
+    """
+    def get_db(request: Request):
+        shared = request.scope.get(BATCH_SESSION)
+        if shared is not None:
+            # Owned and closed by the batch request
+            yield shared
+            return
+        route = request.scope.get("route")
+        budget_ms = route_budget_ms(route.methods, route.path_format) if route is not None else 0
+        db = LazySession(factory, budget_ms)
+        request.scope[REQUEST_SESSION] = db
+        try:
+            yield db
+        except OperationalError as e:
+            if not is_interruption(e):
+                raise
+            name = f"{route.path_format} ({route.name})" if route is not None else request.url.path
+            if db.cancelled:
+                logger.info("Cancelled %s %s: client disconnected", request.method, name)
+            else:
+                logger.warning("%s %s exceeded its %d ms database budget", request.method, name, budget_ms)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Request took too long"
+            )
+        finally:
+            db.close()
+    return get_db
+
+get_db = session_dependency(SessionLocal)
@@ -0,0 +1,155 @@
+"""
+Per-user change notifications for live views (GET /dashboard/stream).
+
+Writers call publish() inside their transaction. On PostgreSQL that is a
+pg_notify, which every API worker's listener receives only once the
+transaction commits; on other databases (SQLite in development and tests)
+the message waits on the session and reaches this process's broker after
+commit. Either way a rolled-back write never notifies anyone.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "jobsift_user_changes"
+_PENDING_KEY = "pending_user_events"
+
+class Subscription:
+    """
+    One live connection. Messages coalesce into the latest version per
+    topic, so an idle or slow client holds one small dict however many
+    writes happen; there is no queue to grow.
+    """
+
+    __slots__ = ("user_id", "_loop", "_pending", "_wakeup")
+
+    def __init__(self, user_id: UUID):
+        self.user_id = user_id
+        self._loop = asyncio.get_running_loop()
+        self._pending: Dict[str, int] = {}
+        self._wakeup = asyncio.Event()
+
+    def _deliver(self, topic: str, version: int) -> None:
+        self._pending[topic] = max(version, self._pending.get(topic, 0))
+        self._wakeup.set()
+
+    async def next(self, timeout: float) -> Dict[str, int]:
+        """Topics changed since the last call (topic -> version); empty after ``timeout`` seconds"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            return {}
+        self._wakeup.clear()
+        pending, self._pending = self._pending, {}
+        return pending
+
+class EventBroker:
+    """In-process fan-out from user id to that user's open subscriptions"""
+
+    def __init__(self):
+        self._subscribers: Dict[UUID, Set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, user_id: UUID) -> Subscription:
+        subscription = Subscription(user_id)
+        self._subscribers[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.user_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.user_id]
+
+    def deliver(self, user_id: UUID, topic: str, version: int = 0) -> None:
+        """Hand a message to local subscribers; safe to call from any thread"""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for subscription in list(self._subscribers.get(user_id, ())):
+            if subscription._loop is running:
+                subscription._deliver(topic, version)
+            elif not subscription._loop.is_closed():
+                subscription._loop.call_soon_threadsafe(subscription._deliver, topic, version)
+
+broker = EventBroker()
+
+def publish(db: Session, user_id: UUID, topic: str, version: int = 0) -> None:
+    """Notify ``user_id``'s live views about ``topic`` when ``db``'s transaction commits"""
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_notify(CHANNEL, f"{user_id}:{topic}:{version}")))
+    else:
+        db.info.setdefault(_PENDING_KEY, []).append((user_id, topic, version))
+
+@event.listens_for(Session, "after_commit")
+def _deliver_pending(session: Session) -> None:
+    for message in session.info.pop(_PENDING_KEY, ()):
+        broker.deliver(*message)
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+class PostgresListener:
+    """
+    LISTENs on CHANNEL over one dedicated connection and feeds the broker.
+    Driven by the event loop's reader callback, so it needs no thread; a
+    lost connection is retried every ``retry_seconds``.
+    """
+
+    def __init__(self, engine: Engine, retry_seconds: float = 5.0):
+        self.dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        self.retry_seconds = retry_seconds
+        self._conn = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        import psycopg2
+        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+        self._loop = asyncio.get_running_loop()
+        try:
+            self._conn = psycopg2.connect(self.dsn)
+            self._conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with self._conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+        except psycopg2.Error as e:
+            logger.warning("Event listener could not connect, retrying in %ss: %s", self.retry_seconds, e)
+            self._conn = None
+            self._loop.call_later(self.retry_seconds, self.start)
+            return
+        self._loop.add_reader(self._conn.fileno(), self._on_readable)
+
+    def stop(self) -> None:
+        if self._conn is not None:
+            self._loop.remove_reader(self._conn.fileno())
+            self._conn.close()
+            self._conn = None
+
+    def _on_readable(self) -> None:
+        import psycopg2
+
+        try:
+            self._conn.poll()
+        except psycopg2.Error as e:
+            logger.warning("Event listener connection lost, reconnecting: %s", e)
+            self.stop()
+            self._loop.call_later(self.retry_seconds, self.start)
+            return
+        while self._conn.notifies:
+            notify = self._conn.notifies.pop(0)
+            try:
+                user_id, topic, version = notify.payload.split(":")
+                broker.deliver(UUID(user_id), topic, int(version))
+            except ValueError:
+                logger.warning("Ignoring malformed event %r", notify.payload)
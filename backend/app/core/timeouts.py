@@ -0,0 +1,119 @@
+"""
+Per-route database time budgets, and cancelling a request's query when its
+client goes away.
+
+A route's budget (ROUTE_TIME_BUDGETS_MS) is stored on its request's session
+and applied to every transaction that session begins: on PostgreSQL as
+SET LOCAL statement_timeout, on SQLite, which has no statement timeout, as a
+progress handler that interrupts the transaction's statements once the
+budget has run out. interrupt() stops whatever statement is running now;
+DisconnectMiddleware calls it when the client disconnects mid-request.
+"""
+
+import asyncio
+import time
+from typing import Any, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# Scope key for the request's session, so the middleware can reach it
+REQUEST_SESSION = "request_session"
+
+BUDGET_KEY = "time_budget_ms"
+_CONNECTION_KEY = "dbapi_connection"
+# PostgreSQL query_canceled: statement_timeout or pg_cancel_backend
+_PG_QUERY_CANCELED = "57014"
+
+def route_budget_ms(methods: Iterable[str], path: str) -> int:
+    """Budget configured for ``"METHOD /path"`` (as declared, prefix included); 0 = none"""
+    for method in methods:
+        budget = settings.ROUTE_TIME_BUDGETS_MS.get(f"{method} {path}")
+        if budget:
+            return budget
+    return 0
+
+def interrupt(session: Session) -> None:
+    """Cancel the statement ``session`` is running, if any; safe to call from any thread"""
+    connection = session.info.get(_CONNECTION_KEY)
+    if connection is None:
+        return
+    if hasattr(connection, "cancel"):  # psycopg2
+        connection.cancel()
+    elif hasattr(connection, "interrupt"):  # sqlite3
+        connection.interrupt()
+
+def is_interruption(error: Exception) -> bool:
+    """Whether ``error`` is a statement stopped by its budget or by interrupt()"""
+    if not isinstance(error, OperationalError):
+        return False
+    return getattr(error.orig, "pgcode", None) == _PG_QUERY_CANCELED or "interrupted" in str(error.orig)
+
+@event.listens_for(Session, "after_begin")
+def _apply_budget(session: Session, transaction: Any, connection: Any) -> None:
+    dbapi_connection = connection.connection.dbapi_connection
+    session.info[_CONNECTION_KEY] = dbapi_connection
+    budget_ms = session.info.get(BUDGET_KEY)
+    if not budget_ms:
+        return
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(budget_ms)}")
+    elif connection.dialect.name == "sqlite":
+        deadline = time.monotonic() + budget_ms / 1000
+        dbapi_connection.set_progress_handler(lambda: time.monotonic() > deadline, 1000)
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_budget(session: Session, transaction: Any) -> None:
+    if transaction.parent is not None:
+        return
+    dbapi_connection = session.info.pop(_CONNECTION_KEY, None)
+    # The connection goes back to the pool; the next checkout has its own budget
+    if dbapi_connection is not None and session.info.get(BUDGET_KEY) and hasattr(dbapi_connection, "set_progress_handler"):
+        dbapi_connection.set_progress_handler(None, 0)
+
+class DisconnectMiddleware:
+    """
+    Watches each request's receive channel for http.disconnect and, when the
+    client leaves before its response is complete, cancels the request's
+    in-flight query. Handlers only notice if their database work runs off
+    the event loop (see app.api.deps.run_db).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Sub-requests of POST /batch copy a scope that is already watched
+        if scope["type"] != "http" or REQUEST_SESSION in scope:
+            await self.app(scope, receive, send)
+            return
+
+        messages: "asyncio.Queue[Message]" = asyncio.Queue()
+        responded = False
+
+        async def watch() -> None:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    db = scope.get(REQUEST_SESSION)
+                    if not responded and db is not None:
+                        db.cancel()
+                    await messages.put(message)
+                    return
+                await messages.put(message)
+
+        async def send_tracked(message: Message) -> None:
+            nonlocal responded
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                responded = True
+            await send(message)
+
+        watcher = asyncio.create_task(watch())
+        try:
+            await self.app(scope, messages.get, send_tracked)
+        finally:
+            watcher.cancel()
@@ -2,12 +2,16 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
+from app.core.compression import CompressionMiddleware, stats as compression_stats
 from app.core.config import settings
 from app.core.database import engine, Base
+from app.core.events import PostgresListener
+from app.core.timeouts import DisconnectMiddleware
 from app.api.v1.auth import router as auth_router
 from app.api.v1.interviews import router as interviews_router
 from app.api.v1.dashboard import router as dashboard_router
 from app.api.v1.calendar import router as calendar_router
+from app.api.v1.batch import router as batch_router
 
 Base.metadata.create_all(bind=engine)
 
@@ -19,6 +23,8 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+app.add_middleware(DisconnectMiddleware)
+app.add_middleware(CompressionMiddleware)
 app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
 app.add_middleware(
     CORSMiddleware,
@@ -32,11 +38,30 @@ app.include_router(auth_router, prefix=f"{settings.API_V1_STR}/auth", tags=["aut
 app.include_router(interviews_router, prefix=f"{settings.API_V1_STR}/interviews", tags=["interviews"])
 app.include_router(dashboard_router, prefix=f"{settings.API_V1_STR}/dashboard", tags=["dashboard"])
 app.include_router(calendar_router, prefix=f"{settings.API_V1_STR}/calendar", tags=["calendar"])
+app.include_router(batch_router, prefix=f"{settings.API_V1_STR}/batch", tags=["batch"])
+
+# Delivers other workers' writes to this worker's live dashboards
+event_listener = PostgresListener(engine) if engine.dialect.name == "postgresql" else None
+
+@app.on_event("startup")
+async def start_event_listener():
+    if event_listener:
+        event_listener.start()
+
+@app.on_event("shutdown")
+async def stop_event_listener():
+    if event_listener:
+        event_listener.stop()
 
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "message": "JobSift API is running"}
 
+@app.get("/metrics/compression")
+async def compression_metrics():
+    """CPU spent compressing responses vs bytes saved, per encoding, since startup"""
+    return compression_stats.snapshot()
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to JobSift API"}
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -8,9 +8,21 @@ from app.core.database import Base
 
 class CalendarEvent(Base):
     __tablename__ = "calendar_events"
+    __table_args__ = (
+        Index("ix_calendar_events_interview_start_end", "interview_id", "start_time", "end_time"),
+        # Time-window scans of one user's calendar (conflicts, upcoming events)
+        Index("ix_calendar_events_user_start_end", "user_id", "start_time", "end_time"),
+        # Pending pushes only; stays tiny as the sync worker drains it
+        Index(
+            "ix_calendar_events_unsynced", "calendar_provider", "updated_at",
+            postgresql_where=text("is_synced = false")
+        ),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     interview_id = Column(UUID(as_uuid=True), ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False)
+    # The interview's owner, copied so user-scoped queries need no join
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # External calendar integration
     external_event_id = Column(String(255))  # ID from external calendar (Google, etc.)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.core.database import Base
+
+class CalendarSyncCursor(Base):
+    __tablename__ = "calendar_sync_cursors"
+    __table_args__ = (
+        UniqueConstraint("user_id", "calendar_provider", name="uq_calendar_sync_cursors_user_provider"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    calendar_provider = Column(String(50), nullable=False)
+    
+    # Highest change timestamp already pushed to the provider
+    synced_until = Column(DateTime(timezone=True), nullable=False)
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
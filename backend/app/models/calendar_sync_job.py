@@ -0,0 +1,49 @@
+from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Enum, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+import enum
+
+from app.core.database import Base
+
+class SyncJobAction(enum.Enum):
+    UPSERT = "UPSERT"
+    DELETE = "DELETE"
+
+class SyncJobStatus(enum.Enum):
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+# Transactional outbox: rows are written in the same transaction as the change
+# that caused them and drained by the app.workers.calendar_sync process.
+class CalendarSyncJob(Base):
+    __tablename__ = "calendar_sync_jobs"
+    __table_args__ = (
+        Index(
+            "ix_calendar_sync_jobs_claim", "status", "available_at",
+            postgresql_where=text("status IN ('PENDING', 'PROCESSING')")
+        ),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    
+    # Target of the job. No FKs: delete jobs outlive the rows they refer to.
+    interview_id = Column(UUID(as_uuid=True))
+    calendar_event_id = Column(UUID(as_uuid=True))
+    external_event_id = Column(String(255))
+    calendar_provider = Column(String(50), nullable=False)
+    action = Column(Enum(SyncJobAction), nullable=False)
+    
+    # Delivery state
+    status = Column(Enum(SyncJobStatus), nullable=False, default=SyncJobStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    available_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    locked_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
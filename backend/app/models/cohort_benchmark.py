@@ -0,0 +1,30 @@
+from sqlalchemy import Column, String, Integer, Float, Date, DateTime, PrimaryKeyConstraint
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+# Cross-user funnel benchmarks per work mode cohort, written by the cohort
+# job. period is an ISO week ("2026-W42") for weekly cohorts or "trailing"
+# for the rolling window the dashboard compares against; work_mode "ALL"
+# aggregates every mode.
+class CohortBenchmark(Base):
+    __tablename__ = "cohort_benchmarks"
+    __table_args__ = (
+        PrimaryKeyConstraint("work_mode", "period"),
+    )
+    
+    work_mode = Column(String(10), nullable=False)
+    period = Column(String(10), nullable=False)
+    week_start = Column(Date)  # NULL for the trailing window
+    
+    applications = Column(Integer, nullable=False, default=0)
+    users = Column(Integer, nullable=False, default=0)
+    interviews = Column(Integer, nullable=False, default=0)  # Reached an interview stage or offer
+    offers = Column(Integer, nullable=False, default=0)
+    
+    interview_rate = Column(Float, nullable=False, default=0.0)
+    offer_rate = Column(Float, nullable=False, default=0.0)
+    applications_per_user = Column(Float, nullable=False, default=0.0)
+    velocity = Column(Float)  # Week-over-week change in applications per user, %
+    
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
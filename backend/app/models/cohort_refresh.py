@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, Date, DateTime, PrimaryKeyConstraint
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+# Weekly work mode cohorts touched since the cohort job last ran. Writers
+# upsert a row in the same transaction as the interview change; the job
+# recomputes only these cohorts and removes the rows it consumed.
+class CohortRefresh(Base):
+    __tablename__ = "cohort_refresh_queue"
+    __table_args__ = (
+        PrimaryKeyConstraint("work_mode", "week_start"),
+    )
+    
+    work_mode = Column(String(10), nullable=False)
+    week_start = Column(Date, nullable=False)
+    queued_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, String, Integer, Float, Date, DateTime, ForeignKey, Enum, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.core.database import Base
+from app.models.interview import ApplicationStatus
+
+# Per-user, per-day, per-company activity rollup. Writes append small delta
+# rows in the same transaction as the interview change; the nightly compaction
+# job (app.workers.rollups) folds them into one row per key. Readers always
+# aggregate, so results are identical before and after compaction.
+class DailyUserActivity(Base):
+    __tablename__ = "daily_user_activity"
+    __table_args__ = (
+        Index("ix_daily_user_activity_user_day", "user_id", "day"),
+        Index("ix_daily_user_activity_user_company", "user_id", "company_name"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+    company_name = Column(String(100), nullable=False)
+    
+    # Counters (deltas until compacted)
+    applications = Column(Integer, nullable=False, default=0)
+    interviews = Column(Integer, nullable=False, default=0)
+    offers = Column(Integer, nullable=False, default=0)
+    rejections = Column(Integer, nullable=False, default=0)
+    responses = Column(Integer, nullable=False, default=0)
+    response_days_total = Column(Float, nullable=False, default=0.0)
+    
+    # Latest state seen for this key
+    last_status = Column(Enum(ApplicationStatus))
+    last_activity = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, Integer, LargeBinary, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+# A client's Idempotency-Key for a mutating request. While the first request
+# runs, status_code is NULL and locked_until guards it; afterwards the stored
+# response is replayed for retries until expires_at.
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    key = Column(String(255), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)  # sha256 of method, path and body
+    
+    # Stored response
+    status_code = Column(Integer)
+    response_body = Column(LargeBinary)
+    
+    locked_until = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,4 +1,6 @@
-from sqlalchemy import Column, String, Text, Numeric, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Text, Numeric, DateTime, ForeignKey, Enum, Index, BigInteger, Integer
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -22,8 +24,52 @@ class ApplicationStatus(enum.Enum):
     REJECTED = "REJECTED"
     ON_HOLD = "ON_HOLD"
 
+INTERVIEW_STAGES = frozenset({
+    ApplicationStatus.HR_INTERVIEW,
+    ApplicationStatus.TECH_INTERVIEW,
+    ApplicationStatus.MANAGER_INTERVIEW,
+})
+
+# Statuses showing the application got past screening
+REACHED_INTERVIEW = INTERVIEW_STAGES | {ApplicationStatus.OFFER}
+
+# Transitions that move an application forward
+ADVANCING_STATUSES = REACHED_INTERVIEW | {ApplicationStatus.SCREENING}
+
+class utc_quarter_hour(FunctionElement):
+    """
+    15-minute slot since the Unix epoch (slot * 900 = epoch seconds). Immutable,
+    so it can be indexed; every UTC offset in use is a multiple of 15 minutes,
+    so a slot maps to exactly one local weekday and hour in any zone.
+    """
+    type = BigInteger()
+    inherit_cache = True
+    name = "utc_quarter_hour"
+
+@compiles(utc_quarter_hour)
+def _compile_utc_quarter_hour(element, compiler, **kw):
+    value = compiler.process(list(element.clauses)[0], **kw)
+    return f"CAST(FLOOR(EXTRACT(EPOCH FROM timezone('UTC', {value})) / 900) AS BIGINT)"
+
+@compiles(utc_quarter_hour, "sqlite")
+def _compile_utc_quarter_hour_sqlite(element, compiler, **kw):
+    # SQLite stores UTC timestamps as text
+    value = compiler.process(list(element.clauses)[0], **kw)
+    return f"(CAST(strftime('%s', {value}) AS INTEGER) / 900)"
+
 class Interview(Base):
     __tablename__ = "interviews"
+    __table_args__ = (
+        Index("ix_interviews_user_updated_at", "user_id", "updated_at"),
+        Index("ix_interviews_user_interview_date", "user_id", "interview_date"),
+        Index("ix_interviews_user_status_rank", "user_id", "application_status", "board_rank"),
+        Index("ix_interviews_user_change_seq", "user_id", "change_seq", "id"),
+        # Covers the dashboard summary counts (index-only scan)
+        Index(
+            "ix_interviews_user_status_mode",
+            "user_id", "application_status", "work_mode", "created_at", "interview_date"
+        ),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -40,6 +86,7 @@ class Interview(Base):
     # Process info
     application_status = Column(Enum(ApplicationStatus), default=ApplicationStatus.APPLIED)
     next_milestone = Column(String(200))
+    board_rank = Column(String(255), nullable=False)  # Fractional key ordering the card in its board column
     
     # Contact info
     contact_name = Column(String(100))
@@ -60,7 +107,24 @@ class Interview(Base):
     interview_date = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # User data_version of the last write to this row; the change feed cursor
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")
     
     # Relationships
     user = relationship("User", back_populates="interviews")
-    calendar_events = relationship("CalendarEvent", back_populates="interview", cascade="all, delete-orphan")
\ No newline at end of file
+    calendar_events = relationship("CalendarEvent", back_populates="interview", cascade="all, delete-orphan")
+    tag_rows = relationship("InterviewTag", cascade="all, delete-orphan", lazy="selectin", order_by="InterviewTag.tag")
+    
+    @property
+    def tags(self):
+        return [row.tag for row in self.tag_rows]
+
+# Weekday x hour heatmap: grouped by the indexed expression, index-only
+Index("ix_interviews_user_quarter_hour", Interview.user_id, utc_quarter_hour(Interview.created_at))
+# Company autocomplete fallback: LIKE 'prefix%' on the lowered name
+Index(
+    "ix_interviews_user_company_prefix",
+    Interview.user_id,
+    func.lower(Interview.company_name).label("company_lower"),
+    postgresql_ops={"company_lower": "text_pattern_ops"}
+)
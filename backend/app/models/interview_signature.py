@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+# Normalized company/role of each interview for duplicate detection; kept in
+# step with the interview by the service layer (see app.utils.duplicates)
+class InterviewSignature(Base):
+    __tablename__ = "interview_signatures"
+    __table_args__ = (
+        Index("ix_interview_signatures_user_company_role", "user_id", "company_key", "role_key"),
+    )
+    
+    interview_id = Column(UUID(as_uuid=True), ForeignKey("interviews.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    company_key = Column(String(100), nullable=False)
+    role_key = Column(String(100), nullable=False)
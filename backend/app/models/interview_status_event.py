@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Float, DateTime, ForeignKey, Enum, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.core.database import Base
+from app.models.interview import ApplicationStatus, utc_quarter_hour
+
+# Append-only log of application_status changes. Rows are never updated and
+# outlive the interview (no FK) so funnel history survives deletes.
+class InterviewStatusEvent(Base):
+    __tablename__ = "interview_status_events"
+    __table_args__ = (
+        Index("ix_interview_status_events_interview_changed_at", "interview_id", "changed_at"),
+        Index("ix_interview_status_events_user_changed_at", "user_id", "changed_at"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    interview_id = Column(UUID(as_uuid=True), nullable=False)
+    
+    from_status = Column(Enum(ApplicationStatus))  # NULL for the initial status
+    to_status = Column(Enum(ApplicationStatus), nullable=False)
+    days_in_previous = Column(Float)  # Time spent in from_status
+    
+    changed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+Index(
+    "ix_interview_status_events_user_quarter_hour",
+    InterviewStatusEvent.user_id, utc_quarter_hour(InterviewStatusEvent.changed_at)
+)
\ No newline at end of file
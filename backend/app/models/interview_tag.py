@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+# One row per (interview, tag). user_id is denormalized so tag filters and
+# counts stay on ix_interview_tags_user_tag without touching interviews.
+class InterviewTag(Base):
+    __tablename__ = "interview_tags"
+    __table_args__ = (
+        Index("ix_interview_tags_user_tag", "user_id", "tag", "interview_id"),
+    )
+    
+    interview_id = Column(UUID(as_uuid=True), ForeignKey("interviews.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(50), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.core.database import Base
+
+# Interviews are hard-deleted; a tombstone records the deletion so that
+# change feeds (calendar delta sync) can propagate it after the row is gone.
+class InterviewTombstone(Base):
+    __tablename__ = "interview_tombstones"
+    __table_args__ = (
+        Index("ix_interview_tombstones_user_deleted_at", "user_id", "deleted_at"),
+        Index("ix_interview_tombstones_user_change_seq", "user_id", "change_seq", "interview_id"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    interview_id = Column(UUID(as_uuid=True), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, Integer, Float, DateTime, PrimaryKeyConstraint
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+# Platform-wide salary percentiles (USD) per normalized role and location,
+# rebuilt by the salary benchmark batch job. location_key "*" is role-wide.
+class SalaryBenchmark(Base):
+    __tablename__ = "salary_benchmarks"
+    __table_args__ = (
+        PrimaryKeyConstraint("role_key", "location_key"),
+    )
+    
+    role_key = Column(String(100), nullable=False)
+    location_key = Column(String(100), nullable=False)
+    sample_size = Column(Integer, nullable=False)  # Distinct users, not salaries
+    
+    p25 = Column(Float, nullable=False)
+    p50 = Column(Float, nullable=False)
+    p75 = Column(Float, nullable=False)
+    p90 = Column(Float, nullable=False)
+    
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
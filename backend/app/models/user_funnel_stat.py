@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+# Incrementally maintained funnel aggregate: how many interviews moved
+# from_status -> to_status for a user, bucketed by days spent in from_status.
+# Entering the funnel is recorded with from_status = "NEW".
+class UserFunnelStat(Base):
+    __tablename__ = "user_funnel_stats"
+    __table_args__ = (
+        PrimaryKeyConstraint("user_id", "from_status", "to_status", "duration_bucket"),
+    )
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    from_status = Column(String(20), nullable=False)
+    to_status = Column(String(20), nullable=False)
+    duration_bucket = Column(Integer, nullable=False)  # Index into DURATION_BUCKET_BOUNDS
+    transitions = Column(Integer, nullable=False, default=0)
+    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -54,3 +54,11 @@ class BaseRepository(Generic[T]):
 
     def count(self) -> int:
         return self.db.query(self.model).count()
+
+    def _upsert_insert(self, model: Optional[Any] = None):
+        """Dialect insert() supporting on_conflict_do_update (Postgres, SQLite)"""
+        if self.db.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        return insert(model if model is not None else self.model)
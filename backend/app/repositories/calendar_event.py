@@ -1,10 +1,14 @@
-from typing import Optional, List
+from typing import Optional, List, Any, Dict, Set
 from sqlalchemy.orm import Session
+from sqlalchemy import exists, insert
+from sqlalchemy.sql import func
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from app.models.calendar_event import CalendarEvent
+from app.models.interview import Interview
 from app.repositories.base import BaseRepository
+from app.utils.intervals import ScheduleInterval
 
 class CalendarEventRepository(BaseRepository[CalendarEvent]):
     def __init__(self, db: Session):
@@ -28,17 +32,63 @@ class CalendarEventRepository(BaseRepository[CalendarEvent]):
             .first()
         )
 
+    def get_by_interview_and_provider(self, interview_id: UUID, provider: str) -> Optional[CalendarEvent]:
+        return (
+            self.db.query(CalendarEvent)
+            .filter(
+                CalendarEvent.interview_id == interview_id,
+                CalendarEvent.calendar_provider == provider
+            )
+            .first()
+        )
+
+    def get_by_interview_ids_and_provider(
+        self, interview_ids: List[UUID], provider: str
+    ) -> List[CalendarEvent]:
+        if not interview_ids:
+            return []
+        return (
+            self.db.query(CalendarEvent)
+            .filter(
+                CalendarEvent.interview_id.in_(interview_ids),
+                CalendarEvent.calendar_provider == provider
+            )
+            .all()
+        )
+
+    def get_by_ids(self, event_ids: List[UUID]) -> List[CalendarEvent]:
+        if not event_ids:
+            return []
+        return self.db.query(CalendarEvent).filter(CalendarEvent.id.in_(event_ids)).all()
+
+    def get_existing_external_ids(
+        self, user_id: UUID, provider: str, external_event_ids: List[str]
+    ) -> Set[str]:
+        if not external_event_ids:
+            return set()
+        rows = (
+            self.db.query(CalendarEvent.external_event_id)
+            .filter(
+                CalendarEvent.user_id == user_id,
+                CalendarEvent.calendar_provider == provider,
+                CalendarEvent.external_event_id.in_(external_event_ids)
+            )
+            .all()
+        )
+        return {row.external_event_id for row in rows}
+
+    def bulk_insert(self, rows: List[Dict[str, Any]]) -> None:
+        # Single executemany, committed by the caller
+        if rows:
+            self.db.execute(insert(CalendarEvent), rows)
+
     def get_upcoming_events(self, user_id: UUID, days_ahead: int = 30) -> List[CalendarEvent]:
-        from app.models.interview import Interview
-        from datetime import timedelta
-        
         end_date = datetime.now() + timedelta(days=days_ahead)
         
         return (
             self.db.query(CalendarEvent)
-            .join(Interview)
             .filter(
-                Interview.user_id == user_id,
+                CalendarEvent.user_id == user_id,
                 CalendarEvent.start_time >= datetime.now(),
                 CalendarEvent.start_time <= end_date
             )
@@ -46,6 +96,91 @@ class CalendarEventRepository(BaseRepository[CalendarEvent]):
             .all()
         )
 
+    def get_sync_stats_by_provider(self, user_id: UUID, days_ahead: int = 365) -> List[Any]:
+        """Per-provider (total, synced, last synced) counts in one aggregate query"""
+        now = datetime.now()
+        end_date = now + timedelta(days=days_ahead)
+        
+        return (
+            self.db.query(
+                CalendarEvent.calendar_provider.label("provider"),
+                func.count().label("total_events"),
+                func.count().filter(CalendarEvent.is_synced.is_(True)).label("synced_events"),
+                func.max(CalendarEvent.updated_at).filter(CalendarEvent.is_synced.is_(True)).label("last_synced_at")
+            )
+            .filter(
+                CalendarEvent.user_id == user_id,
+                CalendarEvent.start_time >= now,
+                CalendarEvent.start_time <= end_date
+            )
+            .group_by(CalendarEvent.calendar_provider)
+            .all()
+        )
+
+    def get_schedule_intervals(
+        self,
+        user_id: UUID,
+        window_start: datetime,
+        window_end: datetime,
+        interview_duration: timedelta
+    ) -> List[ScheduleInterval]:
+        """
+        Everything occupying the user's calendar inside the window, as plain
+        tuples. Calendar events carry real start/end times; interviews without
+        an event fall back to interview_date + the default duration.
+        """
+        events = (
+            self.db.query(
+                CalendarEvent.id,
+                CalendarEvent.interview_id,
+                CalendarEvent.event_title,
+                CalendarEvent.start_time,
+                CalendarEvent.end_time
+            )
+            .filter(
+                CalendarEvent.user_id == user_id,
+                CalendarEvent.start_time < window_end,
+                CalendarEvent.end_time > window_start
+            )
+            .order_by(CalendarEvent.start_time)
+            .all()
+        )
+        
+        has_event = exists().where(CalendarEvent.interview_id == Interview.id)
+        interviews = (
+            self.db.query(
+                Interview.id,
+                Interview.role_title,
+                Interview.company_name,
+                Interview.interview_date
+            )
+            .filter(
+                Interview.user_id == user_id,
+                Interview.interview_date > window_start - interview_duration,
+                Interview.interview_date < window_end,
+                ~has_event
+            )
+            .order_by(Interview.interview_date)
+            .all()
+        )
+        
+        intervals = [
+            ScheduleInterval("event", row.id, row.interview_id, row.event_title, row.start_time, row.end_time)
+            for row in events
+        ]
+        intervals.extend(
+            ScheduleInterval(
+                "interview",
+                row.id,
+                row.id,
+                f"{row.role_title} at {row.company_name}",
+                row.interview_date,
+                row.interview_date + interview_duration
+            )
+            for row in interviews
+        )
+        return intervals
+
     def create_calendar_event(
         self,
         interview_id: UUID,
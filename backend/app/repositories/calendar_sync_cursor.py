@@ -0,0 +1,92 @@
+from typing import Optional, List, NamedTuple
+from sqlalchemy.orm import Session
+from sqlalchemy import select, literal, union_all
+from sqlalchemy.sql import func
+from uuid import UUID
+from datetime import datetime, timezone
+
+from app.models.calendar_event import CalendarEvent
+from app.models.calendar_sync_cursor import CalendarSyncCursor
+from app.models.interview import Interview
+from app.models.interview_tombstone import InterviewTombstone
+from app.repositories.base import BaseRepository
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+class CalendarChange(NamedTuple):
+    kind: str  # "upsert" or "delete"
+    interview_id: UUID
+    changed_at: datetime
+
+class CalendarSyncCursorRepository(BaseRepository[CalendarSyncCursor]):
+    def __init__(self, db: Session):
+        super().__init__(db, CalendarSyncCursor)
+
+    def get_cursor(self, user_id: UUID, provider: str) -> Optional[CalendarSyncCursor]:
+        return (
+            self.db.query(CalendarSyncCursor)
+            .filter(
+                CalendarSyncCursor.user_id == user_id,
+                CalendarSyncCursor.calendar_provider == provider
+            )
+            .first()
+        )
+
+    def get_changes_since(self, user_id: UUID, provider: str, since: Optional[datetime]) -> List[CalendarChange]:
+        """
+        Everything that changed for (user, provider) after ``since``, as one
+        UNION ALL statement. Each branch is a range scan on its own index.
+        Rows are not deduplicated; an interview can appear in several branches.
+        """
+        since = since or EPOCH
+        
+        # ix_interviews_user_updated_at
+        changed_interviews = select(
+            literal("upsert").label("kind"),
+            Interview.id.label("interview_id"),
+            Interview.updated_at.label("changed_at")
+        ).where(
+            Interview.user_id == user_id,
+            Interview.updated_at > since,
+            Interview.interview_date.isnot(None)
+        )
+        
+        # ix_calendar_events_unsynced
+        unsynced_events = select(
+            literal("upsert").label("kind"),
+            CalendarEvent.interview_id.label("interview_id"),
+            CalendarEvent.updated_at.label("changed_at")
+        ).where(
+            CalendarEvent.user_id == user_id,
+            CalendarEvent.calendar_provider == provider,
+            CalendarEvent.is_synced.is_(False),
+            CalendarEvent.updated_at > since
+        )
+        
+        # ix_interview_tombstones_user_deleted_at
+        deleted_interviews = select(
+            literal("delete").label("kind"),
+            InterviewTombstone.interview_id.label("interview_id"),
+            InterviewTombstone.deleted_at.label("changed_at")
+        ).where(
+            InterviewTombstone.user_id == user_id,
+            InterviewTombstone.deleted_at > since
+        )
+        
+        rows = self.db.execute(
+            union_all(changed_interviews, unsynced_events, deleted_interviews)
+        ).all()
+        return [CalendarChange(row.kind, row.interview_id, row.changed_at) for row in rows]
+
+    def advance(self, user_id: UUID, provider: str, synced_until: datetime) -> CalendarSyncCursor:
+        cursor = self.get_cursor(user_id, provider)
+        if cursor is None:
+            cursor = CalendarSyncCursor(
+                user_id=user_id,
+                calendar_provider=provider,
+                synced_until=synced_until
+            )
+            self.db.add(cursor)
+        elif synced_until > cursor.synced_until:
+            cursor.synced_until = synced_until
+        return cursor
@@ -0,0 +1,134 @@
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import func
+from uuid import UUID
+from datetime import datetime, timedelta, timezone
+
+from app.models.calendar_event import CalendarEvent
+from app.models.calendar_sync_job import CalendarSyncJob, SyncJobAction, SyncJobStatus
+from app.repositories.base import BaseRepository
+
+class CalendarSyncJobRepository(BaseRepository[CalendarSyncJob]):
+    """Outbox access. ``enqueue_*`` only add to the session so the job commits
+    atomically with the caller's own changes."""
+
+    def __init__(self, db: Session):
+        super().__init__(db, CalendarSyncJob)
+
+    def _get_pending_for_event(self, calendar_event_id: UUID) -> Optional[CalendarSyncJob]:
+        return (
+            self.db.query(CalendarSyncJob)
+            .filter(
+                CalendarSyncJob.calendar_event_id == calendar_event_id,
+                CalendarSyncJob.action == SyncJobAction.UPSERT,
+                CalendarSyncJob.status == SyncJobStatus.PENDING
+            )
+            .first()
+        )
+
+    def enqueue_upsert(self, user_id: UUID, event: CalendarEvent) -> CalendarSyncJob:
+        # Coalesce repeated edits: one pending upsert per event is enough since
+        # the worker always pushes the event's current state.
+        existing = self._get_pending_for_event(event.id)
+        if existing:
+            return existing
+        
+        job = CalendarSyncJob(
+            user_id=user_id,
+            interview_id=event.interview_id,
+            calendar_event_id=event.id,
+            calendar_provider=event.calendar_provider,
+            action=SyncJobAction.UPSERT,
+            status=SyncJobStatus.PENDING,
+            attempts=0
+        )
+        self.db.add(job)
+        return job
+
+    def enqueue_delete(self, user_id: UUID, event: CalendarEvent) -> Optional[CalendarSyncJob]:
+        if not event.external_event_id:
+            # Never reached the provider, nothing to remove remotely
+            return None
+        
+        job = CalendarSyncJob(
+            user_id=user_id,
+            interview_id=event.interview_id,
+            calendar_event_id=event.id,
+            external_event_id=event.external_event_id,
+            calendar_provider=event.calendar_provider,
+            action=SyncJobAction.DELETE,
+            status=SyncJobStatus.PENDING,
+            attempts=0
+        )
+        self.db.add(job)
+        return job
+
+    def claim_batch(self, limit: int, lock_timeout_seconds: int) -> List[CalendarSyncJob]:
+        """Claim up to ``limit`` due jobs for this worker and commit the claim.
+
+        Uses ``SELECT ... FOR UPDATE SKIP LOCKED`` so concurrent workers never
+        block on, or double-claim, the same rows. Jobs stuck in PROCESSING past
+        the lock timeout (crashed worker) are claimable again.
+        """
+        now = datetime.now(timezone.utc)
+        stale_before = now - timedelta(seconds=lock_timeout_seconds)
+        
+        jobs = (
+            self.db.query(CalendarSyncJob)
+            .filter(
+                or_(
+                    and_(
+                        CalendarSyncJob.status == SyncJobStatus.PENDING,
+                        CalendarSyncJob.available_at <= func.now()
+                    ),
+                    and_(
+                        CalendarSyncJob.status == SyncJobStatus.PROCESSING,
+                        CalendarSyncJob.locked_at < stale_before
+                    )
+                )
+            )
+            .order_by(CalendarSyncJob.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        
+        for job in jobs:
+            job.status = SyncJobStatus.PROCESSING
+            job.locked_at = now
+            job.attempts += 1
+        
+        self.db.commit()
+        return jobs
+
+    def mark_done(self, job: CalendarSyncJob) -> None:
+        job.status = SyncJobStatus.DONE
+        job.locked_at = None
+        job.last_error = None
+
+    def mark_retry(
+        self,
+        job: CalendarSyncJob,
+        error: str,
+        max_attempts: int,
+        backoff_base_seconds: int,
+        backoff_max_seconds: int
+    ) -> None:
+        job.locked_at = None
+        job.last_error = error
+        
+        if job.attempts >= max_attempts:
+            job.status = SyncJobStatus.FAILED
+            return
+        
+        delay = min(backoff_base_seconds * (2 ** (job.attempts - 1)), backoff_max_seconds)
+        job.status = SyncJobStatus.PENDING
+        job.available_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+    def count_pending(self) -> int:
+        return (
+            self.db.query(CalendarSyncJob)
+            .filter(CalendarSyncJob.status == SyncJobStatus.PENDING)
+            .count()
+        )
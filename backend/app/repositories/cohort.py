@@ -0,0 +1,94 @@
+from typing import Iterable, Iterator, List, Dict, Any, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, insert, bindparam, tuple_
+from sqlalchemy.sql import func
+from datetime import date, datetime
+
+from app.models.cohort_benchmark import CohortBenchmark
+from app.models.cohort_refresh import CohortRefresh
+from app.models.interview import Interview
+from app.repositories.base import BaseRepository
+
+TRAILING = "trailing"
+ALL_MODES = "ALL"
+
+class CohortRepository(BaseRepository[CohortBenchmark]):
+    def __init__(self, db: Session):
+        super().__init__(db, CohortBenchmark)
+
+    def mark_dirty(self, cohorts: Iterable[Tuple[str, date]]) -> None:
+        # Not committed: rides along with the interview change
+        rows = [{"work_mode": mode, "week_start": week} for mode, week in set(cohorts)]
+        if not rows:
+            return
+        stmt = self._upsert_insert(CohortRefresh).values(rows)
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=["work_mode", "week_start"],
+            set_={"queued_at": func.now()}
+        ))
+
+    def get_dirty(self) -> List[Any]:
+        return self.db.query(
+            CohortRefresh.work_mode, CohortRefresh.week_start, CohortRefresh.queued_at
+        ).all()
+
+    def clear_dirty(self, consumed: List[Any]) -> None:
+        # Cohorts re-marked while the job ran keep their newer queued_at
+        if not consumed:
+            return
+        stmt = delete(CohortRefresh).where(
+            CohortRefresh.work_mode == bindparam("mode"),
+            CohortRefresh.week_start == bindparam("week"),
+            CohortRefresh.queued_at <= bindparam("queued")
+        )
+        self.db.connection().execute(stmt, [
+            {"mode": row.work_mode, "week": row.week_start, "queued": row.queued_at}
+            for row in consumed
+        ])
+
+    def iter_interview_chunks(
+        self, modes: List[Any], since: datetime, until: datetime, chunk_size: int
+    ) -> Iterator[List[Any]]:
+        stmt = (
+            select(Interview.user_id, Interview.work_mode, Interview.application_status, Interview.created_at)
+            .where(
+                Interview.work_mode.in_(modes),
+                Interview.created_at >= since,
+                Interview.created_at < until
+            )
+            .execution_options(stream_results=True, yield_per=chunk_size)
+        )
+        yield from self.db.execute(stmt).partitions(chunk_size)
+
+    def replace_periods(self, periods: List[Tuple[str, str]], rows: List[Dict[str, Any]]) -> None:
+        if periods:
+            self.db.execute(delete(CohortBenchmark).where(
+                tuple_(CohortBenchmark.work_mode, CohortBenchmark.period).in_(periods)
+            ))
+        if rows:
+            self.db.execute(insert(CohortBenchmark), rows)
+
+    def count_users_since(self, since: datetime) -> Dict[str, int]:
+        """Distinct users with applications since ``since``, per work mode and across all modes"""
+        window = Interview.created_at >= since
+        counts = {
+            mode.value: users
+            for mode, users in self.db.query(Interview.work_mode, func.count(Interview.user_id.distinct()))
+            .filter(window)
+            .group_by(Interview.work_mode)
+        }
+        counts[ALL_MODES] = self.db.query(func.count(Interview.user_id.distinct())).filter(window).scalar()
+        return counts
+
+    def get_weekly(self, since: date) -> List[CohortBenchmark]:
+        return (
+            self.db.query(CohortBenchmark)
+            .filter(CohortBenchmark.week_start >= since)
+            .order_by(CohortBenchmark.work_mode, CohortBenchmark.week_start)
+            .all()
+        )
+
+    def get_trailing(self) -> Dict[str, CohortBenchmark]:
+        """Every mode's trailing benchmark (a handful of rows), keyed for O(1) lookups"""
+        rows = self.db.query(CohortBenchmark).filter(CohortBenchmark.period == TRAILING).all()
+        return {row.work_mode: row for row in rows}
@@ -0,0 +1,212 @@
+from typing import List, Any, Dict, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert
+from sqlalchemy.sql import func
+from uuid import UUID
+from datetime import date, datetime, timezone
+
+from app.models.daily_user_activity import DailyUserActivity
+from app.models.interview import Interview, ApplicationStatus, INTERVIEW_STAGES
+from app.repositories.base import BaseRepository
+
+COUNTERS = ("applications", "interviews", "offers", "rejections", "responses", "response_days_total")
+
+class DailyActivityRepository(BaseRepository[DailyUserActivity]):
+    def __init__(self, db: Session):
+        super().__init__(db, DailyUserActivity)
+
+    def record(
+        self,
+        user_id: UUID,
+        day: date,
+        company_name: str,
+        last_status: Optional[ApplicationStatus] = None,
+        **deltas: float
+    ) -> DailyUserActivity:
+        # Append-only delta; committed by the caller with the interview change
+        row = DailyUserActivity(
+            user_id=user_id,
+            day=day,
+            company_name=company_name,
+            last_status=last_status,
+            last_activity=datetime.now(timezone.utc),
+            **{counter: deltas.get(counter, 0) for counter in COUNTERS}
+        )
+        self.db.add(row)
+        return row
+
+    def record_applications(
+        self,
+        user_id: UUID,
+        day: date,
+        companies: Dict[str, int],
+        last_status: Optional[ApplicationStatus] = None
+    ) -> None:
+        """Batch path: one applications delta per company with a single insert. Not committed."""
+        if not companies:
+            return
+        now = datetime.now(timezone.utc)
+        self.db.execute(insert(DailyUserActivity), [
+            {
+                "user_id": user_id,
+                "day": day,
+                "company_name": company_name,
+                "last_status": last_status,
+                "last_activity": now,
+                **{counter: 0 for counter in COUNTERS},
+                "applications": applications
+            }
+            for company_name, applications in companies.items()
+        ])
+
+    def get_daily_totals(self, user_id: UUID, since: date) -> List[Any]:
+        """One row per active day with counters summed across companies"""
+        return (
+            self.db.query(
+                DailyUserActivity.day,
+                func.sum(DailyUserActivity.applications).label("applications"),
+                func.sum(DailyUserActivity.interviews).label("interviews"),
+                func.sum(DailyUserActivity.offers).label("offers"),
+                func.sum(DailyUserActivity.responses).label("responses"),
+                func.sum(DailyUserActivity.response_days_total).label("response_days_total")
+            )
+            .filter(DailyUserActivity.user_id == user_id, DailyUserActivity.day >= since)
+            .group_by(DailyUserActivity.day)
+            .order_by(DailyUserActivity.day)
+            .all()
+        )
+
+    def get_company_stats(self, user_id: UUID, limit: int = 10) -> List[Any]:
+        """Top companies by applications, with the latest status seen for each"""
+        latest = (
+            self.db.query(
+                DailyUserActivity.company_name,
+                DailyUserActivity.last_status,
+                func.row_number().over(
+                    partition_by=DailyUserActivity.company_name,
+                    order_by=DailyUserActivity.last_activity.desc()
+                ).label("rn")
+            )
+            .filter(
+                DailyUserActivity.user_id == user_id,
+                DailyUserActivity.last_status.isnot(None)
+            )
+            .subquery()
+        )
+        totals = (
+            self.db.query(
+                DailyUserActivity.company_name,
+                func.sum(DailyUserActivity.applications).label("total_applications"),
+                func.max(DailyUserActivity.last_activity).label("last_activity")
+            )
+            .filter(DailyUserActivity.user_id == user_id)
+            .group_by(DailyUserActivity.company_name)
+            .subquery()
+        )
+        return (
+            self.db.query(
+                totals.c.company_name,
+                totals.c.total_applications,
+                totals.c.last_activity,
+                latest.c.last_status.label("current_status")
+            )
+            .outerjoin(
+                latest,
+                (latest.c.company_name == totals.c.company_name) & (latest.c.rn == 1)
+            )
+            .filter(totals.c.total_applications > 0)
+            .order_by(totals.c.total_applications.desc(), totals.c.last_activity.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def rebuild_for_user(self, user_id: UUID) -> int:
+        """Recreate a user's rollup from the interviews table (backfill/repair).
+
+        Transition history before the rollup existed is unknown, so current
+        status stands in for it. Not committed.
+        """
+        self.db.execute(delete(DailyUserActivity).where(DailyUserActivity.user_id == user_id))
+        
+        interviews = (
+            self.db.query(
+                Interview.company_name,
+                Interview.application_status,
+                Interview.created_at,
+                Interview.updated_at
+            )
+            .filter(Interview.user_id == user_id)
+            .yield_per(1000)
+        )
+        
+        buckets: Dict[Any, Dict[str, Any]] = {}
+        for row in interviews:
+            key = (row.created_at.date(), row.company_name)
+            bucket = buckets.setdefault(key, {
+                **{counter: 0 for counter in COUNTERS},
+                "last_status": None,
+                "last_activity": row.updated_at
+            })
+            bucket["applications"] += 1
+            status = row.application_status
+            if status in INTERVIEW_STAGES:
+                bucket["interviews"] += 1
+            elif status == ApplicationStatus.OFFER:
+                bucket["offers"] += 1
+            elif status == ApplicationStatus.REJECTED:
+                bucket["rejections"] += 1
+            if status not in (ApplicationStatus.APPLIED, None):
+                bucket["responses"] += 1
+                bucket["response_days_total"] += max((row.updated_at - row.created_at).total_seconds(), 0) / 86400
+            if row.updated_at >= bucket["last_activity"]:
+                bucket["last_activity"] = row.updated_at
+                bucket["last_status"] = status
+        
+        rows = [
+            {"user_id": user_id, "day": day, "company_name": company, **bucket}
+            for (day, company), bucket in buckets.items()
+        ]
+        if rows:
+            self.db.execute(insert(DailyUserActivity), rows)
+        return len(rows)
+
+    def compact(self, before: date, batch_size: int = 1000) -> int:
+        """Fold delta rows into one row per (user, day, company) for days before ``before``.
+
+        Returns the number of rows removed. Not committed.
+        """
+        keys = (
+            self.db.query(
+                DailyUserActivity.user_id,
+                DailyUserActivity.day,
+                DailyUserActivity.company_name
+            )
+            .filter(DailyUserActivity.day < before)
+            .group_by(DailyUserActivity.user_id, DailyUserActivity.day, DailyUserActivity.company_name)
+            .having(func.count() > 1)
+            .limit(batch_size)
+            .all()
+        )
+        
+        removed = 0
+        for user_id, day, company_name in keys:
+            rows = (
+                self.db.query(DailyUserActivity)
+                .filter(
+                    DailyUserActivity.user_id == user_id,
+                    DailyUserActivity.day == day,
+                    DailyUserActivity.company_name == company_name
+                )
+                .order_by(DailyUserActivity.last_activity)
+                .all()
+            )
+            keeper, rest = rows[-1], rows[:-1]
+            for row in reversed(rest):
+                for counter in COUNTERS:
+                    setattr(keeper, counter, getattr(keeper, counter) + getattr(row, counter))
+                if keeper.last_status is None:
+                    keeper.last_status = row.last_status
+                self.db.delete(row)
+            removed += len(rest)
+        
+        return removed
@@ -0,0 +1,179 @@
+from typing import Optional, List, Dict, Tuple, Any
+from collections import Counter
+from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.sql import func
+from uuid import UUID
+from datetime import datetime
+
+from app.models.interview import ApplicationStatus, ADVANCING_STATUSES, utc_quarter_hour
+from app.models.interview_status_event import InterviewStatusEvent
+from app.models.user_funnel_stat import UserFunnelStat
+from app.repositories.base import BaseRepository
+
+FUNNEL_ENTRY = "NEW"
+# from_status of the rows counting distinct interviews that ever reached to_status
+FUNNEL_REACHED = "REACHED"
+
+# Upper bounds (days) of the time-in-stage histogram buckets; the last bucket
+# is open-ended. Medians are interpolated from these counts.
+DURATION_BUCKET_BOUNDS = (1, 2, 3, 5, 7, 10, 14, 21, 30, 45, 60, 90)
+
+def duration_bucket(days: float) -> int:
+    for index, bound in enumerate(DURATION_BUCKET_BOUNDS):
+        if days < bound:
+            return index
+    return len(DURATION_BUCKET_BOUNDS)
+
+class FunnelRepository(BaseRepository[InterviewStatusEvent]):
+    """Status transition log plus the per-user aggregates derived from it.
+
+    Writers call these inside their own transaction and commit themselves.
+    """
+
+    def __init__(self, db: Session):
+        super().__init__(db, InterviewStatusEvent)
+
+    def get_last_transition_at(self, interview_id: UUID) -> Optional[datetime]:
+        return (
+            self.db.query(func.max(InterviewStatusEvent.changed_at))
+            .filter(InterviewStatusEvent.interview_id == interview_id)
+            .scalar()
+        )
+
+    def get_transitions(self, interview_id: UUID) -> List[Any]:
+        """(from_status, to_status, changed_at) for every status change, oldest first"""
+        return (
+            self.db.query(
+                InterviewStatusEvent.from_status,
+                InterviewStatusEvent.to_status,
+                InterviewStatusEvent.changed_at
+            )
+            .filter(InterviewStatusEvent.interview_id == interview_id)
+            .order_by(InterviewStatusEvent.changed_at, InterviewStatusEvent.id)
+            .all()
+        )
+
+    def record_transition(
+        self,
+        user_id: UUID,
+        interview_id: UUID,
+        from_status: Optional[ApplicationStatus],
+        to_status: ApplicationStatus,
+        days_in_previous: Optional[float] = None
+    ) -> InterviewStatusEvent:
+        event = InterviewStatusEvent(
+            user_id=user_id,
+            interview_id=interview_id,
+            from_status=from_status,
+            to_status=to_status,
+            days_in_previous=days_in_previous
+        )
+        increments = Counter({(
+            from_status.value if from_status else FUNNEL_ENTRY,
+            to_status.value,
+            duration_bucket(days_in_previous or 0)
+        ): 1})
+        # Checked before the new event is added: only the first visit counts
+        if not self._has_reached(interview_id, to_status):
+            increments[(FUNNEL_REACHED, to_status.value, 0)] = 1
+        self.db.add(event)
+        self._increment(user_id, increments)
+        return event
+
+    def _has_reached(self, interview_id: UUID, status: ApplicationStatus) -> bool:
+        return self.db.query(
+            self.db.query(InterviewStatusEvent)
+            .filter(InterviewStatusEvent.interview_id == interview_id, InterviewStatusEvent.to_status == status)
+            .exists()
+        ).scalar()
+
+    def record_entries(self, user_id: UUID, entries: List[Tuple[UUID, ApplicationStatus]]) -> None:
+        """Batch path: log interviews entering the funnel with one insert each table"""
+        if not entries:
+            return
+        
+        self.db.execute(insert(InterviewStatusEvent), [
+            {"user_id": user_id, "interview_id": interview_id, "to_status": status}
+            for interview_id, status in entries
+        ])
+        increments = Counter()
+        for _, status in entries:
+            increments[(FUNNEL_ENTRY, status.value, 0)] += 1
+            increments[(FUNNEL_REACHED, status.value, 0)] += 1
+        self._increment(user_id, increments)
+
+    def remove_interview(self, user_id: UUID, interview_id: UUID) -> None:
+        """Take a deleted interview's transitions back out of the aggregate; its log rows stay"""
+        events = (
+            self.db.query(
+                InterviewStatusEvent.from_status,
+                InterviewStatusEvent.to_status,
+                InterviewStatusEvent.days_in_previous
+            )
+            .filter(InterviewStatusEvent.interview_id == interview_id)
+            .all()
+        )
+        if not events:
+            return
+        
+        decrements = Counter()
+        for from_status, to_status, days_in_previous in events:
+            key = (
+                from_status.value if from_status else FUNNEL_ENTRY,
+                to_status.value,
+                duration_bucket(days_in_previous or 0)
+            )
+            decrements[key] -= 1
+        for to_status in {to_status for _, to_status, _ in events}:
+            decrements[(FUNNEL_REACHED, to_status.value, 0)] -= 1
+        self._increment(user_id, decrements)
+
+    def _increment(self, user_id: UUID, increments: Counter) -> None:
+        stmt = self._upsert_insert(UserFunnelStat).values([
+            {
+                "user_id": user_id,
+                "from_status": from_status,
+                "to_status": to_status,
+                "duration_bucket": bucket,
+                "transitions": count
+            }
+            for (from_status, to_status, bucket), count in increments.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "from_status", "to_status", "duration_bucket"],
+            set_={
+                "transitions": UserFunnelStat.transitions + stmt.excluded.transitions,
+                "updated_at": func.now()
+            }
+        )
+        self.db.execute(stmt)
+
+    def get_funnel_stats(self, user_id: UUID) -> List[Any]:
+        """The user's whole precomputed funnel: at most stages^2 x buckets rows"""
+        return (
+            self.db.query(
+                UserFunnelStat.from_status,
+                UserFunnelStat.to_status,
+                UserFunnelStat.duration_bucket,
+                UserFunnelStat.transitions
+            )
+            # Rows emptied by deletes
+            .filter(UserFunnelStat.user_id == user_id, UserFunnelStat.transitions > 0)
+            .all()
+        )
+
+    def get_advancing_quarter_hour_counts(self, user_id: UUID) -> Dict[int, int]:
+        """Forward status moves per 15-minute UTC slot"""
+        slot = utc_quarter_hour(InterviewStatusEvent.changed_at)
+        rows = (
+            self.db.query(slot, func.count())
+            .filter(
+                InterviewStatusEvent.user_id == user_id,
+                InterviewStatusEvent.from_status.isnot(None),
+                InterviewStatusEvent.to_status.in_(ADVANCING_STATUSES)
+            )
+            .group_by(slot)
+            .all()
+        )
+        return dict(rows)
@@ -0,0 +1,67 @@
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, or_, update
+from uuid import UUID
+
+from app.models.idempotency_key import IdempotencyKey
+from app.repositories.base import BaseRepository
+
+class IdempotencyKeyRepository(BaseRepository[IdempotencyKey]):
+    """Not committed; callers commit around the guarded request."""
+
+    def __init__(self, db: Session):
+        super().__init__(db, IdempotencyKey)
+
+    def get_key(self, user_id: UUID, key: str) -> Optional[IdempotencyKey]:
+        # Primary key lookup
+        return self.db.get(IdempotencyKey, (user_id, key))
+
+    def claim(
+        self, user_id: UUID, key: str, fingerprint: str, now: datetime, locked_until: datetime, expires_at: datetime
+    ) -> bool:
+        """
+        Take the key for one request: insert it, or take over an expired key or
+        an abandoned claim. False if another request holds or completed it.
+        """
+        existing = IdempotencyKey.__table__.c
+        statement = self._upsert_insert().values(
+            user_id=user_id, key=key, fingerprint=fingerprint, locked_until=locked_until, expires_at=expires_at
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id", "key"],
+            set_={
+                "fingerprint": fingerprint,
+                "status_code": None,
+                "response_body": None,
+                "locked_until": locked_until,
+                "expires_at": expires_at
+            },
+            where=or_(
+                existing.expires_at <= now,
+                and_(existing.status_code.is_(None), existing.locked_until <= now)
+            )
+        )
+        return self.db.execute(statement).rowcount == 1
+
+    def complete(self, user_id: UUID, key: str, status_code: int, response_body: bytes) -> None:
+        self.db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+            .values(status_code=status_code, response_body=response_body)
+            .execution_options(synchronize_session=False)
+        )
+
+    def release(self, user_id: UUID, key: str) -> None:
+        # Drops an unfinished claim so the client can retry
+        self.db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key,
+                IdempotencyKey.status_code.is_(None)
+            )
+        )
+
+    def purge_expired(self, now: datetime) -> int:
+        # ix_idempotency_keys_expires_at
+        return self.db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= now)).rowcount
@@ -1,12 +1,79 @@
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, or_, insert, update, select, literal, null, cast, union_all, bindparam, tuple_, Integer
+from sqlalchemy.sql import func
 from datetime import datetime, date
 from uuid import UUID
 
-from app.models.interview import Interview, ApplicationStatus, WorkMode
+from app.models.interview import Interview, ApplicationStatus, WorkMode, utc_quarter_hour
+from app.models.interview_tag import InterviewTag
+from app.models.interview_tombstone import InterviewTombstone
 from app.repositories.base import BaseRepository
 
+# Card order within a board column; id only breaks ties between equal ranks
+BOARD_ORDER = (Interview.board_rank, Interview.id)
+
+# Rows written before the status default existed have no status; they show as APPLIED
+BOARD_STATUS = func.coalesce(
+    Interview.application_status, literal(ApplicationStatus.APPLIED, Interview.application_status.type)
+)
+
+# Facet name -> grouped column for GET /interviews?facets=
+FACET_COLUMNS = {
+    "status": Interview.application_status,
+    "work_mode": Interview.work_mode,
+    "currency": Interview.currency,
+    "language": Interview.language,
+    "location": Interview.location,
+}
+FACET_FIELDS = (*FACET_COLUMNS, "tags")
+
+def _board_status_filter(status: ApplicationStatus):
+    if status == ApplicationStatus.APPLIED:
+        return or_(Interview.application_status == status, Interview.application_status.is_(None))
+    return Interview.application_status == status
+
+def _tagged_ids(user_id: UUID, tags_any: Optional[List[str]], tags_all: Optional[List[str]]):
+    """
+    Interview ids carrying every tag in ``tags_all`` and at least one of
+    ``tags_any``. Joined (not IN) so the planner drives the query from
+    ix_interview_tags_user_tag instead of scanning the user's interviews.
+    """
+    if not tags_all:
+        return (
+            select(InterviewTag.interview_id)
+            .where(InterviewTag.user_id == user_id, InterviewTag.tag.in_(tags_any))
+            .distinct()
+            .subquery()
+        )
+    
+    first = aliased(InterviewTag)
+    query = select(first.interview_id).where(first.user_id == user_id, first.tag == tags_all[0])
+    for tag in tags_all[1:]:
+        other = aliased(InterviewTag)
+        query = query.join(other, and_(
+            other.user_id == user_id, other.tag == tag, other.interview_id == first.interview_id
+        ))
+    if tags_any:
+        query = query.where(first.interview_id.in_(
+            select(InterviewTag.interview_id)
+            .where(InterviewTag.user_id == user_id, InterviewTag.tag.in_(tags_any))
+        ))
+    return query.subquery()
+
+class DashboardRow(NamedTuple):
+    kind: str  # "counts", "upcoming" or "recent"
+    id: Optional[UUID]
+    company_name: Optional[str]
+    role_title: Optional[str]
+    application_status: Optional[ApplicationStatus]
+    work_mode: Optional[WorkMode]
+    interview_date: Optional[datetime]
+    updated_at: Optional[datetime]
+    total: Optional[int]
+    this_week: Optional[int]
+    upcoming: Optional[int]
+
 class InterviewRepository(BaseRepository[Interview]):
     def __init__(self, db: Session):
         super().__init__(db, Interview)
@@ -15,23 +82,29 @@ class InterviewRepository(BaseRepository[Interview]):
         return (
             self.db.query(Interview)
             .filter(Interview.user_id == user_id)
+            .order_by(Interview.created_at.desc())
             .offset(skip)
             .limit(limit)
-            .order_by(Interview.created_at.desc())
             .all()
         )
 
-    def get_by_user_and_filters(
+    def get_by_ids(self, interview_ids: List[UUID]) -> List[Interview]:
+        if not interview_ids:
+            return []
+        return self.db.query(Interview).filter(Interview.id.in_(interview_ids)).all()
+
+    def _filtered(
         self,
+        query,
         user_id: UUID,
         status: Optional[ApplicationStatus] = None,
         company: Optional[str] = None,
         from_date: Optional[date] = None,
         to_date: Optional[date] = None,
-        skip: int = 0,
-        limit: int = 100
-    ) -> List[Interview]:
-        query = self.db.query(Interview).filter(Interview.user_id == user_id)
+        tags_any: Optional[List[str]] = None,
+        tags_all: Optional[List[str]] = None
+    ):
+        query = query.filter(Interview.user_id == user_id)
         
         if status:
             query = query.filter(Interview.application_status == status)
@@ -45,14 +118,125 @@ class InterviewRepository(BaseRepository[Interview]):
         if to_date:
             query = query.filter(Interview.created_at <= to_date)
         
+        if tags_any or tags_all:
+            tagged = _tagged_ids(user_id, tags_any, tags_all)
+            query = query.join(tagged, tagged.c.interview_id == Interview.id)
+        
+        return query
+
+    def get_by_user_and_filters(
+        self,
+        user_id: UUID,
+        status: Optional[ApplicationStatus] = None,
+        company: Optional[str] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        tags_any: Optional[List[str]] = None,
+        tags_all: Optional[List[str]] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Interview]:
+        query = self._filtered(
+            self.db.query(Interview), user_id, status, company, from_date, to_date, tags_any, tags_all
+        )
         return (
             query
+            .order_by(Interview.created_at.desc())
             .offset(skip)
             .limit(limit)
-            .order_by(Interview.created_at.desc())
             .all()
         )
 
+    def count_by_filters(self, user_id: UUID, **filters) -> int:
+        query = self.db.query(func.count(Interview.id)).select_from(Interview)
+        return self._filtered(query, user_id, **filters).scalar()
+
+    def get_facets(self, user_id: UUID, fields: List[str], **filters) -> Dict[str, Dict[str, int]]:
+        """
+        Value histograms for ``fields`` (FACET_FIELDS) over the rows matching
+        ``filters``. Column facets come from one scan: GROUPING SETS on
+        Postgres, a streamed tally elsewhere. NULL values are left out, except
+        a NULL status, which counts as APPLIED like on the board. Tag counts
+        are one extra GROUP BY on interview_tags.
+        """
+        facets: Dict[str, Dict[str, int]] = {field: {} for field in fields}
+        if "tags" in fields:
+            matching = self._filtered(self.db.query(Interview.id), user_id, **filters)
+            facets["tags"] = dict(
+                self.db.query(InterviewTag.tag, func.count())
+                .filter(InterviewTag.user_id == user_id, InterviewTag.interview_id.in_(matching))
+                .group_by(InterviewTag.tag)
+                .all()
+            )
+            fields = [field for field in fields if field != "tags"]
+        
+        columns = [FACET_COLUMNS[field] for field in fields]
+        if not columns:
+            return facets
+        
+        def add(field, value, count):
+            if value is None and field == "status":
+                value = ApplicationStatus.APPLIED
+            if value is not None:
+                value = value.value if hasattr(value, "value") else str(value)
+                facets[field][value] = facets[field].get(value, 0) + count
+        
+        if self.db.get_bind().dialect.name == "postgresql":
+            # One row per (set, value); GROUPING() is 0 for the set's own column
+            query = self._filtered(
+                self.db.query(*columns, *[func.grouping(column) for column in columns], func.count()),
+                user_id, **filters
+            ).group_by(func.grouping_sets(*[tuple_(column) for column in columns]))
+            for row in query:
+                values, flags, count = row[:len(columns)], row[len(columns):-1], row[-1]
+                index = list(flags).index(0)
+                add(fields[index], values[index], count)
+            return facets
+        
+        query = self._filtered(self.db.query(*columns), user_id, **filters)
+        for values in query.yield_per(5000):
+            for field, value in zip(fields, values):
+                add(field, value, 1)
+        return facets
+
+    def get_company_counts(self, user_id: UUID, limit: int) -> Dict[str, int]:
+        """Interviews per distinct company name, at most ``limit`` names"""
+        rows = (
+            self.db.query(Interview.company_name, func.count())
+            .filter(Interview.user_id == user_id)
+            .group_by(Interview.company_name)
+            .limit(limit)
+            .all()
+        )
+        return dict(rows)
+
+    def suggest_companies(self, user_id: UUID, prefix: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """Prefix match on ix_interviews_user_company_prefix, most used first"""
+        escaped = prefix.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        rows = (
+            self.db.query(Interview.company_name, func.count())
+            .filter(
+                Interview.user_id == user_id,
+                func.lower(Interview.company_name).like(f"{escaped}%", escape="\\")
+            )
+            .group_by(Interview.company_name)
+            .order_by(func.count().desc(), Interview.company_name)
+            .limit(limit)
+            .all()
+        )
+        return [(name, count) for name, count in rows]
+
+    def get_owned_ids(self, user_id: UUID, interview_ids: List[UUID]) -> List[UUID]:
+        """The subset of ``interview_ids`` belonging to the user"""
+        if not interview_ids:
+            return []
+        rows = (
+            self.db.query(Interview.id)
+            .filter(Interview.user_id == user_id, Interview.id.in_(interview_ids))
+            .all()
+        )
+        return [interview_id for (interview_id,) in rows]
+
     def count_by_user_id(self, user_id: UUID) -> int:
         return self.db.query(Interview).filter(Interview.user_id == user_id).count()
 
@@ -64,11 +248,197 @@ class InterviewRepository(BaseRepository[Interview]):
         )
 
     def get_status_counts(self, user_id: UUID) -> Dict[str, int]:
-        counts = {}
-        for status in ApplicationStatus:
-            counts[status.value] = self.count_by_status_and_user(user_id, status)
+        counts = {status.value: 0 for status in ApplicationStatus}
+        rows = (
+            self.db.query(Interview.application_status, func.count())
+            .filter(Interview.user_id == user_id)
+            .group_by(Interview.application_status)
+            .all()
+        )
+        for status, count in rows:
+            counts[(status or ApplicationStatus.APPLIED).value] += count
         return counts
 
+    def get_dashboard_rows(
+        self,
+        user_id: UUID,
+        week_ago: datetime,
+        now: datetime,
+        upcoming_until: datetime,
+        top_n: int = 5
+    ) -> List["DashboardRow"]:
+        """
+        Everything the dashboard summary needs in one statement over a CTE of
+        the user's interviews: per (status, work_mode) totals with this-week
+        and upcoming counts, then the top-N upcoming and recently updated.
+        """
+        is_upcoming = and_(Interview.interview_date >= now, Interview.interview_date <= upcoming_until)
+        # Typed NULLs: a bare NULL inside a subquery resolves to text on Postgres
+        no_count = cast(null(), Integer)
+        
+        def top(kind: str, *criteria, order_by):
+            return select(
+                literal(kind).label("kind"),
+                Interview.id, Interview.company_name, Interview.role_title,
+                Interview.application_status, Interview.work_mode,
+                Interview.interview_date, Interview.updated_at,
+                no_count.label("total"), no_count.label("this_week"), no_count.label("upcoming")
+            ).where(Interview.user_id == user_id, *criteria).order_by(order_by).limit(top_n).subquery()
+        
+        # Top-N branches are range scans on ix_interviews_user_interview_date
+        # and ix_interviews_user_updated_at
+        upcoming = top("upcoming", is_upcoming, order_by=Interview.interview_date)
+        recent = top("recent", order_by=Interview.updated_at.desc())
+        
+        # Counts aggregate a narrow CTE instead of materializing whole rows
+        mine = (
+            select(
+                Interview.application_status,
+                Interview.work_mode,
+                (Interview.created_at >= week_ago).label("this_week"),
+                is_upcoming.label("upcoming")
+            )
+            .where(Interview.user_id == user_id)
+            .cte("mine")
+        )
+        counts = (
+            select(
+                literal("counts"),
+                null(), null(), null(),
+                mine.c.application_status, mine.c.work_mode,
+                null(), null(),
+                func.count(),
+                func.count().filter(mine.c.this_week),
+                func.count().filter(mine.c.upcoming)
+            )
+            .group_by(mine.c.application_status, mine.c.work_mode)
+        )
+        
+        rows = self.db.execute(
+            union_all(select(upcoming), select(recent), counts)
+        ).all()
+        return [DashboardRow(*row) for row in rows]
+
+    def get_board(self, user_id: UUID, per_column: int) -> List[Any]:
+        """
+        First ``per_column`` cards of every status column plus each column's
+        total, in one window-function query over ix_interviews_user_status_rank.
+        Rows are (Interview, board_status, column_total), ordered by status then
+        board order; NULL statuses are counted in the APPLIED column.
+        """
+        ranked = (
+            select(
+                Interview,
+                BOARD_STATUS.label("board_status"),
+                func.row_number().over(partition_by=BOARD_STATUS, order_by=BOARD_ORDER).label("position"),
+                func.count().over(partition_by=BOARD_STATUS).label("column_total")
+            )
+            .where(Interview.user_id == user_id)
+            .subquery()
+        )
+        card = aliased(Interview, ranked)
+        return (
+            self.db.query(card, ranked.c.board_status, ranked.c.column_total)
+            .filter(ranked.c.position <= per_column)
+            .order_by(ranked.c.board_status, ranked.c.position)
+            .all()
+        )
+
+    def get_board_column(
+        self,
+        user_id: UUID,
+        status: ApplicationStatus,
+        limit: int,
+        after: Optional[Tuple[str, UUID]] = None
+    ) -> List[Interview]:
+        """One column page in board order, resuming after the (board_rank, id) key"""
+        query = self.db.query(Interview).filter(
+            Interview.user_id == user_id,
+            _board_status_filter(status)
+        )
+        if after:
+            board_rank, interview_id = after
+            query = query.filter(or_(
+                Interview.board_rank > board_rank,
+                and_(Interview.board_rank == board_rank, Interview.id > interview_id)
+            ))
+        return query.order_by(*BOARD_ORDER).limit(limit).all()
+
+    def get_adjacent_rank(
+        self,
+        user_id: UUID,
+        status: ApplicationStatus,
+        board_rank: Optional[str] = None,
+        below: bool = True,
+        exclude_id: Optional[UUID] = None
+    ) -> Optional[str]:
+        """
+        Rank of the nearest card below (or above) ``board_rank`` in a column;
+        with no rank, the column's first (or last) card. One index probe.
+        """
+        query = self.db.query(Interview.board_rank).filter(
+            Interview.user_id == user_id,
+            _board_status_filter(status)
+        )
+        if exclude_id is not None:
+            query = query.filter(Interview.id != exclude_id)
+        if board_rank is not None:
+            query = query.filter(Interview.board_rank > board_rank if below else Interview.board_rank < board_rank)
+        order = Interview.board_rank if below else Interview.board_rank.desc()
+        return query.order_by(order).limit(1).scalar()
+
+    def get_columns_to_rebalance(self, max_length: int) -> List[Tuple[UUID, ApplicationStatus]]:
+        """(user_id, status) columns holding over-long or duplicate ranks"""
+        long_keys = (
+            self.db.query(Interview.user_id, BOARD_STATUS)
+            .filter(func.length(Interview.board_rank) > max_length)
+            .distinct()
+        )
+        duplicates = (
+            self.db.query(Interview.user_id, BOARD_STATUS)
+            .group_by(Interview.user_id, BOARD_STATUS, Interview.board_rank)
+            .having(func.count() > 1)
+            .distinct()
+        )
+        return list({(user_id, ApplicationStatus(status)) for user_id, status in long_keys.union(duplicates)})
+
+    def get_column_ids(self, user_id: UUID, status: ApplicationStatus) -> List[UUID]:
+        """Every card id of a column in board order"""
+        return [
+            row.id for row in
+            self.db.query(Interview.id)
+            .filter(Interview.user_id == user_id, _board_status_filter(status))
+            .order_by(*BOARD_ORDER)
+        ]
+
+    def set_ranks(self, ranks: Dict[UUID, str], change_seq: int) -> None:
+        # One executemany by primary key; not committed
+        if ranks:
+            self.db.execute(
+                update(Interview.__table__)
+                .where(Interview.__table__.c.id == bindparam("interview_id"))
+                .values(board_rank=bindparam("board_rank"), change_seq=change_seq, updated_at=func.now()),
+                [{"interview_id": interview_id, "board_rank": rank} for interview_id, rank in ranks.items()]
+            )
+
+    def count_board_column(self, user_id: UUID, status: ApplicationStatus) -> int:
+        return (
+            self.db.query(func.count(Interview.id))
+            .filter(Interview.user_id == user_id, _board_status_filter(status))
+            .scalar()
+        )
+
+    def get_quarter_hour_counts(self, user_id: UUID) -> Dict[int, int]:
+        """Applications per 15-minute UTC slot (ix_interviews_user_quarter_hour)"""
+        slot = utc_quarter_hour(Interview.created_at)
+        rows = (
+            self.db.query(slot, func.count())
+            .filter(Interview.user_id == user_id)
+            .group_by(slot)
+            .all()
+        )
+        return dict(rows)
+
     def get_upcoming_interviews(self, user_id: UUID, days_ahead: int = 7) -> List[Interview]:
         from_date = datetime.now()
         to_date = datetime.now().replace(hour=23, minute=59, second=59)
@@ -114,3 +484,44 @@ class InterviewRepository(BaseRepository[Interview]):
             **kwargs
         }
         return self.create(interview_data)
+
+    def bulk_insert(self, rows: List[Dict[str, Any]]) -> None:
+        # Single executemany, committed by the caller
+        if rows:
+            self.db.execute(insert(Interview), rows)
+
+    def add_tombstone(self, interview: Interview, change_seq: int) -> InterviewTombstone:
+        # Not committed: written in the same transaction as the delete
+        tombstone = InterviewTombstone(user_id=interview.user_id, interview_id=interview.id, change_seq=change_seq)
+        self.db.add(tombstone)
+        return tombstone
+
+    def get_changed_since(self, user_id: UUID, after: Tuple[int, UUID], limit: int) -> List[Interview]:
+        """Interviews written after the (change_seq, id) keyset position (ix_interviews_user_change_seq)"""
+        seq, last_id = after
+        return (
+            self.db.query(Interview)
+            .filter(
+                Interview.user_id == user_id,
+                or_(Interview.change_seq > seq, and_(Interview.change_seq == seq, Interview.id > last_id))
+            )
+            .order_by(Interview.change_seq, Interview.id)
+            .limit(limit)
+            .all()
+        )
+
+    def get_tombstones_since(self, user_id: UUID, after: Tuple[int, UUID], limit: int) -> List[Tuple[int, UUID]]:
+        """(change_seq, interview_id) of deletions after the keyset position"""
+        seq, last_id = after
+        return [
+            tuple(row) for row in self.db.query(InterviewTombstone.change_seq, InterviewTombstone.interview_id)
+            .filter(
+                InterviewTombstone.user_id == user_id,
+                or_(
+                    InterviewTombstone.change_seq > seq,
+                    and_(InterviewTombstone.change_seq == seq, InterviewTombstone.interview_id > last_id)
+                )
+            )
+            .order_by(InterviewTombstone.change_seq, InterviewTombstone.interview_id)
+            .limit(limit)
+        ]
@@ -0,0 +1,100 @@
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import insert, delete
+from sqlalchemy.sql import func
+from uuid import UUID
+
+from app.models.interview import Interview
+from app.models.interview_signature import InterviewSignature
+from app.repositories.base import BaseRepository
+from app.utils.duplicates import normalize_company
+from app.utils.salary import normalize_role
+
+def signature_row(user_id: UUID, interview_id: UUID, company_name: str, role_title: str) -> Dict[str, Any]:
+    return {
+        "interview_id": interview_id,
+        "user_id": user_id,
+        "company_key": normalize_company(company_name),
+        "role_key": normalize_role(role_title),
+    }
+
+class InterviewSignatureRepository(BaseRepository[InterviewSignature]):
+    """Duplicate-detection keys. Writers call these inside their own transaction."""
+
+    def __init__(self, db: Session):
+        super().__init__(db, InterviewSignature)
+
+    def add_signature(self, user_id: UUID, interview_id: UUID, company_name: str, role_title: str) -> None:
+        # ORM add so the flush orders it after the interview insert (FK)
+        self.db.add(InterviewSignature(**signature_row(user_id, interview_id, company_name, role_title)))
+
+    def update_signature(self, user_id: UUID, interview_id: UUID, company_name: str, role_title: str) -> None:
+        row = signature_row(user_id, interview_id, company_name, role_title)
+        stmt = self._upsert_insert().values(row)
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=["interview_id"],
+            set_={"company_key": row["company_key"], "role_key": row["role_key"]}
+        ))
+
+    def bulk_insert(self, rows: List[Dict[str, Any]]) -> None:
+        # Single executemany; the interviews must already be inserted
+        if rows:
+            self.db.execute(insert(InterviewSignature), rows)
+
+    def delete_for_interview(self, interview_id: UUID) -> None:
+        self.db.execute(delete(InterviewSignature).where(InterviewSignature.interview_id == interview_id))
+
+    def get_role_keys(self, user_id: UUID, company_key: str) -> List[str]:
+        """Distinct role keys at one company (index-only on ix_interview_signatures_user_company_role)"""
+        rows = (
+            self.db.query(InterviewSignature.role_key)
+            .filter(InterviewSignature.user_id == user_id, InterviewSignature.company_key == company_key)
+            .distinct()
+            .all()
+        )
+        return [key for (key,) in rows]
+
+    def get_by_company_keys(
+        self,
+        user_id: UUID,
+        company_keys: Iterable[str],
+        role_keys: Optional[Iterable[str]] = None,
+        exclude_id: Optional[UUID] = None,
+        limit: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Signatures (with display names) of the user's interviews at any of
+        ``company_keys``, optionally only those with one of ``role_keys``
+        """
+        query = (
+            self.db.query(
+                InterviewSignature.interview_id,
+                InterviewSignature.company_key,
+                InterviewSignature.role_key,
+                Interview.company_name,
+                Interview.role_title
+            )
+            .join(Interview, Interview.id == InterviewSignature.interview_id)
+            .filter(
+                InterviewSignature.user_id == user_id,
+                InterviewSignature.company_key.in_(set(company_keys))
+            )
+        )
+        if role_keys is not None:
+            query = query.filter(InterviewSignature.role_key.in_(set(role_keys)))
+        if exclude_id is not None:
+            query = query.filter(InterviewSignature.interview_id != exclude_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def get_repeated_company_keys(self, user_id: UUID) -> List[str]:
+        """Company keys shared by more than one of the user's interviews"""
+        rows = (
+            self.db.query(InterviewSignature.company_key)
+            .filter(InterviewSignature.user_id == user_id)
+            .group_by(InterviewSignature.company_key)
+            .having(func.count() > 1)
+            .all()
+        )
+        return [key for (key,) in rows]
@@ -0,0 +1,42 @@
+from typing import List
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, update
+from sqlalchemy.sql import func
+from uuid import UUID
+
+from app.models.interview import Interview
+from app.models.interview_tag import InterviewTag
+from app.repositories.base import BaseRepository
+
+class InterviewTagRepository(BaseRepository[InterviewTag]):
+    """Bulk tag edits. Not committed; callers commit with their other writes."""
+
+    def __init__(self, db: Session):
+        super().__init__(db, InterviewTag)
+
+    def add_tags(self, user_id: UUID, interview_ids: List[UUID], tags: List[str]) -> None:
+        rows = [
+            {"interview_id": interview_id, "tag": tag, "user_id": user_id}
+            for interview_id in interview_ids for tag in tags
+        ]
+        if rows:
+            self.db.execute(self._upsert_insert().on_conflict_do_nothing(), rows)
+
+    def remove_tags(self, user_id: UUID, interview_ids: List[UUID], tags: List[str]) -> None:
+        if interview_ids and tags:
+            self.db.execute(
+                delete(InterviewTag).where(
+                    InterviewTag.user_id == user_id,
+                    InterviewTag.interview_id.in_(interview_ids),
+                    InterviewTag.tag.in_(tags)
+                )
+            )
+
+    def touch_interviews(self, interview_ids: List[UUID], change_seq: int) -> None:
+        # Tag edits count as interview updates for updated_at ordering and the change feed
+        self.db.execute(
+            update(Interview)
+            .where(Interview.id.in_(interview_ids))
+            .values(updated_at=func.now(), change_seq=change_seq)
+            .execution_options(synchronize_session=False)
+        )
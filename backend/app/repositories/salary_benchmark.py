@@ -0,0 +1,51 @@
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, insert, case
+
+from app.models.interview import Interview
+from app.models.salary_benchmark import SalaryBenchmark
+from app.repositories.base import BaseRepository
+from app.utils.salary import ANY_LOCATION
+
+class SalaryBenchmarkRepository(BaseRepository[SalaryBenchmark]):
+    def __init__(self, db: Session):
+        super().__init__(db, SalaryBenchmark)
+
+    def get_for_keys(self, role_key: str, location_key: str) -> Optional[SalaryBenchmark]:
+        """City benchmark if there is one, else the role-wide one, in one lookup"""
+        return (
+            self.db.query(SalaryBenchmark)
+            .filter(
+                SalaryBenchmark.role_key == role_key,
+                SalaryBenchmark.location_key.in_([location_key, ANY_LOCATION])
+            )
+            .order_by(case((SalaryBenchmark.location_key == ANY_LOCATION, 1), else_=0))
+            .first()
+        )
+
+    def iter_salary_chunks(self, chunk_size: int) -> Iterator[List[Tuple]]:
+        """
+        Salary rows streamed in chunks. No company is read; user_id is only
+        used to count distinct contributors per bucket.
+        """
+        stmt = (
+            select(
+                Interview.user_id,
+                Interview.role_title,
+                Interview.location,
+                Interview.work_mode,
+                Interview.salary_range_min,
+                Interview.salary_range_max,
+                Interview.currency
+            )
+            .where((Interview.salary_range_min.isnot(None)) | (Interview.salary_range_max.isnot(None)))
+            .execution_options(stream_results=True, yield_per=chunk_size)
+        )
+        for partition in self.db.execute(stmt).partitions(chunk_size):
+            yield partition
+
+    def replace_all(self, rows: List[Dict[str, Any]], batch_size: int = 1000) -> None:
+        # Full rebuild; the caller commits so readers never see a partial table
+        self.db.execute(delete(SalaryBenchmark))
+        for start in range(0, len(rows), batch_size):
+            self.db.execute(insert(SalaryBenchmark), rows[start:start + batch_size])
@@ -0,0 +1,26 @@
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from uuid import UUID
+
+from app.models.saved_view import SavedView
+from app.repositories.base import BaseRepository
+
+class SavedViewRepository(BaseRepository[SavedView]):
+    def __init__(self, db: Session):
+        super().__init__(db, SavedView)
+
+    def get_by_user(self, user_id: UUID) -> List[SavedView]:
+        # uq_saved_views_user_name doubles as the lookup index
+        return (
+            self.db.query(SavedView)
+            .filter(SavedView.user_id == user_id)
+            .order_by(SavedView.name)
+            .all()
+        )
+
+    def get_for_user(self, user_id: UUID, view_id: UUID) -> Optional[SavedView]:
+        return (
+            self.db.query(SavedView)
+            .filter(SavedView.id == view_id, SavedView.user_id == user_id)
+            .first()
+        )
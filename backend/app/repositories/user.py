@@ -1,5 +1,8 @@
 from typing import Optional
 from sqlalchemy.orm import Session
+from sqlalchemy import update
+from uuid import UUID
+from app.core.events import publish
 from app.models.user import User
 from app.repositories.base import BaseRepository
 
@@ -10,11 +13,29 @@ class UserRepository(BaseRepository[User]):
     def get_by_email(self, email: str) -> Optional[User]:
         return self.db.query(User).filter(User.email == email).first()
 
-    def create_user(self, email: str, password_hash: str, full_name: str, locale: str = "en") -> User:
+    def create_user(
+        self, email: str, password_hash: str, full_name: str, locale: str = "en", timezone: str = "UTC"
+    ) -> User:
         user_data = {
             "email": email,
             "password_hash": password_hash,
             "full_name": full_name,
-            "locale": locale
+            "locale": locale,
+            "timezone": timezone
         }
-        return self.create(user_data)
\ No newline at end of file
+        return self.create(user_data)
+
+    def bump_data_version(self, user_id: UUID) -> int:
+        # Not committed: invalidates per-user caches together with the write.
+        # The row lock is held until commit, so per-user versions are handed
+        # out in commit order; writers stamp change_seq with the result.
+        version = self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(data_version=User.data_version + 1)
+            .returning(User.data_version)
+            .execution_options(synchronize_session=False)
+        ).scalar_one()
+        # Live dashboards hear about it once the write commits
+        publish(self.db, user_id, "interviews", version)
+        return version
\ No newline at end of file
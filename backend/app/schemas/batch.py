@@ -0,0 +1,40 @@
+from pydantic import BaseModel, Field, validator
+from typing import Any, List
+
+from app.core.config import settings
+
+class BatchRequestItem(BaseModel):
+    id: str = Field(..., min_length=1, max_length=100)  # Echoed back on the matching response
+    method: str = "GET"
+    path: str = Field(..., max_length=2000)  # Under the API prefix, with any query string, e.g. "/dashboard/summary"
+
+    @validator('method')
+    def method_must_be_get(cls, v):
+        if v.upper() != "GET":
+            raise ValueError("Only GET requests can be batched")
+        return "GET"
+
+    @validator('path')
+    def path_must_be_absolute(cls, v):
+        if not v.startswith("/"):
+            raise ValueError("Path must start with /")
+        return v
+
+class BatchRequest(BaseModel):
+    requests: List[BatchRequestItem] = Field(..., min_length=1)
+
+    @validator('requests')
+    def requests_must_fit(cls, v):
+        if len(v) > settings.BATCH_MAX_REQUESTS:
+            raise ValueError(f"At most {settings.BATCH_MAX_REQUESTS} requests per batch")
+        if len({item.id for item in v}) != len(v):
+            raise ValueError("Request ids must be unique")
+        return v
+
+class BatchResponseItem(BaseModel):
+    id: str
+    status: int
+    body: Any  # The sub-request's JSON body (or text)
+
+class BatchResponse(BaseModel):
+    responses: List[BatchResponseItem]  # In request order
@@ -44,14 +44,50 @@ class GoogleCalendarSyncRequest(BaseModel):
 class GoogleCalendarSyncResponse(BaseModel):
     event_id: str
     calendar_url: str
+    job_id: str
+    status: str
     message: str
 
+class CalendarDeltaSyncResponse(BaseModel):
+    provider: str
+    created: int
+    moved: int
+    deleted: int
+    unchanged: int
+    advanced_to: Optional[str] = None
+
+class ProviderSyncStatus(BaseModel):
+    provider: str
+    total_events: int
+    synced_events: int
+    sync_percentage: float
+    last_synced_at: Optional[str] = None
+
 class CalendarIntegrationStatus(BaseModel):
     total_events: int
     synced_events: int
     google_calendar_connected: bool
     apple_calendar_available: bool
     sync_percentage: float
+    providers: List[ProviderSyncStatus] = []
+
+class ScheduleItem(BaseModel):
+    kind: str
+    id: UUID
+    interview_id: UUID
+    title: str
+    start_time: datetime
+    end_time: datetime
+
+class ScheduleConflict(BaseModel):
+    first: ScheduleItem
+    second: ScheduleItem
+    overlap_minutes: float
+
+class ScheduleConflictsResponse(BaseModel):
+    conflicts: List[ScheduleConflict]
+    total: int
+    days_ahead: int
 
 class CalendarFeedInfo(BaseModel):
     name: str
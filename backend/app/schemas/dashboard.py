@@ -56,3 +56,24 @@ class Analytics(BaseModel):
 class DashboardAnalytics(BaseModel):
     summary: DashboardSummary
     analytics: Optional[Analytics] = None
+
+class FunnelStage(BaseModel):
+    status: str
+    entered: int
+    exited: int
+    median_days_in_stage: Optional[float] = None
+    conversions: Dict[str, float]  # Next status -> % of entries
+
+class Funnel(BaseModel):
+    applications: int
+    offers: int
+    offer_rate: float
+    stages: List[FunnelStage]
+
+class Heatmap(BaseModel):
+    timezone: str
+    days: List[str]  # Row labels, Monday first
+    applications: List[List[int]]  # 7 x 24, local time
+    positive_transitions: List[List[int]]
+    best_performing_day: Optional[str] = None
+    best_performing_hour: Optional[int] = None
\ No newline at end of file
@@ -1,10 +1,12 @@
 from pydantic import BaseModel, Field, validator
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Dict
+from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
 from app.models.interview import ApplicationStatus, WorkMode
+from app.schemas.calendar import ScheduleItem
+from app.utils.tags import normalize_tags
 
 class InterviewBase(BaseModel):
     company_name: str = Field(..., min_length=1, max_length=100)
@@ -24,6 +26,7 @@ class InterviewBase(BaseModel):
     travel_requirements: Optional[str] = Field(None, max_length=500)
     notes: Optional[str] = Field(None, max_length=2000)
     interview_date: Optional[datetime] = None
+    tags: List[str] = Field(default_factory=list, max_length=20)
 
     @validator('salary_range_max')
     def salary_max_must_be_greater_than_min(cls, v, values):
@@ -36,6 +39,10 @@ class InterviewBase(BaseModel):
     def currency_must_be_uppercase(cls, v):
         return v.upper() if v else v
 
+    @validator('tags')
+    def tags_must_be_normalized(cls, v):
+        return normalize_tags(v)
+
 class InterviewCreate(InterviewBase):
     pass
 
@@ -57,14 +64,20 @@ class InterviewUpdate(BaseModel):
     travel_requirements: Optional[str] = Field(None, max_length=500)
     notes: Optional[str] = Field(None, max_length=2000)
     interview_date: Optional[datetime] = None
+    tags: Optional[List[str]] = Field(None, max_length=20)
 
     @validator('currency')
     def currency_must_be_uppercase(cls, v):
         return v.upper() if v else v
 
+    @validator('tags')
+    def tags_must_be_normalized(cls, v):
+        return normalize_tags(v) if v is not None else v
+
 class InterviewInDB(InterviewBase):
     id: UUID
     user_id: UUID
+    board_rank: str
     created_at: datetime
     updated_at: datetime
     
@@ -74,11 +87,132 @@ class InterviewInDB(InterviewBase):
 class Interview(InterviewInDB):
     pass
 
+class DuplicateCandidate(BaseModel):
+    interview_id: UUID
+    company_name: str
+    role_title: str
+    similarity: Optional[float] = None  # Role similarity (0..1) to the interview being written
+
+class DuplicateGroup(BaseModel):
+    company_name: str
+    interviews: List[DuplicateCandidate]
+
+class InterviewWithConflicts(Interview):
+    # Interviews/events overlapping this interview's slot, reported on write
+    conflicts: List[ScheduleItem] = []
+    # Existing interviews that look like the same application, reported on create
+    duplicates: List[DuplicateCandidate] = []
+
+class SalaryBenchmark(BaseModel):
+    interview_id: UUID
+    role_key: str
+    location_key: str  # "*" when only a role-wide benchmark exists
+    currency: str
+    sample_size: int
+    p25: float
+    p50: float
+    p75: float
+    p90: float
+    offer_midpoint: Optional[float] = None
+    computed_at: Optional[datetime] = None
+
+class BoardCard(BaseModel):
+    id: UUID
+    company_name: str
+    role_title: str
+    work_mode: WorkMode
+    location: Optional[str] = None
+    application_status: Optional[ApplicationStatus] = None
+    interview_date: Optional[datetime] = None
+    board_rank: str
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+class InterviewTagsUpdate(BaseModel):
+    interview_ids: List[UUID] = Field(..., min_length=1, max_length=1000)
+    add: List[str] = []
+    remove: List[str] = []
+
+    @validator('add', 'remove')
+    def tags_must_be_normalized(cls, v):
+        return normalize_tags(v)
+
+class InterviewTagsResult(BaseModel):
+    updated: int
+
+class CompanySuggestion(BaseModel):
+    company_name: str
+    interviews: int
+
+class InterviewMove(BaseModel):
+    # Target column (defaults to the current one) and the cards the moved
+    # card should sit between; omit both to drop it at the top
+    application_status: Optional[ApplicationStatus] = None
+    before_id: Optional[UUID] = None
+    after_id: Optional[UUID] = None
+
+class BoardColumn(BaseModel):
+    status: str
+    total: int
+    cards: List[BoardCard]
+    next_cursor: Optional[str] = None  # Pass to /interviews/board/{column} for more
+
+class Board(BaseModel):
+    columns: List[BoardColumn]
+
 class InterviewsResponse(BaseModel):
     interviews: List[Interview]
     total: int
     skip: int
     limit: int
+    # facet -> value -> matching interviews, when ?facets= is given
+    facets: Optional[Dict[str, Dict[str, int]]] = None
+
+class InterviewChanges(BaseModel):
+    changes: List[Interview]  # Created or updated since the cursor, oldest write first
+    deleted: List[UUID]
+    cursor: str  # Pass back as ?since= on the next poll
+    has_more: bool
+
+class InterviewFilters(BaseModel):
+    # Same filters as GET /interviews; stored normalized so equal specs compare equal
+    status: Optional[ApplicationStatus] = None
+    company: Optional[str] = Field(None, max_length=100)
+    from_date: Optional[date] = None
+    to_date: Optional[date] = None
+    tags_any: List[str] = []
+    tags_all: List[str] = []
+
+    @validator('company')
+    def company_must_be_trimmed(cls, v):
+        return v.strip() or None if v else None
+
+    @validator('tags_any', 'tags_all')
+    def tags_must_be_normalized(cls, v):
+        return sorted(normalize_tags(v))
+
+class SavedViewCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    filters: InterviewFilters = InterviewFilters()
+
+class SavedViewUpdate(BaseModel):
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    filters: Optional[InterviewFilters] = None
+
+class SavedView(BaseModel):
+    id: UUID
+    name: str
+    filters: InterviewFilters
+    count: int  # Interviews matching the filters right now
+    created_at: datetime
+    updated_at: datetime
+
+class SavedViewPage(BaseModel):
+    view: SavedView
+    interviews: List[Interview]
+    limit: int
 
 # Status and mode enums for frontend
 class InterviewStatusInfo(BaseModel):
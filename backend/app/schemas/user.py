@@ -1,12 +1,24 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, validator
 from typing import Optional
 from datetime import datetime
 import uuid
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+def _check_timezone(v: Optional[str]) -> Optional[str]:
+    if v is not None:
+        try:
+            ZoneInfo(v)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError('timezone must be an IANA name such as Europe/Madrid')
+    return v
 
 class UserBase(BaseModel):
     email: EmailStr
     full_name: str
     locale: Optional[str] = "en"
+    timezone: Optional[str] = "UTC"
+    
+    _timezone = validator('timezone', allow_reuse=True)(_check_timezone)
 
 class UserCreate(UserBase):
     password: str
@@ -14,6 +26,9 @@ class UserCreate(UserBase):
 class UserUpdate(BaseModel):
     full_name: Optional[str] = None
     locale: Optional[str] = None
+    timezone: Optional[str] = None
+    
+    _timezone = validator('timezone', allow_reuse=True)(_check_timezone)
 
 class UserInDB(UserBase):
     id: uuid.UUID
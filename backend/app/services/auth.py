@@ -28,6 +28,7 @@ class AuthService:
             email=user_in.email,
             password_hash=password_hash,
             full_name=user_in.full_name,
-            locale=user_in.locale or "en"
+            locale=user_in.locale or "en",
+            timezone=user_in.timezone or "UTC"
         )
         return user
\ No newline at end of file
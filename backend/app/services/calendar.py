@@ -1,20 +1,51 @@
-from typing import List, Optional, Dict, Any
-from uuid import UUID
-from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple, Set, BinaryIO
+from collections import Counter
+from uuid import UUID, uuid4
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 from io import StringIO
+import re
 
+from app.core.config import settings
+from app.core.events import publish
 from app.models.user import User
-from app.models.interview import Interview
+from app.models.interview import Interview, ApplicationStatus, WorkMode
 from app.models.calendar_event import CalendarEvent
 from app.repositories.calendar_event import CalendarEventRepository
+from app.repositories.calendar_sync_cursor import CalendarSyncCursorRepository
+from app.repositories.calendar_sync_job import CalendarSyncJobRepository
+from app.repositories.cohort import CohortRepository
+from app.repositories.daily_activity import DailyActivityRepository
+from app.repositories.funnel import FunnelRepository
 from app.repositories.interview import InterviewRepository
+from app.repositories.interview_signature import InterviewSignatureRepository, signature_row
+from app.repositories.user import UserRepository
+from app.services.calendar_providers import GoogleCalendarProvider
+from app.utils.cohorts import week_start
+from app.utils.ics import IcsEvent, iter_events, parse_datetime, parse_duration, read_chunks, unescape_text
+from app.utils.duplicates import similarity
+from app.utils.intervals import find_overlaps
+from app.utils.ranks import ranks_between
+
+JOBSIFT_UID_RE = re.compile(r"^interview-([0-9a-f-]{36})@jobsift\.com$")
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; stored values are UTC
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
 
 class CalendarService:
     def __init__(self, db: Session):
         self.db = db
         self.calendar_repo = CalendarEventRepository(db)
         self.interview_repo = InterviewRepository(db)
+        self.sync_job_repo = CalendarSyncJobRepository(db)
+        self.cursor_repo = CalendarSyncCursorRepository(db)
+        self.funnel_repo = FunnelRepository(db)
+        self.activity_repo = DailyActivityRepository(db)
+        self.signature_repo = InterviewSignatureRepository(db)
+        self.cohort_repo = CohortRepository(db)
+        self.user_repo = UserRepository(db)
+        self.interview_duration = timedelta(minutes=settings.DEFAULT_INTERVIEW_DURATION_MINUTES)
 
     def create_calendar_event(
         self,
@@ -27,15 +58,18 @@ class CalendarService:
         if not interview or interview.user_id != user.id:
             raise ValueError("Interview not found or access denied")
 
+        publish(self.db, user.id, "calendar")
         return self.calendar_repo.create_calendar_event(
             interview_id=interview_id,
+            user_id=user.id,
             **event_details
         )
 
     def sync_with_google_calendar(self, user: User, interview_id: UUID) -> Dict[str, str]:
         """
-        Sync interview with Google Calendar (Mock implementation)
-        In production, this would use Google Calendar API
+        Queue an interview for Google Calendar sync.
+        The calendar event and its outbox job are committed together; the
+        external call happens in the calendar sync worker.
         """
         interview = self.interview_repo.get_by_id(interview_id)
         if not interview or interview.user_id != user.id:
@@ -44,11 +78,91 @@ class CalendarService:
         if not interview.interview_date:
             raise ValueError("Interview date is required for calendar sync")
 
-        # Mock Google Calendar sync
-        mock_event_id = f"google_event_{interview_id}"
-        mock_calendar_url = f"https://calendar.google.com/calendar/event?eid={mock_event_id}"
+        existing = self.calendar_repo.get_by_interview_and_provider(interview_id, "google")
+        calendar_event, _ = self._stage_provider_event(interview, "google", existing, force=True)
+        job = self.sync_job_repo.enqueue_upsert(user.id, calendar_event)
+        publish(self.db, user.id, "calendar")
+        self.db.commit()
+
+        return {
+            "event_id": str(calendar_event.id),
+            "calendar_url": GoogleCalendarProvider.event_url(GoogleCalendarProvider.external_event_id(calendar_event)),
+            "job_id": str(job.id),
+            "status": "queued",
+            "message": "Interview queued for Google Calendar sync"
+        }
+
+    def delta_sync(self, user: User, provider: str) -> Dict[str, Any]:
+        """
+        Push only what changed since the user's cursor for this provider:
+        interviews created or moved, unsynced events and deletions (tombstones).
+        The read starts CALENDAR_SYNC_CURSOR_OVERLAP_SECONDS before the cursor
+        so writes that committed late are not lost; rows seen before are
+        deduped by id and by comparing against what was last pushed.
+        """
+        cursor = self.cursor_repo.get_cursor(user.id, provider)
+        synced_until = _as_utc(cursor.synced_until) if cursor else None
+        overlap = timedelta(seconds=settings.CALENDAR_SYNC_CURSOR_OVERLAP_SECONDS)
+        changes = self.cursor_repo.get_changes_since(
+            user.id, provider, synced_until - overlap if synced_until else None
+        )
+        result = {
+            "provider": provider,
+            "created": 0,
+            "moved": 0,
+            "deleted": 0,
+            "unchanged": 0,
+            "advanced_to": None
+        }
+        if not changes:
+            return result
 
-        # Create calendar event record
+        upsert_ids = {c.interview_id for c in changes if c.kind == "upsert"}
+        
+        interviews = self.interview_repo.get_by_ids(list(upsert_ids))
+        existing_events = {
+            event.interview_id: event
+            for event in self.calendar_repo.get_by_interview_ids_and_provider(list(upsert_ids), provider)
+        }
+        
+        for interview in interviews:
+            if not interview.interview_date:
+                continue
+            existing = existing_events.get(interview.id)
+            calendar_event, changed = self._stage_provider_event(interview, provider, existing)
+            if not changed:
+                result["unchanged"] += 1
+                continue
+            self.sync_job_repo.enqueue_upsert(user.id, calendar_event)
+            result["created" if existing is None else "moved"] += 1
+        
+        # Remote copies of deleted interviews are queued for removal in the
+        # same transaction that writes the tombstone; here they only move the cursor
+        result["deleted"] = len({
+            c.interview_id for c in changes
+            if c.kind == "delete" and (synced_until is None or _as_utc(c.changed_at) > synced_until)
+        })
+        
+        latest = max(changes, key=lambda c: _as_utc(c.changed_at)).changed_at
+        if synced_until is None or _as_utc(latest) > synced_until:
+            self.cursor_repo.advance(user.id, provider, latest)
+            result["advanced_to"] = latest.isoformat()
+        if result["created"] or result["moved"]:
+            publish(self.db, user.id, "calendar")
+        self.db.commit()
+        return result
+
+    def _stage_provider_event(
+        self,
+        interview: Interview,
+        provider: str,
+        existing: Optional[CalendarEvent],
+        force: bool = False
+    ) -> Tuple[CalendarEvent, bool]:
+        """Create or refresh the provider's event for an interview (not committed).
+
+        Returns the event and whether it differs from what was last pushed.
+        """
         event_title = f"Interview: {interview.role_title} at {interview.company_name}"
         event_description = f"""
 Interview Details:
@@ -59,22 +173,37 @@ Interview Details:
 - Notes: {interview.notes or 'No additional notes'}
         """.strip()
 
-        calendar_event = self.calendar_repo.create_calendar_event(
-            interview_id=interview_id,
-            calendar_provider="google",
-            event_title=event_title,
-            event_description=event_description,
-            start_time=interview.interview_date,
-            end_time=interview.interview_date + timedelta(hours=1),
-            external_event_id=mock_event_id,
-            is_synced=True
+        if existing is None:
+            calendar_event = CalendarEvent(
+                interview_id=interview.id,
+                user_id=interview.user_id,
+                calendar_provider=provider,
+                event_title=event_title,
+                event_description=event_description,
+                start_time=interview.interview_date,
+                end_time=interview.interview_date + self.interview_duration,
+                is_synced=False
+            )
+            self.db.add(calendar_event)
+            self.db.flush()
+            return calendar_event, True
+
+        unchanged = (
+            existing.is_synced
+            and existing.start_time == interview.interview_date
+            and existing.event_title == event_title
+            and existing.event_description == event_description
         )
+        if unchanged and not force:
+            return existing, False
 
-        return {
-            "event_id": mock_event_id,
-            "calendar_url": mock_calendar_url,
-            "message": "Interview synced with Google Calendar (Mock)"
-        }
+        duration = existing.end_time - existing.start_time
+        existing.event_title = event_title
+        existing.event_description = event_description
+        existing.start_time = interview.interview_date
+        existing.end_time = interview.interview_date + duration
+        existing.is_synced = False
+        return existing, True
 
     def generate_ics_feed(self, user: User, days_ahead: int = 90) -> str:
         """Generate ICS calendar feed for user's interviews"""
@@ -104,7 +233,7 @@ Interview Details:
         
         # Format dates for ICS (UTC)
         start_time = interview.interview_date.strftime("%Y%m%dT%H%M%SZ")
-        end_time = (interview.interview_date + timedelta(hours=1)).strftime("%Y%m%dT%H%M%SZ")
+        end_time = (interview.interview_date + self.interview_duration).strftime("%Y%m%dT%H%M%SZ")
         created_time = interview.created_at.strftime("%Y%m%dT%H%M%SZ")
         
         # Event summary and description
@@ -134,6 +263,195 @@ Notes: {interview.notes or 'No additional notes'}"""
         ics_content.write("CATEGORIES:INTERVIEW,JOBSEARCH\r\n")
         ics_content.write("END:VEVENT\r\n")
 
+    def import_ics(self, user: User, stream: BinaryIO, only_interviews: bool = True) -> Dict[str, int]:
+        """
+        Import VEVENTs from an uploaded ICS file as interviews with "ics"
+        calendar events. The file is parsed incrementally and written in
+        batched inserts inside a single transaction; UIDs are deduplicated
+        against earlier imports, JobSift's own export and the file itself.
+        """
+        result = {"imported": 0, "duplicates": 0, "possible_duplicates": 0, "skipped": 0}
+        seen_uids: Set[str] = set()
+        batch: List[Dict[str, Any]] = []
+
+        try:
+            chunks = read_chunks(stream, settings.ICS_IMPORT_MAX_BYTES)
+            for event in iter_events(chunks):
+                mapped = self._map_ics_event(event, only_interviews)
+                if mapped is None:
+                    result["skipped"] += 1
+                    continue
+                if mapped["uid"] in seen_uids:
+                    result["duplicates"] += 1
+                    continue
+                seen_uids.add(mapped["uid"])
+                batch.append(mapped)
+                if len(batch) >= settings.ICS_IMPORT_BATCH_SIZE:
+                    self._insert_ics_batch(user, batch, result)
+                    batch = []
+            self._insert_ics_batch(user, batch, result)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return result
+
+    def _map_ics_event(self, event: IcsEvent, only_interviews: bool) -> Optional[Dict[str, Any]]:
+        if "UID" not in event or "DTSTART" not in event:
+            return None
+
+        summary = unescape_text(event.get("SUMMARY", ({}, ""))[1]).strip()
+        categories = event.get("CATEGORIES", ({}, ""))[1]
+        if only_interviews and "interview" not in f"{summary} {categories}".lower():
+            return None
+
+        try:
+            start_time = parse_datetime(event["DTSTART"])
+            if "DTEND" in event:
+                end_time = parse_datetime(event["DTEND"])
+            elif "DURATION" in event:
+                end_time = start_time + parse_duration(event["DURATION"][1])
+            else:
+                end_time = start_time + self.interview_duration
+        except ValueError:
+            return None
+
+        role_title, company_name = self._split_ics_summary(summary)
+        location = unescape_text(event.get("LOCATION", ({}, ""))[1]).strip() or None
+        description = unescape_text(event.get("DESCRIPTION", ({}, ""))[1]).strip() or None
+
+        return {
+            "uid": event["UID"][1].strip()[:255],
+            "summary": (summary or "Interview")[:200],
+            "description": description,
+            "role_title": role_title[:100],
+            "company_name": company_name[:100],
+            "location": location[:100] if location else None,
+            "work_mode": self._guess_work_mode(location),
+            "start_time": start_time,
+            "end_time": max(end_time, start_time)
+        }
+
+    def _split_ics_summary(self, summary: str) -> Tuple[str, str]:
+        """'Interview: Backend Engineer at Acme' -> ('Backend Engineer', 'Acme')"""
+        text = re.sub(r"^\s*interview\s*(with|:|-)?\s*", "", summary, flags=re.IGNORECASE)
+        if " at " in text:
+            role_title, company_name = text.rsplit(" at ", 1)
+            if role_title.strip() and company_name.strip():
+                return role_title.strip(), company_name.strip()
+        return "Interview", text.strip() or "Unknown company"
+
+    def _guess_work_mode(self, location: Optional[str]) -> WorkMode:
+        if not location:
+            return WorkMode.REMOTE
+        lowered = location.lower()
+        if any(hint in lowered for hint in ("http", "zoom", "meet.google", "teams", "remote", "online")):
+            return WorkMode.REMOTE
+        return WorkMode.ONSITE
+
+    def _insert_ics_batch(self, user: User, batch: List[Dict[str, Any]], result: Dict[str, int]) -> None:
+        if not batch:
+            return
+
+        uids = [item["uid"] for item in batch]
+        existing = self.calendar_repo.get_existing_external_ids(user.id, "ics", uids)
+        # Events exported by JobSift itself carry interview-<id>@jobsift.com UIDs
+        own_ids = {
+            match.group(1): uid for uid in uids
+            if (match := JOBSIFT_UID_RE.match(uid))
+        }
+        if own_ids:
+            existing |= {
+                own_ids[str(interview.id)]
+                for interview in self.interview_repo.get_by_ids([UUID(i) for i in own_ids])
+                if interview.user_id == user.id
+            }
+
+        interview_rows = []
+        event_rows = []
+        for item in batch:
+            if item["uid"] in existing:
+                result["duplicates"] += 1
+                continue
+            interview_id = uuid4()
+            interview_rows.append({
+                "id": interview_id,
+                "user_id": user.id,
+                "company_name": item["company_name"],
+                "role_title": item["role_title"],
+                "work_mode": item["work_mode"],
+                "location": item["location"],
+                "notes": item["description"][:2000] if item["description"] else None,
+                "interview_date": item["start_time"]
+            })
+            event_rows.append({
+                "id": uuid4(),
+                "interview_id": interview_id,
+                "user_id": user.id,
+                "external_event_id": item["uid"],
+                "calendar_provider": "ics",
+                "event_title": item["summary"],
+                "event_description": item["description"],
+                "start_time": item["start_time"],
+                "end_time": item["end_time"],
+                "is_synced": True
+            })
+
+        # Imported cards go on top of the Applied column, in file order
+        ranks = ranks_between(
+            None,
+            self.interview_repo.get_adjacent_rank(user.id, ApplicationStatus.APPLIED),
+            len(interview_rows)
+        ) if interview_rows else []
+        for row, board_rank in zip(interview_rows, ranks):
+            row["board_rank"] = board_rank
+
+        signature_rows = [
+            signature_row(user.id, row["id"], row["company_name"], row["role_title"]) for row in interview_rows
+        ]
+        result["possible_duplicates"] += self._count_possible_duplicates(user, signature_rows)
+
+        if interview_rows:
+            change_seq = self.user_repo.bump_data_version(user.id)
+            for row in interview_rows:
+                row["change_seq"] = change_seq
+
+        self.interview_repo.bulk_insert(interview_rows)
+        self.calendar_repo.bulk_insert(event_rows)
+        self.signature_repo.bulk_insert(signature_rows)
+        self.funnel_repo.record_entries(
+            user.id, [(row["id"], ApplicationStatus.APPLIED) for row in interview_rows]
+        )
+        self.activity_repo.record_applications(
+            user.id,
+            datetime.now(timezone.utc).date(),
+            Counter(row["company_name"] for row in interview_rows),
+            last_status=ApplicationStatus.APPLIED
+        )
+        this_week = week_start(datetime.now(timezone.utc))
+        self.cohort_repo.mark_dirty({(row["work_mode"].value, this_week) for row in interview_rows})
+        result["imported"] += len(interview_rows)
+
+    def _count_possible_duplicates(self, user: User, signature_rows: List[Dict[str, Any]]) -> int:
+        # New rows resembling an existing interview or an earlier row of the
+        # import; one indexed lookup for the whole batch
+        if not signature_rows:
+            return 0
+        known: Dict[str, Set[str]] = {}
+        for row in self.signature_repo.get_by_company_keys(user.id, {row["company_key"] for row in signature_rows}):
+            known.setdefault(row.company_key, set()).add(row.role_key)
+
+        count = 0
+        for row in signature_rows:
+            roles = known.setdefault(row["company_key"], set())
+            if row["role_key"] in roles or any(
+                similarity(row["role_key"], role) >= settings.DUPLICATE_SIMILARITY_THRESHOLD for role in roles
+            ):
+                count += 1
+            roles.add(row["role_key"])
+        return count
+
     def _escape_ics_text(self, text: str) -> str:
         """Escape special characters in ICS text fields"""
         if not text:
@@ -167,22 +485,53 @@ Notes: {interview.notes or 'No additional notes'}"""
         if not interview or interview.user_id != user.id:
             return False
         
-        # In production, this would also delete from external calendar
-        # For now, just delete from our database
+        # The remote copy is removed by the sync worker; the outbox job commits
+        # together with the local delete
+        self.sync_job_repo.enqueue_delete(user.id, event)
+        publish(self.db, user.id, "calendar")
         return self.calendar_repo.delete(event_id)
 
+    def get_schedule_conflicts(self, user: User, days_ahead: int = 30) -> List[Dict[str, Any]]:
+        """Overlapping interviews/events in the next days_ahead days"""
+        window_start = datetime.now(timezone.utc)
+        window_end = window_start + timedelta(days=days_ahead)
+        intervals = self.calendar_repo.get_schedule_intervals(
+            user.id, window_start, window_end, self.interview_duration
+        )
+        
+        conflicts = []
+        for first, second in find_overlaps(intervals):
+            overlap = min(first.end_time, second.end_time) - max(first.start_time, second.start_time)
+            conflicts.append({
+                "first": first._asdict(),
+                "second": second._asdict(),
+                "overlap_minutes": overlap.total_seconds() / 60
+            })
+        return conflicts
+
     def get_calendar_integration_status(self, user: User) -> Dict[str, Any]:
         """Get status of calendar integrations for user"""
-        # Count synced events
-        events = self.calendar_repo.get_upcoming_events(user.id, 365)  # Next year
+        # One grouped aggregate over the next year; no events are loaded
+        stats = self.calendar_repo.get_sync_stats_by_provider(user.id, 365)
+        
+        providers = []
+        for row in stats:
+            providers.append({
+                "provider": row.provider,
+                "total_events": row.total_events,
+                "synced_events": row.synced_events,
+                "sync_percentage": (row.synced_events / max(row.total_events, 1)) * 100,
+                "last_synced_at": row.last_synced_at.isoformat() if row.last_synced_at else None
+            })
         
-        synced_count = len([e for e in events if e.is_synced])
-        total_count = len(events)
+        synced_count = sum(p["synced_events"] for p in providers)
+        total_count = sum(p["total_events"] for p in providers)
         
         return {
             "total_events": total_count,
             "synced_events": synced_count,
             "google_calendar_connected": False,  # Mock - would check OAuth status
             "apple_calendar_available": True,    # ICS feed is always available
-            "sync_percentage": (synced_count / max(total_count, 1)) * 100
+            "sync_percentage": (synced_count / max(total_count, 1)) * 100,
+            "providers": providers
         }
@@ -0,0 +1,60 @@
+from typing import Dict, List
+from uuid import UUID
+
+from app.models.calendar_event import CalendarEvent
+
+class CalendarProviderError(Exception):
+    """Raised by a provider when a batch could not be delivered"""
+
+class CalendarProvider:
+    name: str = ""
+
+    def push_events(self, events: List[CalendarEvent]) -> Dict[UUID, str]:
+        """Create or update events remotely, returning local id -> external id"""
+        raise NotImplementedError
+
+    def delete_events(self, external_event_ids: List[str]) -> None:
+        raise NotImplementedError
+
+class GoogleCalendarProvider(CalendarProvider):
+    """
+    Google Calendar client (Mock implementation)
+    In production, this would batch requests through the Google Calendar API
+    """
+    name = "google"
+
+    def push_events(self, events: List[CalendarEvent]) -> Dict[UUID, str]:
+        return {event.id: self.external_event_id(event) for event in events}
+
+    @staticmethod
+    def external_event_id(event: CalendarEvent) -> str:
+        """The id the event has (or will get once pushed) in Google Calendar"""
+        return event.external_event_id or f"google_event_{event.interview_id}"
+
+    def delete_events(self, external_event_ids: List[str]) -> None:
+        return None
+
+    @staticmethod
+    def event_url(external_event_id: str) -> str:
+        return f"https://calendar.google.com/calendar/event?eid={external_event_id}"
+
+class IcsImportProvider(CalendarProvider):
+    """Events imported from an ICS file; the file is the source, nothing to push"""
+    name = "ics"
+
+    def push_events(self, events: List[CalendarEvent]) -> Dict[UUID, str]:
+        return {event.id: event.external_event_id for event in events if event.external_event_id}
+
+    def delete_events(self, external_event_ids: List[str]) -> None:
+        return None
+
+PROVIDERS: Dict[str, CalendarProvider] = {
+    GoogleCalendarProvider.name: GoogleCalendarProvider(),
+    IcsImportProvider.name: IcsImportProvider(),
+}
+
+def get_provider(name: str) -> CalendarProvider:
+    provider = PROVIDERS.get(name)
+    if provider is None:
+        raise CalendarProviderError(f"Unsupported calendar provider: {name}")
+    return provider
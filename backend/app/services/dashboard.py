@@ -1,30 +1,63 @@
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Any, Optional
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import calendar
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from app.core.cache import cache
+from app.core.config import settings
+from app.models.interview import ApplicationStatus, REACHED_INTERVIEW
 from app.models.user import User
+from app.repositories.cohort import CohortRepository
+from app.repositories.daily_activity import DailyActivityRepository
+from app.repositories.funnel import FunnelRepository
 from app.services.interview import InterviewService
 
+# Calendar window pushed by GET /dashboard/stream
+LIVE_CALENDAR_DAYS = 7
+
 class DashboardService:
     def __init__(self, db: Session):
         self.db = db
         self.interview_service = InterviewService(db)
+        self.activity_repo = DailyActivityRepository(db)
+        self.cohort_repo = CohortRepository(db)
+        self.funnel_repo = FunnelRepository(db)
 
     def get_dashboard_summary(self, user: User) -> Dict[str, Any]:
-        # Get basic interview statistics
-        stats = self.interview_service.get_user_interview_statistics(user)
+        now = datetime.now(timezone.utc)
+        upcoming_until = now.replace(hour=23, minute=59, second=59) + timedelta(days=7)
         
-        # Get upcoming interviews (next 7 days)
-        upcoming = self.interview_service.get_upcoming_interviews(user, 7)
+        # Counts, weekly count and both timelines in one round trip
+        rows = self.interview_service.interview_repo.get_dashboard_rows(
+            user.id, week_ago=now - timedelta(days=7), now=now, upcoming_until=upcoming_until, top_n=5
+        )
         
-        # Get recent activity (last 10 updates)
-        recent_activity = self.interview_service.get_recent_activity(user, 10)
+        status_counts = {status.value: 0 for status in ApplicationStatus}
+        mode_funnel: Dict[str, Dict[str, int]] = {}
+        this_week = 0
+        upcoming_count = 0
+        upcoming = []
+        recent_activity = []
+        for row in rows:
+            if row.kind == "upcoming":
+                upcoming.append(row)
+            elif row.kind == "recent":
+                recent_activity.append(row)
+            else:
+                status = (row.application_status or ApplicationStatus.APPLIED)
+                status_counts[status.value] += row.total
+                this_week += row.this_week
+                upcoming_count += row.upcoming
+                mode = mode_funnel.setdefault(row.work_mode.value, {"applications": 0, "interviews": 0})
+                mode["applications"] += row.total
+                if status in REACHED_INTERVIEW:
+                    mode["interviews"] += row.total
+        upcoming.sort(key=lambda row: row.interview_date)
+        recent_activity.sort(key=lambda row: row.updated_at, reverse=True)
         
-        # Calculate weekly activity
-        week_ago = datetime.now() - timedelta(days=7)
-        recent_interviews = self.interview_service.get_user_interviews(
-            user, from_date=week_ago.date(), limit=100
-        )
+        stats = self.interview_service.get_user_interview_statistics(user, status_counts)
+        stats["upcoming_count"] = upcoming_count
         
         # Group status counts for chart data
         status_chart_data = []
@@ -37,7 +70,7 @@ class DashboardService:
         
         # Create timeline data for upcoming interviews
         upcoming_timeline = []
-        for interview in upcoming[:5]:  # Limit to 5 most recent
+        for interview in upcoming:
             upcoming_timeline.append({
                 "id": str(interview.id),
                 "company_name": interview.company_name,
@@ -48,7 +81,7 @@ class DashboardService:
         
         # Recent activity timeline
         activity_timeline = []
-        for interview in recent_activity[:5]:
+        for interview in recent_activity:
             activity_timeline.append({
                 "id": str(interview.id),
                 "company_name": interview.company_name,
@@ -62,15 +95,121 @@ class DashboardService:
                 "total_interviews": stats["total_interviews"],
                 "conversion_rate": stats["conversion_rate"],
                 "success_rate": stats["success_rate"],
-                "this_week_applications": len(recent_interviews)
+                "this_week_applications": this_week
             },
             "status_distribution": status_chart_data,
             "upcoming_interviews": upcoming_timeline,
             "recent_activity": activity_timeline,
-            "insights": self._generate_insights(stats, upcoming, recent_activity)
+            "insights": self._generate_insights(stats, upcoming, recent_activity, mode_funnel)
+        }
+
+    def get_live_snapshot(self, user: User, topics: Iterable[str]) -> Dict[str, Any]:
+        """
+        The parts of the live dashboard that ``topics`` can change: interview
+        writes touch the summary and the calendar, calendar writes only the calendar
+        """
+        snapshot: Dict[str, Any] = {}
+        if "interviews" in topics:
+            snapshot.update(self.get_dashboard_summary(user))
+        if "interviews" in topics or "calendar" in topics:
+            snapshot["calendar_events"] = [
+                {
+                    "id": str(event.id),
+                    "interview_id": str(event.interview_id),
+                    "event_title": event.event_title,
+                    "start_time": event.start_time.isoformat(),
+                    "end_time": event.end_time.isoformat()
+                }
+                for event in self.interview_service.calendar_repo.get_upcoming_events(user.id, LIVE_CALENDAR_DAYS)
+            ]
+        return snapshot
+
+    def get_analytics(self, user: User, months: int = 12) -> Dict[str, Any]:
+        """Monthly trends, top companies and response metrics from the daily rollup"""
+        today = datetime.now(timezone.utc).date()
+        year, month = divmod(today.year * 12 + today.month - 1 - (months - 1), 12)
+        first_month = today.replace(year=year, month=month + 1, day=1)
+        
+        # At most one row per active day; month and weekday buckets are folded here
+        daily = self.activity_repo.get_daily_totals(user.id, first_month)
+        
+        monthly: Dict[str, Dict[str, Any]] = {}
+        responses = 0
+        response_days_total = 0.0
+        for row in daily:
+            month = row.day.strftime("%Y-%m")
+            bucket = monthly.setdefault(month, {"month": month, "applications": 0, "interviews": 0, "offers": 0})
+            bucket["applications"] += row.applications or 0
+            bucket["interviews"] += row.interviews or 0
+            bucket["offers"] += row.offers or 0
+            responses += row.responses or 0
+            response_days_total += row.response_days_total or 0.0
+        
+        top_companies = [
+            {
+                "company_name": row.company_name,
+                "total_applications": row.total_applications,
+                "current_status": row.current_status.value if row.current_status else "APPLIED",
+                "last_activity": row.last_activity
+            }
+            for row in self.activity_repo.get_company_stats(user.id, limit=10)
+        ]
+        
+        return {
+            "monthly_trends": sorted(monthly.values(), key=lambda m: m["month"]),
+            "top_companies": top_companies,
+            "average_time_to_response": round(response_days_total / responses, 2) if responses else None,
+            "best_performing_day": self.get_heatmap(user)["best_performing_day"]
         }
 
-    def _generate_insights(self, stats: Dict, upcoming: List, recent: List) -> List[str]:
+    def get_heatmap(self, user: User, tz: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Applications and forward status moves by weekday x hour in the user's
+        timezone. SQL groups on the indexed 15-minute UTC slot; each slot is
+        converted with the zone's offset at that instant, so history on both
+        sides of a DST change and half-hour zones land in the right local
+        hour. Cached until the next write.
+        """
+        tz_name = tz or user.timezone or "UTC"
+        try:
+            zone = ZoneInfo(tz_name)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone: {tz_name}")
+        
+        key = ("heatmap", user.id, tz_name)
+        heatmap = cache.get(key, user.data_version)
+        if heatmap is not None:
+            return heatmap
+        
+        applications = self._week_matrix(self.interview_service.interview_repo.get_quarter_hour_counts(user.id), zone)
+        transitions = self._week_matrix(self.funnel_repo.get_advancing_quarter_hour_counts(user.id), zone)
+        
+        by_day = [sum(hours) for hours in transitions]
+        by_hour = [sum(day[hour] for day in transitions) for hour in range(24)]
+        heatmap = {
+            "timezone": tz_name,
+            "days": list(calendar.day_name),
+            "applications": applications,
+            "positive_transitions": transitions,
+            "best_performing_day": calendar.day_name[by_day.index(max(by_day))] if max(by_day) else None,
+            "best_performing_hour": by_hour.index(max(by_hour)) if max(by_hour) else None
+        }
+        cache.set(key, user.data_version, heatmap)
+        return heatmap
+
+    def _week_matrix(self, counts: Dict[int, int], zone: ZoneInfo) -> List[List[int]]:
+        # 15-minute UTC slot -> local [Monday..Sunday][hour]
+        matrix = [[0] * 24 for _ in range(7)]
+        for slot, count in counts.items():
+            if slot is None:
+                continue
+            local = datetime.fromtimestamp(int(slot) * 900, zone)
+            matrix[local.weekday()][local.hour] += count
+        return matrix
+
+    def _generate_insights(
+        self, stats: Dict, upcoming: List, recent: List, mode_funnel: Optional[Dict[str, Dict[str, int]]] = None
+    ) -> List[str]:
         insights = []
         
         # Conversion rate insights
@@ -82,8 +221,9 @@ class DashboardService:
             insights.append("💪 Keep applying! Your perfect role is out there.")
         
         # Upcoming interviews
-        if len(upcoming) > 0:
-            insights.append(f"📅 You have {len(upcoming)} upcoming interviews this week!")
+        upcoming_count = stats.get("upcoming_count", len(upcoming))
+        if upcoming_count > 0:
+            insights.append(f"📅 You have {upcoming_count} upcoming interviews this week!")
         
         # Activity insights
         if len(recent) > 3:
@@ -94,7 +234,40 @@ class DashboardService:
         if applied_count > 10:
             insights.append("📊 Great job staying active with applications!")
         
+        # Work mode comparison against the precomputed cohort benchmarks
+        if mode_funnel:
+            insights.extend(self._cohort_insights(mode_funnel))
+        
         if not insights:
             insights.append("🚀 Ready to track your next interview? Click 'New Interview' to get started!")
         
         return insights
+
+    def _cohort_insights(self, mode_funnel: Dict[str, Dict[str, int]]) -> List[str]:
+        benchmarks = self.cohort_repo.get_trailing()
+        if not benchmarks:
+            return []
+        
+        insights = []
+        for work_mode, counts in mode_funnel.items():
+            benchmark = benchmarks.get(work_mode)
+            if (
+                benchmark is None
+                or benchmark.users < settings.COHORT_BENCHMARK_MIN_USERS
+                or counts["applications"] < 5
+            ):
+                continue
+            
+            rate = counts["interviews"] / counts["applications"] * 100
+            mode = work_mode.lower()
+            if rate >= benchmark.interview_rate + 5:
+                insights.append(
+                    f"📈 Your {mode} applications reach interviews {rate:.0f}% of the time "
+                    f"vs {benchmark.interview_rate:.0f}% on average."
+                )
+            elif rate <= benchmark.interview_rate - 5:
+                insights.append(
+                    f"📉 Your {mode} applications reach interviews {rate:.0f}% of the time "
+                    f"vs {benchmark.interview_rate:.0f}% on average. Consider tailoring them further."
+                )
+        return insights
\ No newline at end of file
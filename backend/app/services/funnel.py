@@ -0,0 +1,74 @@
+from typing import Dict, List, Any, Optional
+from collections import defaultdict
+from sqlalchemy.orm import Session
+
+from app.models.interview import ApplicationStatus
+from app.models.user import User
+from app.repositories.funnel import FUNNEL_ENTRY, FUNNEL_REACHED, DURATION_BUCKET_BOUNDS, FunnelRepository
+
+def _median_from_histogram(histogram: Dict[int, int]) -> Optional[float]:
+    """Interpolated median of a bucketed duration histogram (days)"""
+    total = sum(histogram.values())
+    if total == 0:
+        return None
+    
+    target = total / 2
+    seen = 0
+    for bucket in sorted(histogram):
+        count = histogram[bucket]
+        if seen + count >= target:
+            lower = DURATION_BUCKET_BOUNDS[bucket - 1] if bucket > 0 else 0
+            if bucket >= len(DURATION_BUCKET_BOUNDS):
+                return float(lower)  # Open-ended tail bucket
+            upper = DURATION_BUCKET_BOUNDS[bucket]
+            return round(lower + (upper - lower) * (target - seen) / count, 2)
+        seen += count
+    return None
+
+class FunnelService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.funnel_repo = FunnelRepository(db)
+
+    def get_funnel(self, user: User) -> Dict[str, Any]:
+        """Stage-to-stage conversion and time-in-stage from the precomputed aggregate"""
+        entered: Dict[str, int] = defaultdict(int)
+        reached: Dict[str, int] = defaultdict(int)
+        exited: Dict[str, int] = defaultdict(int)
+        moves: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        durations: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        
+        for row in self.funnel_repo.get_funnel_stats(user.id):
+            if row.from_status == FUNNEL_REACHED:
+                reached[row.to_status] += row.transitions
+                continue
+            entered[row.to_status] += row.transitions
+            moves[row.from_status][row.to_status] += row.transitions
+            if row.from_status != FUNNEL_ENTRY:
+                exited[row.from_status] += row.transitions
+                durations[row.from_status][row.duration_bucket] += row.transitions
+        
+        stages: List[Dict[str, Any]] = []
+        for status in ApplicationStatus:
+            stage = status.value
+            count = entered.get(stage, 0)
+            stages.append({
+                "status": stage,
+                "entered": count,
+                "exited": exited.get(stage, 0),
+                "median_days_in_stage": _median_from_histogram(durations.get(stage, {})),
+                "conversions": {
+                    to_status: round(n / count * 100, 2)
+                    for to_status, n in sorted(moves.get(stage, {}).items())
+                } if count else {}
+            })
+        
+        applications = sum(moves.get(FUNNEL_ENTRY, {}).values())
+        # Interviews, not transitions: OFFER -> ON_HOLD -> OFFER is one offer
+        offers = reached.get(ApplicationStatus.OFFER.value, 0)
+        return {
+            "applications": applications,
+            "offers": offers,
+            "offer_rate": round(offers / applications * 100, 2) if applications else 0.0,
+            "stages": stages
+        }
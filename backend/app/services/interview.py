@@ -1,21 +1,96 @@
 from typing import List, Optional, Dict, Any
-from uuid import UUID
-from datetime import date
+from uuid import UUID, uuid4
+from datetime import date, datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 
-from app.models.interview import Interview, ApplicationStatus, WorkMode
+from app.models.interview import Interview, ApplicationStatus, WorkMode, INTERVIEW_STAGES
+from app.models.interview_tag import InterviewTag
 from app.models.user import User
-from app.repositories.interview import InterviewRepository
+from app.core.cache import cache
+from app.core.config import settings
+from app.repositories.calendar_event import CalendarEventRepository
+from app.repositories.calendar_sync_job import CalendarSyncJobRepository
+from app.repositories.cohort import CohortRepository
+from app.repositories.daily_activity import DailyActivityRepository
+from app.repositories.funnel import FunnelRepository
+from app.repositories.interview import FACET_FIELDS, InterviewRepository
+from app.repositories.interview_signature import InterviewSignatureRepository
+from app.repositories.interview_tag import InterviewTagRepository
+from app.repositories.salary_benchmark import SalaryBenchmarkRepository
+from app.repositories.user import UserRepository
 from app.schemas.interview import InterviewCreate, InterviewUpdate
+from app.services.funnel import FunnelService
+from app.utils.cohorts import week_start
+from app.utils.cursors import decode_cursor, encode_cursor
+from app.utils.duplicates import normalize_company, similarity
+from app.utils.intervals import ScheduleInterval, overlapping
+from app.utils.ranks import rank_between
+from app.utils.trie import PrefixTrie
+from app.utils.salary import FX_RATES_TO_USD, PERCENTILES, normalize_location, normalize_role
+
+# Change feed keyset positions: before every write, and past every row of a version
+CHANGES_START = (-1, UUID(int=0))
+CAUGHT_UP_ID = UUID(int=2 ** 128 - 1)
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; stored values are UTC
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+def _status_filter(status: Optional[str]) -> Optional[ApplicationStatus]:
+    try:
+        return ApplicationStatus(status) if status else None
+    except ValueError:
+        return None  # Invalid status, will be ignored
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+def _utc_date(value: datetime) -> date:
+    return _as_utc(value).astimezone(timezone.utc).date()
+
+def _days_since(value: datetime) -> float:
+    return max((datetime.now(timezone.utc) - _as_utc(value)).total_seconds(), 0) / 86400
 
 class InterviewService:
     def __init__(self, db: Session):
         self.db = db
         self.interview_repo = InterviewRepository(db)
+        self.sync_job_repo = CalendarSyncJobRepository(db)
+        self.calendar_repo = CalendarEventRepository(db)
+        self.activity_repo = DailyActivityRepository(db)
+        self.funnel_repo = FunnelRepository(db)
+        self.salary_repo = SalaryBenchmarkRepository(db)
+        self.cohort_repo = CohortRepository(db)
+        self.signature_repo = InterviewSignatureRepository(db)
+        self.tag_repo = InterviewTagRepository(db)
+        self.user_repo = UserRepository(db)
 
     def create_interview(self, user: User, interview_data: InterviewCreate) -> Interview:
         interview_dict = interview_data.model_dump(exclude_unset=True)
+        status = interview_dict.get("application_status") or ApplicationStatus.APPLIED
+        interview_dict["tag_rows"] = [
+            InterviewTag(user_id=user.id, tag=tag) for tag in interview_dict.pop("tags", None) or []
+        ]
+        # Rollup delta rides along with the interview insert's commit
+        self._record_contributions(
+            user, interview_dict["company_name"],
+            {_utc_today(): {"applications": 1, **self._transition_deltas(None, status)}},
+            last_status=status
+        )
+        # New cards go on top of their board column
+        interview_dict["board_rank"] = rank_between(
+            None, self.interview_repo.get_adjacent_rank(user.id, status)
+        )
+        # Id assigned up front so the funnel entry commits with the insert
+        interview_id = uuid4()
+        self.funnel_repo.record_transition(user.id, interview_id, None, status)
+        self.cohort_repo.mark_dirty([(interview_dict["work_mode"].value, week_start(datetime.now(timezone.utc)))])
+        interview_dict["change_seq"] = self.user_repo.bump_data_version(user.id)
+        self._update_company_trie(user, interview_dict["change_seq"], added=interview_dict["company_name"])
+        # Added after the bump so its autoflush doesn't insert the signature ahead of the interview
+        self.signature_repo.add_signature(user.id, interview_id, interview_dict["company_name"], interview_dict["role_title"])
         return self.interview_repo.create_interview(
+            id=interview_id,
             user_id=user.id,
             **interview_dict
         )
@@ -27,26 +102,63 @@ class InterviewService:
         company: Optional[str] = None,
         from_date: Optional[date] = None,
         to_date: Optional[date] = None,
+        tags_any: Optional[List[str]] = None,
+        tags_all: Optional[List[str]] = None,
         skip: int = 0,
         limit: int = 100
     ) -> List[Interview]:
-        status_enum = None
-        if status:
-            try:
-                status_enum = ApplicationStatus(status)
-            except ValueError:
-                pass  # Invalid status, will be ignored
-        
         return self.interview_repo.get_by_user_and_filters(
             user_id=user.id,
-            status=status_enum,
+            status=_status_filter(status),
             company=company,
             from_date=from_date,
             to_date=to_date,
+            tags_any=tags_any,
+            tags_all=tags_all,
             skip=skip,
             limit=limit
         )
 
+    def get_interview_facets(
+        self,
+        user: User,
+        facets: str,
+        status: Optional[str] = None,
+        company: Optional[str] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        tags_any: Optional[List[str]] = None,
+        tags_all: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """Histograms for a comma-separated list of facet fields (or "all") under the same filters"""
+        fields = list(FACET_FIELDS) if facets == "all" else [f.strip() for f in facets.split(",") if f.strip()]
+        unknown = [field for field in fields if field not in FACET_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown facets: {', '.join(unknown)}; expected {', '.join(FACET_FIELDS)}")
+        
+        return self.interview_repo.get_facets(
+            user.id,
+            list(dict.fromkeys(fields)),
+            status=_status_filter(status),
+            company=company,
+            from_date=from_date,
+            to_date=to_date,
+            tags_any=tags_any,
+            tags_all=tags_all
+        )
+
+    def update_tags(
+        self, user: User, interview_ids: List[UUID], add: List[str], remove: List[str]
+    ) -> int:
+        """Add and remove tags on many of the user's interviews in one transaction. Returns interviews updated."""
+        owned = self.interview_repo.get_owned_ids(user.id, interview_ids)
+        if owned and (add or remove):
+            self.tag_repo.remove_tags(user.id, owned, [tag for tag in remove if tag not in add])
+            self.tag_repo.add_tags(user.id, owned, add)
+            self.tag_repo.touch_interviews(owned, self.user_repo.bump_data_version(user.id))
+            self.db.commit()
+        return len(owned)
+
     def get_interview_by_id(self, user: User, interview_id: UUID) -> Optional[Interview]:
         interview = self.interview_repo.get_by_id(interview_id)
         if interview and interview.user_id == user.id:
@@ -61,6 +173,38 @@ class InterviewService:
             return None
         
         update_dict = interview_data.model_dump(exclude_unset=True)
+        
+        if "tags" in update_dict:
+            tags = update_dict.pop("tags") or []
+            if tags != interview.tags:
+                # Rows for kept tags are reused; the rest are inserted/orphan-deleted
+                existing = {row.tag: row for row in interview.tag_rows}
+                update_dict["tag_rows"] = [existing.get(tag) or InterviewTag(user_id=user.id, tag=tag) for tag in tags]
+        
+        new_status = update_dict.get("application_status")
+        if new_status and new_status != interview.application_status:
+            # A card whose status changes lands on top of its new column
+            update_dict["board_rank"] = rank_between(
+                None, self.interview_repo.get_adjacent_rank(user.id, new_status)
+            )
+        
+        self._record_activity_change(user, interview, update_dict)
+        # Always set, so every update (tag-only ones included) moves updated_at too
+        update_dict["change_seq"] = self.user_repo.bump_data_version(user.id)
+        if update_dict.get("company_name", interview.company_name) != interview.company_name:
+            self._update_company_trie(
+                user, update_dict["change_seq"], removed=interview.company_name, added=update_dict["company_name"]
+            )
+        company_name = update_dict.get("company_name") or interview.company_name
+        role_title = update_dict.get("role_title") or interview.role_title
+        if (company_name, role_title) != (interview.company_name, interview.role_title):
+            self.signature_repo.update_signature(user.id, interview.id, company_name, role_title)
+        
+        new_date = update_dict.get("interview_date")
+        if "interview_date" in update_dict and new_date != interview.interview_date:
+            self._reschedule_calendar_events(user, interview, new_date)
+        
+        # Commits the interview together with any queued calendar sync jobs
         return self.interview_repo.update(interview_id, update_dict)
 
     def delete_interview(self, user: User, interview_id: UUID) -> bool:
@@ -68,32 +212,443 @@ class InterviewService:
         if not interview:
             return False
         
+        for event in interview.calendar_events:
+            self.sync_job_repo.enqueue_delete(user.id, event)
+        change_seq = self.user_repo.bump_data_version(user.id)
+        self.interview_repo.add_tombstone(interview, change_seq)
+        self._record_contributions(
+            user, interview.company_name, self._activity_contributions(interview), sign=-1
+        )
+        self.funnel_repo.remove_interview(user.id, interview.id)
+        self.cohort_repo.mark_dirty([(interview.work_mode.value, week_start(interview.created_at))])
+        self._update_company_trie(user, change_seq, removed=interview.company_name)
+        self.signature_repo.delete_for_interview(interview.id)
+        
         return self.interview_repo.delete(interview_id)
 
+    def find_duplicates(
+        self,
+        user: User,
+        company_name: str,
+        role_title: str,
+        exclude_id: Optional[UUID] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Up to ``limit`` of the user's interviews at the same normalized
+        company whose role is at least DUPLICATE_SIMILARITY_THRESHOLD similar,
+        best match first. Roles are scored from an index-only scan of the
+        company's distinct role keys; rows are only fetched for matches.
+        """
+        company_key, role_key = normalize_company(company_name), normalize_role(role_title)
+        scores = {
+            key: score for key in self.signature_repo.get_role_keys(user.id, company_key)
+            if (score := similarity(role_key, key)) >= settings.DUPLICATE_SIMILARITY_THRESHOLD
+        }
+        
+        matches: List[Dict[str, Any]] = []
+        for key in sorted(scores, key=lambda key: -scores[key]):
+            if len(matches) >= limit:
+                break
+            rows = self.signature_repo.get_by_company_keys(
+                user.id, [company_key], [key], exclude_id, limit=limit - len(matches)
+            )
+            matches.extend(
+                {
+                    "interview_id": row.interview_id,
+                    "company_name": row.company_name,
+                    "role_title": row.role_title,
+                    "similarity": round(scores[key], 3)
+                }
+                for row in rows
+            )
+        return matches
+
+    def get_duplicate_groups(self, user: User) -> List[Dict[str, Any]]:
+        """Groups of the user's interviews that look like the same application"""
+        by_company: Dict[str, Dict[str, List[Any]]] = {}
+        keys = self.signature_repo.get_repeated_company_keys(user.id)
+        for row in self.signature_repo.get_by_company_keys(user.id, keys):
+            by_company.setdefault(row.company_key, {}).setdefault(row.role_key, []).append(row)
+        
+        groups = []
+        for roles in by_company.values():
+            # Union similar role keys; each distinct key is compared once
+            parent = {role: role for role in roles}
+            
+            def find(role):
+                while parent[role] != role:
+                    parent[role] = parent[parent[role]]
+                    role = parent[role]
+                return role
+            
+            role_keys = sorted(roles)
+            for i, first in enumerate(role_keys):
+                for second in role_keys[i + 1:]:
+                    if similarity(first, second) >= settings.DUPLICATE_SIMILARITY_THRESHOLD:
+                        parent[find(second)] = find(first)
+            
+            clusters: Dict[str, List[Any]] = {}
+            for role, rows in roles.items():
+                clusters.setdefault(find(role), []).extend(rows)
+            for rows in clusters.values():
+                if len(rows) > 1:
+                    groups.append({
+                        "company_name": rows[0].company_name,
+                        "interviews": [
+                            {"interview_id": row.interview_id, "company_name": row.company_name, "role_title": row.role_title}
+                            for row in rows
+                        ]
+                    })
+        return groups
+
+    def suggest_companies(self, user: User, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        The user's company names starting with ``prefix``, most used first.
+        Served from an in-memory trie per user; users with more distinct
+        companies than the trie cap query the prefix index instead.
+        """
+        trie = self._company_trie(user)
+        if trie:
+            matches = trie.suggest(prefix, limit)
+        else:
+            matches = self.interview_repo.suggest_companies(user.id, prefix, limit)
+        return [{"company_name": name, "interviews": count} for name, count in matches]
+
+    def _company_trie(self, user: User) -> Optional[PrefixTrie]:
+        # False marks a user over the cap until their next write
+        key = ("companies", user.id)
+        trie = cache.get(key, user.data_version)
+        if trie is None:
+            counts = self.interview_repo.get_company_counts(user.id, settings.COMPANY_TRIE_MAX_NAMES + 1)
+            trie = PrefixTrie(counts) if len(counts) <= settings.COMPANY_TRIE_MAX_NAMES else False
+            cache.set(key, user.data_version, trie)
+        return trie
+
+    def _update_company_trie(
+        self, user: User, version: int, removed: Optional[str] = None, added: Optional[str] = None
+    ) -> None:
+        # Carry a built trie over to the version this write's bump produced;
+        # if anything else bumped in between, the trie is rebuilt on next use
+        key = ("companies", user.id)
+        trie = cache.get(key, user.data_version) if version == user.data_version + 1 else None
+        if not trie:
+            return
+        if removed:
+            trie.remove(removed)
+        if added:
+            trie.add(added)
+        cache.set(key, version, trie)
+
+    def _record_activity_change(
+        self, user: User, interview: Interview, update_dict: Dict[str, Any]
+    ) -> None:
+        old_status = interview.application_status
+        new_status = update_dict.get("application_status") or old_status
+        old_company = interview.company_name
+        new_company = update_dict.get("company_name") or old_company
+        
+        old_mode = interview.work_mode
+        new_mode = update_dict.get("work_mode") or old_mode
+        if new_status != old_status or new_mode != old_mode:
+            cohort_week = week_start(interview.created_at)
+            self.cohort_repo.mark_dirty([(old_mode.value, cohort_week), (new_mode.value, cohort_week)])
+        
+        if new_company != old_company:
+            # Move everything the application contributed to the company it is now filed under
+            contributions = self._activity_contributions(interview)
+            self._record_contributions(user, old_company, contributions, sign=-1)
+            self._record_contributions(user, new_company, contributions)
+        
+        if new_status != old_status:
+            entered_at = self.funnel_repo.get_last_transition_at(interview.id) or interview.created_at
+            self.funnel_repo.record_transition(
+                user.id, interview.id, old_status, new_status, _days_since(entered_at)
+            )
+            self._record_contributions(
+                user, new_company,
+                {_utc_today(): self._transition_deltas(old_status, new_status, _days_since(interview.created_at))},
+                last_status=new_status
+            )
+
+    def _activity_contributions(self, interview: Interview) -> Dict[date, Dict[str, float]]:
+        """
+        Every rollup counter the interview has added so far, per day, replayed
+        from its status history (the same deltas create/update recorded)
+        """
+        created_at = _as_utc(interview.created_at)
+        contributions: Dict[date, Dict[str, float]] = {_utc_date(created_at): {"applications": 1}}
+        for from_status, to_status, changed_at in self.funnel_repo.get_transitions(interview.id):
+            days = max((_as_utc(changed_at) - created_at).total_seconds(), 0) / 86400
+            day = contributions.setdefault(_utc_date(changed_at), {})
+            for counter, delta in self._transition_deltas(from_status, to_status, days).items():
+                day[counter] = day.get(counter, 0) + delta
+        return contributions
+
+    def _record_contributions(
+        self,
+        user: User,
+        company_name: str,
+        contributions: Dict[date, Dict[str, float]],
+        sign: int = 1,
+        last_status: Optional[ApplicationStatus] = None
+    ) -> None:
+        for day, deltas in contributions.items():
+            if any(deltas.values()) or last_status is not None:
+                self.activity_repo.record(
+                    user.id, day, company_name, last_status=last_status,
+                    **{counter: sign * delta for counter, delta in deltas.items()}
+                )
+
+    def _transition_deltas(
+        self,
+        old_status: Optional[ApplicationStatus],
+        new_status: ApplicationStatus,
+        days_since_created: float = 0.0
+    ) -> Dict[str, float]:
+        deltas = self._status_deltas(old_status, new_status)
+        if old_status in (None, ApplicationStatus.APPLIED) and new_status != ApplicationStatus.APPLIED:
+            # First answer from the company, including applications created past APPLIED
+            deltas["responses"] = 1
+            deltas["response_days_total"] = days_since_created
+        return deltas
+
+    def _status_deltas(
+        self, old_status: Optional[ApplicationStatus], new_status: ApplicationStatus
+    ) -> Dict[str, float]:
+        deltas: Dict[str, float] = {}
+        if new_status in INTERVIEW_STAGES and old_status not in INTERVIEW_STAGES:
+            deltas["interviews"] = 1
+        elif new_status == ApplicationStatus.OFFER:
+            deltas["offers"] = 1
+        elif new_status == ApplicationStatus.REJECTED:
+            deltas["rejections"] = 1
+        return deltas
+
+    def _reschedule_calendar_events(
+        self, user: User, interview: Interview, new_date: Optional[datetime]
+    ) -> None:
+        for event in interview.calendar_events:
+            if new_date is None:
+                # Date cleared: the interview no longer belongs on a calendar
+                self.sync_job_repo.enqueue_delete(user.id, event)
+                self.db.delete(event)
+                continue
+            
+            duration = event.end_time - event.start_time
+            event.start_time = new_date
+            event.end_time = new_date + duration
+            event.is_synced = False
+            self.sync_job_repo.enqueue_upsert(user.id, event)
+
     def count_user_interviews(self, user: User) -> int:
         return self.interview_repo.count_by_user_id(user.id)
 
-    def get_user_interview_statistics(self, user: User) -> Dict[str, Any]:
-        total_count = self.count_user_interviews(user)
-        status_counts = self.interview_repo.get_status_counts(user.id)
-        
-        # Calculate conversion rates
-        applied_count = status_counts.get("APPLIED", 0)
+    def get_user_interview_statistics(
+        self, user: User, status_counts: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Any]:
+        if status_counts is None:
+            status_counts = self.interview_repo.get_status_counts(user.id)
+        total_count = sum(status_counts.values())
         offer_count = status_counts.get("OFFER", 0)
         
-        conversion_rate = 0.0
-        if applied_count > 0:
-            conversion_rate = (offer_count / applied_count) * 100
+        # Share of applications that ever reached an offer, from the
+        # precomputed funnel rather than a ratio of current statuses
+        funnel = FunnelService(self.db).get_funnel(user)
         
         return {
             "total_interviews": total_count,
             "status_counts": status_counts,
-            "conversion_rate": round(conversion_rate, 2),
+            "conversion_rate": funnel["offer_rate"],
             "success_rate": round((offer_count / max(total_count, 1)) * 100, 2)
         }
 
+    def get_board(self, user: User, per_column: int = 20) -> Dict[str, Any]:
+        """Every status column with its first cards, total and next-page cursor"""
+        columns = {
+            status: {"status": status.value, "total": 0, "cards": [], "next_cursor": None}
+            for status in ApplicationStatus
+        }
+        for interview, board_status, column_total in self.interview_repo.get_board(user.id, per_column):
+            column = columns[ApplicationStatus(board_status)]
+            column["total"] = column_total
+            column["cards"].append(interview)
+        
+        for column in columns.values():
+            if column["total"] > len(column["cards"]):
+                column["next_cursor"] = self._board_cursor(column["cards"][-1])
+        return {"columns": list(columns.values())}
+
+    def get_board_column(
+        self, user: User, status: ApplicationStatus, cursor: Optional[str] = None, limit: int = 20
+    ) -> Dict[str, Any]:
+        """Next page of one column; raises ValueError for a malformed cursor"""
+        after = None
+        if cursor:
+            board_rank, interview_id = decode_cursor(cursor, 2)
+            try:
+                after = (board_rank, UUID(interview_id))
+            except ValueError:
+                raise ValueError("Invalid cursor")
+        
+        cards = self.interview_repo.get_board_column(user.id, status, limit + 1, after)
+        has_more = len(cards) > limit
+        cards = cards[:limit]
+        return {
+            "status": status.value,
+            "total": self.interview_repo.count_board_column(user.id, status),
+            "cards": cards,
+            "next_cursor": self._board_cursor(cards[-1]) if has_more else None
+        }
+
+    def _board_cursor(self, interview: Interview) -> str:
+        return encode_cursor(interview.board_rank, interview.id)
+
+    def get_changes(self, user: User, since: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        """
+        Interviews written and deleted after the ``since`` cursor, in write
+        order; no cursor starts a full sync of the live interviews. Raises
+        ValueError for a malformed cursor.
+        """
+        after = CHANGES_START
+        if since:
+            change_seq, interview_id = decode_cursor(since, 2)
+            try:
+                after = (int(change_seq), UUID(interview_id))
+            except ValueError:
+                raise ValueError("Invalid cursor")
+            # Caught up and nothing written since: answered without a query
+            if after[1] == CAUGHT_UP_ID and after[0] >= user.data_version:
+                return {"changes": [], "deleted": [], "cursor": since, "has_more": False}
+        
+        # limit + 1 from each side is enough to know the first ``limit`` of the merge
+        entries = [(row.change_seq, row.id, row) for row in self.interview_repo.get_changed_since(user.id, after, limit + 1)]
+        if since:
+            entries += [(seq, interview_id, None) for seq, interview_id in self.interview_repo.get_tombstones_since(user.id, after, limit + 1)]
+        entries.sort(key=lambda entry: entry[:2])
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        
+        position = entries[-1][:2] if entries else after
+        if not has_more:
+            # Every write up to the version loaded with the user is committed and
+            # was read, so the next poll can start past it and skip the queries
+            position = max(position, (user.data_version, CAUGHT_UP_ID))
+        return {
+            "changes": [row for _, _, row in entries if row is not None],
+            "deleted": [interview_id for _, interview_id, row in entries if row is None],
+            "cursor": encode_cursor(*position),
+            "has_more": has_more
+        }
+
+    def move_interview(
+        self,
+        user: User,
+        interview_id: UUID,
+        status: Optional[ApplicationStatus] = None,
+        before_id: Optional[UUID] = None,
+        after_id: Optional[UUID] = None
+    ) -> Optional[Interview]:
+        """
+        Drop a card between the ``before_id`` card (above it) and the
+        ``after_id`` card (below it), optionally in another status column.
+        Only the moved row gets a new rank; raises ValueError for neighbours
+        outside the target column or out of order.
+        """
+        interview = self.get_interview_by_id(user, interview_id)
+        if not interview:
+            return None
+        
+        current = interview.application_status or ApplicationStatus.APPLIED
+        target = status or current
+        neighbours = {
+            card.id: card
+            for card in self.interview_repo.get_by_ids([i for i in (before_id, after_id) if i])
+            if card.user_id == user.id
+        }
+        for neighbour_id in (before_id, after_id):
+            if neighbour_id is None:
+                continue
+            card = neighbours.get(neighbour_id)
+            if card is None or neighbour_id == interview.id:
+                raise ValueError(f"Neighbour {neighbour_id} not found")
+            if (card.application_status or ApplicationStatus.APPLIED) != target:
+                raise ValueError(f"Neighbour {neighbour_id} is not in the {target.value} column")
+        
+        above = neighbours[before_id].board_rank if before_id else None
+        below = neighbours[after_id].board_rank if after_id else None
+        # With one neighbour, the other bound is the card next to it
+        if before_id and not after_id:
+            below = self.interview_repo.get_adjacent_rank(user.id, target, above, exclude_id=interview.id)
+        elif after_id and not before_id:
+            above = self.interview_repo.get_adjacent_rank(user.id, target, below, below=False, exclude_id=interview.id)
+        elif not before_id and not after_id:
+            below = self.interview_repo.get_adjacent_rank(user.id, target, exclude_id=interview.id)
+        
+        if above is not None and below is not None and above >= below:
+            raise ValueError("before_id must come before after_id")
+        update_dict: Dict[str, Any] = {"board_rank": rank_between(above, below)}
+        
+        if target != current:
+            update_dict["application_status"] = target
+            self._record_activity_change(user, interview, update_dict)
+        update_dict["change_seq"] = self.user_repo.bump_data_version(user.id)
+        return self.interview_repo.update(interview.id, update_dict)
+
     def get_upcoming_interviews(self, user: User, days_ahead: int = 7) -> List[Interview]:
         return self.interview_repo.get_upcoming_interviews(user.id, days_ahead)
 
     def get_recent_activity(self, user: User, limit: int = 10) -> List[Interview]:
         return self.interview_repo.get_recent_activity(user.id, limit)
+
+    def get_schedule_conflicts(self, user: User, interview: Interview) -> List[ScheduleInterval]:
+        """Interviews/events overlapping this interview's slot"""
+        if not interview.interview_date:
+            return []
+        
+        duration = timedelta(minutes=settings.DEFAULT_INTERVIEW_DURATION_MINUTES)
+        events = self.calendar_repo.get_by_interview_id(interview.id)
+        slots = [(e.start_time, e.end_time) for e in events] or [
+            (interview.interview_date, interview.interview_date + duration)
+        ]
+        start_time = min(start for start, _ in slots)
+        end_time = max(end for _, end in slots)
+        
+        # Only the window around this interview is read, via the
+        # (user_id, interview_date) and (interview_id, start_time) indexes
+        intervals = self.calendar_repo.get_schedule_intervals(user.id, start_time, end_time, duration)
+        conflicts = []
+        for slot_start, slot_end in slots:
+            for interval in overlapping(intervals, slot_start, slot_end, exclude_interview_id=interview.id):
+                if interval not in conflicts:
+                    conflicts.append(interval)
+        return conflicts
+
+    def get_salary_benchmark(self, user: User, interview: Interview) -> Optional[Dict[str, Any]]:
+        """
+        Market percentiles for the interview's role/location, in its currency.
+        Raises ValueError when there is no FX rate to convert them with.
+        """
+        currency = interview.currency or "USD"
+        if currency not in FX_RATES_TO_USD:
+            raise ValueError(f"No salary benchmarks for currency {currency}")
+        
+        role_key = normalize_role(interview.role_title)
+        location_key = normalize_location(interview.location, interview.work_mode.value)
+        benchmark = self.salary_repo.get_for_keys(role_key, location_key)
+        if not benchmark:
+            return None
+        
+        rate = FX_RATES_TO_USD[currency]
+        amounts = [a for a in (interview.salary_range_min, interview.salary_range_max) if a is not None]
+        
+        return {
+            "interview_id": interview.id,
+            "role_key": benchmark.role_key,
+            "location_key": benchmark.location_key,
+            "currency": currency,
+            "sample_size": benchmark.sample_size,
+            **{f"p{q}": round(getattr(benchmark, f"p{q}") / rate, 2) for q in PERCENTILES},
+            "offer_midpoint": round(float(sum(amounts)) / len(amounts), 2) if amounts else None,
+            "computed_at": benchmark.computed_at
+        }
\ No newline at end of file
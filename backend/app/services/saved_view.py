@@ -0,0 +1,96 @@
+import json
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+from app.core.cache import cache
+from app.models.saved_view import SavedView
+from app.models.user import User
+from app.repositories.interview import InterviewRepository
+from app.repositories.saved_view import SavedViewRepository
+from app.schemas.interview import Interview as InterviewSchema, InterviewFilters, SavedViewCreate, SavedViewUpdate
+
+class SavedViewService:
+    """
+    Saved interview filters. Counts and first pages are cached per filter
+    spec under the user's data_version, so the sidebar is served from memory
+    until the next interview write.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.view_repo = SavedViewRepository(db)
+        self.interview_repo = InterviewRepository(db)
+
+    def list_views(self, user: User) -> List[Dict[str, Any]]:
+        return [self._with_count(user, view) for view in self.view_repo.get_by_user(user.id)]
+
+    def create_view(self, user: User, data: SavedViewCreate) -> Dict[str, Any]:
+        view = self.view_repo.create({
+            "user_id": user.id,
+            "name": data.name,
+            "filters": data.filters.model_dump(mode="json")
+        })
+        return self._with_count(user, view)
+
+    def update_view(self, user: User, view_id: UUID, data: SavedViewUpdate) -> Optional[Dict[str, Any]]:
+        if not self.view_repo.get_for_user(user.id, view_id):
+            return None
+        update_dict: Dict[str, Any] = {}
+        if data.name is not None:
+            update_dict["name"] = data.name
+        if data.filters is not None:
+            update_dict["filters"] = data.filters.model_dump(mode="json")
+        return self._with_count(user, self.view_repo.update(view_id, update_dict))
+
+    def delete_view(self, user: User, view_id: UUID) -> bool:
+        if not self.view_repo.get_for_user(user.id, view_id):
+            return False
+        return self.view_repo.delete(view_id)
+
+    def get_view_page(self, user: User, view_id: UUID, limit: int = 50) -> Optional[Dict[str, Any]]:
+        """The view with its first ``limit`` interviews (newest first)"""
+        view = self.view_repo.get_for_user(user.id, view_id)
+        if not view:
+            return None
+        
+        key = ("view_page", user.id, _spec_key(view.filters), limit)
+        interviews = cache.get(key, user.data_version)
+        if interviews is None:
+            interviews = [
+                InterviewSchema.model_validate(interview)
+                for interview in self.interview_repo.get_by_user_and_filters(
+                    user.id, **_repo_filters(view.filters), skip=0, limit=limit
+                )
+            ]
+            cache.set(key, user.data_version, interviews)
+        return {"view": self._with_count(user, view), "interviews": interviews, "limit": limit}
+
+    def _with_count(self, user: User, view: SavedView) -> Dict[str, Any]:
+        key = ("view_count", user.id, _spec_key(view.filters))
+        count = cache.get(key, user.data_version)
+        if count is None:
+            count = self.interview_repo.count_by_filters(user.id, **_repo_filters(view.filters))
+            cache.set(key, user.data_version, count)
+        return {
+            "id": view.id,
+            "name": view.name,
+            "filters": view.filters,
+            "count": count,
+            "created_at": view.created_at,
+            "updated_at": view.updated_at
+        }
+
+def _spec_key(filters: Dict[str, Any]) -> str:
+    return json.dumps(filters, sort_keys=True)
+
+def _repo_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+    spec = InterviewFilters(**filters)
+    return {
+        "status": spec.status,
+        "company": spec.company,
+        "from_date": spec.from_date,
+        "to_date": spec.to_date,
+        "tags_any": spec.tags_any,
+        "tags_all": spec.tags_all
+    }
@@ -0,0 +1,95 @@
+"""
+Vectorized cohort reductions for the cross-user funnel benchmarks.
+
+A cohort is (work_mode, week of created_at). Rows arrive in chunks as NumPy
+arrays and are reduced with np.unique/np.bincount group-bys; only the
+(cohort, user) pairs needed for distinct user counts are kept across chunks.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+EPOCH = date(1970, 1, 1)
+
+def week_start(value: datetime) -> date:
+    """Monday (UTC) of the week containing value"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    day = value.date()
+    return day - timedelta(days=day.weekday())
+
+def iso_period(week: date) -> str:
+    year, week_number, _ = week.isocalendar()
+    return f"{year}-W{week_number:02d}"
+
+def week_index(days: np.ndarray) -> np.ndarray:
+    # 1970-01-01 was a Thursday; shifting by 3 days aligns buckets to Mondays
+    return (days + 3) // 7
+
+def index_to_week(index: int) -> date:
+    return EPOCH + timedelta(days=int(index) * 7 - 3)
+
+class CohortAccumulator:
+    def __init__(self, modes: List[str]):
+        self.modes = modes
+        self.totals: Dict[int, np.ndarray] = {}
+        self.user_pairs: Set[Tuple[int, int]] = set()
+
+    def cohort_key(self, mode_codes: np.ndarray, days: np.ndarray) -> np.ndarray:
+        return week_index(days) * len(self.modes) + mode_codes
+
+    def add_chunk(
+        self,
+        user_ids: np.ndarray,
+        mode_codes: np.ndarray,
+        days: np.ndarray,
+        reached_interview: np.ndarray,
+        offered: np.ndarray,
+        only: Optional[np.ndarray] = None
+    ) -> None:
+        keys = self.cohort_key(mode_codes, days)
+        if only is not None:
+            mask = np.isin(keys, only)
+            keys, user_ids = keys[mask], user_ids[mask]
+            reached_interview, offered = reached_interview[mask], offered[mask]
+        if not len(keys):
+            return
+        
+        cohorts, inverse = np.unique(keys, return_inverse=True)
+        sums = np.stack([
+            np.bincount(inverse, minlength=len(cohorts)),
+            np.bincount(inverse, weights=reached_interview, minlength=len(cohorts)).astype(np.int64),
+            np.bincount(inverse, weights=offered, minlength=len(cohorts)).astype(np.int64),
+        ], axis=1)
+        for cohort, row in zip(cohorts.tolist(), sums):
+            if cohort in self.totals:
+                self.totals[cohort] += row
+            else:
+                self.totals[cohort] = row.copy()
+        
+        pairs = np.unique(np.stack([keys, user_ids], axis=1), axis=0)
+        self.user_pairs.update(map(tuple, pairs.tolist()))
+
+    def results(self) -> List[Dict]:
+        user_cohorts: Dict[int, int] = {}
+        if self.user_pairs:
+            cohorts, counts = np.unique(
+                np.fromiter((cohort for cohort, _ in self.user_pairs), dtype=np.int64),
+                return_counts=True
+            )
+            user_cohorts = dict(zip(cohorts.tolist(), counts.tolist()))
+        
+        results = []
+        for cohort, (applications, interviews, offers) in sorted(self.totals.items()):
+            week, mode_code = divmod(cohort, len(self.modes))
+            results.append({
+                "work_mode": self.modes[mode_code],
+                "week_start": index_to_week(week),
+                "applications": int(applications),
+                "users": int(user_cohorts.get(cohort, 0)),
+                "interviews": int(interviews),
+                "offers": int(offers)
+            })
+        return results
@@ -0,0 +1,22 @@
+"""Opaque, URL-safe paging cursors built from a row's sort key."""
+
+import base64
+import binascii
+from typing import List
+
+SEPARATOR = "|"
+
+def encode_cursor(*parts: object) -> str:
+    raw = SEPARATOR.join(str(part) for part in parts).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> List[str]:
+    """Split a cursor back into its ``size`` parts; ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+    parts = raw.split(SEPARATOR)
+    if len(parts) != size:
+        raise ValueError("Invalid cursor")
+    return parts
@@ -0,0 +1,43 @@
+"""
+Near-duplicate detection for interviews.
+
+Company names are normalized (case, punctuation, legal suffixes) into a key
+that is looked up exactly through an index; roles at the same company are
+then compared by trigram similarity, the measure pg_trgm uses, so
+"Sr. Backend Engineer" matches "Senior Backend Engineer II".
+"""
+
+import re
+from functools import lru_cache
+from typing import FrozenSet, Optional
+
+_COMPANY_SUFFIXES = frozenset({
+    "inc", "llc", "ltd", "limited", "corp", "corporation", "co", "company",
+    "gmbh", "ag", "sa", "sl", "srl", "bv", "nv", "plc", "pty", "oy", "ab",
+})
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+
+@lru_cache(maxsize=65536)
+def normalize_company(company_name: Optional[str]) -> str:
+    words = _NON_WORD_RE.sub(" ", (company_name or "").lower()).split()
+    while len(words) > 1 and words[-1] in _COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)[:100]
+
+@lru_cache(maxsize=65536)
+def trigrams(text: str) -> FrozenSet[str]:
+    # Each word padded like pg_trgm: two spaces in front, one behind
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+def similarity(a: str, b: str) -> float:
+    """Shared trigrams over all trigrams of the two strings (0..1)"""
+    if a == b:
+        return 1.0
+    grams_a, grams_b = trigrams(a), trigrams(b)
+    if not grams_a or not grams_b:
+        return 0.0
+    return len(grams_a & grams_b) / len(grams_a | grams_b)
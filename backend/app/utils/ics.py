@@ -0,0 +1,141 @@
+"""
+Incremental iCalendar (RFC 5545) reader.
+
+Input is consumed as an iterable of byte chunks. Lines are unfolded on the fly,
+and VEVENTs come out one at a time from a small state machine, so memory stays
+bounded by the largest single event rather than by the file.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+IcsProperty = Tuple[Dict[str, str], str]  # (params, value)
+IcsEvent = Dict[str, IcsProperty]
+
+class IcsParseError(ValueError):
+    pass
+
+class IcsTooLargeError(IcsParseError):
+    pass
+
+def read_chunks(stream: BinaryIO, max_bytes: int, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Read a binary stream in chunks, failing once it exceeds max_bytes"""
+    total = 0
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        total += len(chunk)
+        if total > max_bytes:
+            raise IcsTooLargeError(f"ICS file exceeds the {max_bytes // (1024 * 1024)} MB limit")
+        yield chunk
+
+def iter_unfolded_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Yield logical content lines, joining RFC 5545 folded continuations"""
+    buffer = b""
+    current: Optional[str] = None
+    
+    def physical_lines() -> Iterator[str]:
+        nonlocal buffer
+        for chunk in chunks:
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                yield line.rstrip(b"\r").decode("utf-8", errors="replace")
+        if buffer:
+            yield buffer.rstrip(b"\r").decode("utf-8", errors="replace")
+    
+    for line in physical_lines():
+        if line[:1] in (" ", "\t"):
+            if current is not None:
+                current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    
+    if current:
+        yield current
+
+def parse_content_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    """Split 'NAME;PARAM=x:value' into (NAME, {PARAM: x}, value)"""
+    head, sep, value = line.partition(":")
+    if not sep:
+        raise IcsParseError(f"Malformed content line: {line[:50]}")
+    
+    name, *raw_params = head.split(";")
+    params = {}
+    for raw in raw_params:
+        key, _, param_value = raw.partition("=")
+        params[key.upper()] = param_value.strip('"')
+    return name.upper(), params, value
+
+def iter_events(chunks: Iterable[bytes]) -> Iterator[IcsEvent]:
+    """Yield each VEVENT as {property name: (params, value)}"""
+    depth = 0  # nesting inside the current VEVENT (VALARM etc.)
+    event: Optional[IcsEvent] = None
+    
+    for line in iter_unfolded_lines(chunks):
+        if not line:
+            continue
+        try:
+            name, params, value = parse_content_line(line)
+        except IcsParseError:
+            continue
+        
+        if event is None:
+            if name == "BEGIN" and value.upper() == "VEVENT":
+                event = {}
+                depth = 0
+            continue
+        
+        if name == "BEGIN":
+            depth += 1
+        elif name == "END" and depth:
+            depth -= 1
+        elif name == "END" and value.upper() == "VEVENT":
+            yield event
+            event = None
+        elif depth == 0 and name not in event:
+            event[name] = (params, value)
+
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+def unescape_text(value: str) -> str:
+    return _ESCAPE_RE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+def parse_datetime(prop: IcsProperty) -> datetime:
+    """DATE, UTC, TZID-qualified or floating (treated as UTC) DATE-TIME"""
+    params, value = prop
+    value = value.strip()
+    
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        day = datetime.strptime(value, "%Y%m%d").date()
+        return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    
+    if value.endswith("Z"):
+        return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    
+    parsed = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    tzid = params.get("TZID")
+    if tzid:
+        try:
+            return parsed.replace(tzinfo=ZoneInfo(tzid))
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    return parsed.replace(tzinfo=timezone.utc)
+
+_DURATION_RE = re.compile(
+    r"^(?P<sign>[+-])?P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+
+def parse_duration(value: str) -> timedelta:
+    match = _DURATION_RE.match(value.strip())
+    if not match:
+        raise IcsParseError(f"Invalid duration: {value}")
+    parts = {k: int(v) for k, v in match.groupdict().items() if v and k != "sign"}
+    duration = timedelta(**parts)
+    return -duration if match.group("sign") == "-" else duration
@@ -0,0 +1,52 @@
+import heapq
+from datetime import datetime
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+class ScheduleInterval(NamedTuple):
+    kind: str  # "interview" or "event"
+    id: UUID
+    interview_id: UUID
+    title: str
+    start_time: datetime
+    end_time: datetime
+
+def find_overlaps(
+    intervals: Iterable[ScheduleInterval]
+) -> List[Tuple[ScheduleInterval, ScheduleInterval]]:
+    """
+    Sweep-line over intervals sorted by start time.
+
+    Keeps a min-heap of active intervals keyed by end time; each new interval
+    first evicts everything that ended at or before its start, and overlaps
+    whatever is still active. O(n log n + k) for k overlapping pairs.
+    Intervals that belong to the same interview never conflict with each other.
+    """
+    active: List[Tuple[datetime, int, ScheduleInterval]] = []
+    overlaps = []
+    
+    for seq, interval in enumerate(sorted(intervals, key=lambda i: i.start_time)):
+        while active and active[0][0] <= interval.start_time:
+            heapq.heappop(active)
+        
+        for _, _, other in active:
+            if other.interview_id != interval.interview_id:
+                overlaps.append((other, interval))
+        
+        heapq.heappush(active, (interval.end_time, seq, interval))
+    
+    return overlaps
+
+def overlapping(
+    intervals: Iterable[ScheduleInterval],
+    start_time: datetime,
+    end_time: datetime,
+    exclude_interview_id: Optional[UUID] = None
+) -> List[ScheduleInterval]:
+    """Intervals intersecting the half-open range [start_time, end_time)"""
+    return [
+        interval for interval in intervals
+        if interval.start_time < end_time
+        and interval.end_time > start_time
+        and interval.interview_id != exclude_interview_id
+    ]
@@ -0,0 +1,66 @@
+"""
+Fractional (lexicographic) ranks for manually ordered lists.
+
+A rank is a base-36 fraction written with the digits 0-9a-z, so plain string
+comparison orders ranks under any collation. There is always room between
+two different ranks; a move writes a key strictly between its neighbours
+and touches no other row. Keys grow by about one character per repeated
+insert into the same gap, which the background rebalance resets.
+"""
+
+from typing import List, Optional
+
+ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(ALPHABET)
+
+def _to_int(rank: str, length: int) -> int:
+    value = 0
+    for char in rank.ljust(length, ALPHABET[0]):
+        index = ALPHABET.find(char)
+        if index < 0:
+            raise ValueError(f"Invalid rank: {rank!r}")
+        value = value * BASE + index
+    return value
+
+def _to_rank(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, index = divmod(value, BASE)
+        chars.append(ALPHABET[index])
+    # Trailing zeros don't change the value; dropping them keeps keys short
+    return "".join(reversed(chars)).rstrip(ALPHABET[0])
+
+def ranks_between(before: Optional[str], after: Optional[str], count: int) -> List[str]:
+    """
+    ``count`` evenly spaced ranks strictly between ``before`` and ``after``
+    (None = open end), in ascending order. ValueError if there is no gap.
+    """
+    extra = 1
+    while BASE ** extra < count + 1:
+        extra += 1
+    length = max(len(before or ""), len(after or "")) + extra
+
+    low = _to_int(before or "", length)
+    high = _to_int(after, length) if after is not None else BASE ** length
+    if high - low < count + 1:
+        raise ValueError("Neighbour ranks are out of order")
+
+    return [_to_rank(low + (high - low) * (i + 1) // (count + 1), length) for i in range(count)]
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """One rank strictly between ``before`` and ``after`` (None = open end)"""
+    # Adding at either end steps one unit past the edge card instead of
+    # bisecting towards it; a full digit is extended with the extreme digit,
+    # so prepends/appends add one character per ~35 moves
+    if before is None and after is not None:
+        value, length = _to_int(after, len(after)), len(after)
+        if value == 1:
+            value, length = BASE, length + 1
+        if value > 1:
+            return _to_rank(value - 1, length)
+    elif after is None and before is not None:
+        value, length = _to_int(before, len(before)), len(before)
+        if value == BASE ** length - 1:
+            value, length = value * BASE, length + 1
+        return _to_rank(value + 1, length)
+    return ranks_between(before, after, 1)[0]
@@ -0,0 +1,202 @@
+"""
+Vectorized salary percentile engine.
+
+Salaries are accumulated into fixed log-spaced histograms per (role, location)
+bucket, so memory depends on the number of buckets and bins, never on the
+number of rows. Percentiles are interpolated inside a bin; with the default
+1024 bins over 1k-10M USD the relative error is below 1%. Distinct
+(bucket, user) pairs are kept so a bucket is only published once enough
+different people contributed to it.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Local FX table (units of USD per unit of currency). Refreshed by hand;
+# benchmarks only need to be roughly comparable across currencies.
+FX_RATES_TO_USD: Dict[str, float] = {
+    "USD": 1.0,
+    "EUR": 1.08,
+    "GBP": 1.27,
+    "CHF": 1.12,
+    "CAD": 0.74,
+    "AUD": 0.66,
+    "NZD": 0.61,
+    "JPY": 0.0067,
+    "CNY": 0.14,
+    "INR": 0.012,
+    "SGD": 0.74,
+    "HKD": 0.13,
+    "SEK": 0.095,
+    "NOK": 0.094,
+    "DKK": 0.145,
+    "PLN": 0.25,
+    "CZK": 0.043,
+    "BRL": 0.2,
+    "MXN": 0.058,
+    "ARS": 0.0011,
+    "CLP": 0.0011,
+    "COP": 0.00025,
+    "ZAR": 0.054,
+    "ILS": 0.27,
+    "AED": 0.27,
+}
+
+ANY_LOCATION = "*"
+PERCENTILES = (25, 50, 75, 90)
+
+MIN_SALARY_USD = 1_000.0
+MAX_SALARY_USD = 10_000_000.0
+
+_ROLE_ALIASES = {
+    "sr": "senior",
+    "jr": "junior",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "swe": "software engineer",
+    "mgr": "manager",
+    "pm": "product manager",
+}
+_NON_WORD_RE = re.compile(r"[^a-z0-9+#]+")
+
+@lru_cache(maxsize=65536)
+def normalize_role(role_title: Optional[str]) -> str:
+    words = _NON_WORD_RE.sub(" ", (role_title or "").lower()).split()
+    return " ".join(_ROLE_ALIASES.get(word, word) for word in words)[:100]
+
+@lru_cache(maxsize=65536)
+def normalize_location(location: Optional[str], work_mode: Optional[str] = None) -> str:
+    """City-level key: first comma-separated part, or "remote" for remote roles"""
+    city = (location or "").split(",")[0]
+    key = " ".join(_NON_WORD_RE.sub(" ", city.lower()).split())
+    if not key or key == "remote":
+        return "remote" if work_mode == "REMOTE" else ANY_LOCATION
+    return key[:100]
+
+def _map_unique(values: np.ndarray, mapper) -> np.ndarray:
+    # Normalize each distinct string once instead of once per row
+    uniques, inverse = np.unique(values, return_inverse=True)
+    return np.array([mapper(value) for value in uniques], dtype=object)[inverse]
+
+def to_usd(
+    salary_min: np.ndarray, salary_max: np.ndarray, currencies: np.ndarray
+) -> np.ndarray:
+    """Range midpoint in USD; NaN where the row can't be used"""
+    midpoint = np.where(
+        np.isnan(salary_min), salary_max,
+        np.where(np.isnan(salary_max), salary_min, (salary_min + salary_max) / 2)
+    )
+    rates = _map_unique(currencies, lambda code: FX_RATES_TO_USD.get(code or "USD", np.nan)).astype(np.float64)
+    usd = midpoint * rates
+    usd[(usd < MIN_SALARY_USD) | (usd > MAX_SALARY_USD)] = np.nan
+    return usd
+
+class SalaryHistogram:
+    """Per-bucket log-spaced salary histograms, fed chunk by chunk"""
+
+    def __init__(self, bins: int = 1024, max_buckets: int = 20000):
+        self.bins = bins
+        self.max_buckets = max_buckets
+        self.log_low = np.log(MIN_SALARY_USD)
+        self.log_step = (np.log(MAX_SALARY_USD) - self.log_low) / bins
+        self.keys: Dict[Tuple[str, str], int] = {}
+        self.counts = np.zeros((0, bins), dtype=np.int32)
+        self.contributors: Set[Tuple[int, int]] = set()
+        self.dropped = 0
+
+    def add_chunk(
+        self,
+        user_ids: np.ndarray,
+        role_titles: np.ndarray,
+        locations: np.ndarray,
+        work_modes: np.ndarray,
+        salary_min: np.ndarray,
+        salary_max: np.ndarray,
+        currencies: np.ndarray
+    ) -> None:
+        usd = to_usd(salary_min, salary_max, currencies)
+        valid = ~np.isnan(usd)
+        if not valid.any():
+            return
+
+        roles = _map_unique(role_titles[valid], normalize_role)
+        places = _map_unique(
+            np.char.add(np.char.add(locations[valid].astype(str), "\x1f"), work_modes[valid].astype(str)),
+            lambda value: normalize_location(*value.split("\x1f"))
+        )
+        bin_ids = np.clip(
+            ((np.log(usd[valid]) - self.log_low) / self.log_step).astype(np.int64), 0, self.bins - 1
+        )
+
+        # Every salary counts towards its city bucket and the role-wide bucket
+        local_ids = self._bucket_ids(roles, places)
+        global_ids = self._bucket_ids(roles, np.full(len(roles), ANY_LOCATION, dtype=object))
+        bucket_ids = np.concatenate([local_ids, global_ids])
+        bin_ids = np.concatenate([bin_ids, bin_ids])
+        users = np.concatenate([user_ids[valid], user_ids[valid]])
+
+        keep = bucket_ids >= 0
+        self.dropped += int((~keep).sum())
+        cells, hits = np.unique(bucket_ids[keep] * self.bins + bin_ids[keep], return_counts=True)
+        self.counts.reshape(-1)[cells] += hits.astype(np.int32)
+
+        pairs = np.unique(np.stack([bucket_ids[keep], users[keep]], axis=1), axis=0)
+        self.contributors.update(map(tuple, pairs.tolist()))
+
+    def _bucket_ids(self, roles: np.ndarray, places: np.ndarray) -> np.ndarray:
+        pairs = np.char.add(np.char.add(roles.astype(str), "\x1f"), places.astype(str))
+        uniques, inverse = np.unique(pairs, return_inverse=True)
+        ids = np.empty(len(uniques), dtype=np.int64)
+        for index, pair in enumerate(uniques):
+            key = tuple(pair.split("\x1f"))
+            if key not in self.keys and len(self.keys) < self.max_buckets and key[0]:
+                self.keys[key] = len(self.keys)
+            ids[index] = self.keys.get(key, -1)
+
+        if len(self.keys) > self.counts.shape[0]:
+            grown = np.zeros((min(max(len(self.keys), self.counts.shape[0] * 2), self.max_buckets), self.bins), dtype=np.int32)
+            grown[:self.counts.shape[0]] = self.counts
+            self.counts = grown
+        return ids[inverse]
+
+    def percentiles(self, min_samples: int = 5) -> List[Dict[str, float]]:
+        """
+        Interpolated p25/p50/p75/p90 (USD) for buckets with salaries from at
+        least ``min_samples`` distinct users; sample_size is that user count.
+        """
+        used = len(self.keys)
+        counts = self.counts[:used].astype(np.int64)
+        users = np.zeros(used, dtype=np.int64)
+        if self.contributors:
+            buckets = np.fromiter((bucket for bucket, _ in self.contributors), dtype=np.int64)
+            users = np.bincount(buckets, minlength=used)
+        eligible = np.nonzero(users >= max(min_samples, 1))[0]
+        if not len(eligible):
+            return []
+
+        counts = counts[eligible]
+        totals = counts.sum(axis=1)
+        cumulative = counts.cumsum(axis=1)
+        rows = np.arange(len(eligible))
+        results = {}
+        for q in PERCENTILES:
+            target = totals * q / 100
+            index = (cumulative < target[:, None]).sum(axis=1)
+            before = np.where(index > 0, cumulative[rows, np.maximum(index - 1, 0)], 0)
+            fraction = (target - before) / np.maximum(counts[rows, index], 1)
+            results[q] = np.exp(self.log_low + (index + fraction) * self.log_step)
+
+        keys = list(self.keys)
+        return [
+            {
+                "role_key": keys[bucket][0],
+                "location_key": keys[bucket][1],
+                "sample_size": int(users[bucket]),
+                **{f"p{q}": round(float(results[q][i]), 2) for q in PERCENTILES}
+            }
+            for i, bucket in enumerate(eligible)
+        ]
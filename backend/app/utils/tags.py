@@ -0,0 +1,18 @@
+from typing import Iterable, List, Optional
+
+MAX_TAG_LENGTH = 50
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """Trimmed, lower-cased, de-duplicated tags in first-seen order"""
+    normalized = []
+    for tag in tags or ():
+        tag = " ".join(tag.split()).lower()
+        if len(tag) > MAX_TAG_LENGTH:
+            raise ValueError(f"Tags are limited to {MAX_TAG_LENGTH} characters")
+        if tag and tag not in normalized:
+            normalized.append(tag)
+    return normalized
+
+def parse_tags(value: Optional[str]) -> List[str]:
+    """Comma-separated query parameter -> normalized tags"""
+    return normalize_tags(value.split(",")) if value else []
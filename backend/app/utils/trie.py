@@ -0,0 +1,63 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+class _Node:
+    __slots__ = ("children", "names")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # Display spelling -> weight, for names ending at this node
+        self.names: Dict[str, int] = {}
+
+class PrefixTrie:
+    """
+    Case-insensitive prefix index of weighted names (e.g. company name ->
+    number of interviews). Lookups cost O(len(prefix)) plus a walk of the
+    matching subtree, which stays small for per-user data.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, int]] = None):
+        self._root = _Node()
+        for name, weight in (weights or {}).items():
+            self.add(name, weight)
+
+    def add(self, name: str, weight: int = 1) -> None:
+        node = self._root
+        for char in name.lower():
+            node = node.children.setdefault(char, _Node())
+        node.names[name] = node.names.get(name, 0) + weight
+
+    def remove(self, name: str, weight: int = 1) -> None:
+        path = [self._root]
+        for char in name.lower():
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+
+        node = path[-1]
+        if node.names.get(name, 0) > weight:
+            node.names[name] -= weight
+            return
+        node.names.pop(name, None)
+        # Prune branches left without names
+        for char, (parent, child) in zip(reversed(name.lower()), zip(reversed(path[:-1]), reversed(path[1:]))):
+            if child.names or child.children:
+                break
+            del parent.children[char]
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """Names starting with ``prefix``, heaviest first (ties alphabetical)"""
+        node = self._root
+        for char in prefix.lower():
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        matches = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            matches.extend(node.names.items())
+            stack.extend(node.children.values())
+        return heapq.nsmallest(limit, matches, key=lambda item: (-item[1], item[0].lower()))
@@ -0,0 +1,47 @@
+"""
+Background rebalance for board card ranks.
+
+Moves write a single rank between the neighbouring cards, so keys grow when
+cards are repeatedly dropped into the same gap. This rewrites columns whose
+keys have outgrown BOARD_RANK_MAX_LENGTH (or collided) with short, evenly
+spaced ranks in their current order.
+
+Run with: python -m app.workers.board_ranks
+"""
+
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories.interview import InterviewRepository
+from app.repositories.user import UserRepository
+from app.utils.ranks import ranks_between
+
+logger = logging.getLogger(__name__)
+
+def rebalance_board_ranks(db: Session, max_length: int = 48) -> int:
+    """Respace every column holding an over-long rank. Returns columns rewritten."""
+    repo = InterviewRepository(db)
+    user_repo = UserRepository(db)
+    columns = repo.get_columns_to_rebalance(max_length)
+    for user_id, status in columns:
+        ids = repo.get_column_ids(user_id, status)
+        # Respaced cards reach clients through the change feed like any move
+        change_seq = user_repo.bump_data_version(user_id)
+        repo.set_ranks(dict(zip(ids, ranks_between(None, None, len(ids)))), change_seq)
+        db.commit()
+    return len(columns)
+
+def main() -> None:
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    db = SessionLocal()
+    try:
+        columns = rebalance_board_ranks(db, settings.BOARD_RANK_MAX_LENGTH)
+        logger.info("Rebalanced board ranks in %d columns", columns)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
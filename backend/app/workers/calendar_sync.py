@@ -0,0 +1,117 @@
+"""
+Calendar sync worker.
+
+Drains the calendar_sync_jobs outbox and pushes changes to external calendar
+providers, keeping HTTP request latency independent of the providers.
+
+Run with: python -m app.workers.calendar_sync [--once]
+"""
+
+import argparse
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.calendar_sync_job import CalendarSyncJob, SyncJobAction
+from app.repositories.calendar_event import CalendarEventRepository
+from app.repositories.calendar_sync_job import CalendarSyncJobRepository
+from app.services.calendar_providers import get_provider
+
+logger = logging.getLogger(__name__)
+
+class CalendarSyncWorker:
+    def __init__(self, db: Session):
+        self.db = db
+        self.job_repo = CalendarSyncJobRepository(db)
+        self.calendar_repo = CalendarEventRepository(db)
+
+    def run_once(self) -> int:
+        """Claim and process one batch. Returns the number of jobs claimed."""
+        jobs = self.job_repo.claim_batch(
+            limit=settings.CALENDAR_SYNC_BATCH_SIZE,
+            lock_timeout_seconds=settings.CALENDAR_SYNC_LOCK_TIMEOUT_SECONDS
+        )
+        if not jobs:
+            return 0
+        
+        batches: Dict[Tuple[str, SyncJobAction], List[CalendarSyncJob]] = defaultdict(list)
+        for job in jobs:
+            batches[(job.calendar_provider, job.action)].append(job)
+        
+        for (provider_name, action), batch in batches.items():
+            try:
+                if action == SyncJobAction.UPSERT:
+                    self._push_upserts(provider_name, batch)
+                else:
+                    self._push_deletes(provider_name, batch)
+                for job in batch:
+                    self.job_repo.mark_done(job)
+            except Exception as e:
+                logger.warning(
+                    "Calendar sync batch failed (provider=%s, action=%s, jobs=%d): %s",
+                    provider_name, action.value, len(batch), e
+                )
+                self.db.rollback()
+                for job in batch:
+                    self.job_repo.mark_retry(
+                        job,
+                        error=str(e),
+                        max_attempts=settings.CALENDAR_SYNC_MAX_ATTEMPTS,
+                        backoff_base_seconds=settings.CALENDAR_SYNC_BACKOFF_BASE_SECONDS,
+                        backoff_max_seconds=settings.CALENDAR_SYNC_BACKOFF_MAX_SECONDS
+                    )
+            self.db.commit()
+        
+        return len(jobs)
+
+    def _push_upserts(self, provider_name: str, jobs: List[CalendarSyncJob]) -> None:
+        provider = get_provider(provider_name)
+        events = self.calendar_repo.get_by_ids([job.calendar_event_id for job in jobs])
+        if not events:
+            # Events were deleted after the job was queued
+            return
+        
+        external_ids = provider.push_events(events)
+        for event in events:
+            external_id = external_ids.get(event.id)
+            if external_id:
+                event.external_event_id = external_id
+                event.is_synced = True
+
+    def _push_deletes(self, provider_name: str, jobs: List[CalendarSyncJob]) -> None:
+        provider = get_provider(provider_name)
+        provider.delete_events([job.external_event_id for job in jobs if job.external_event_id])
+
+def run_worker(poll_interval: float, once: bool = False) -> None:
+    logger.info("Calendar sync worker started")
+    while True:
+        db = SessionLocal()
+        try:
+            processed = CalendarSyncWorker(db).run_once()
+        except Exception:
+            logger.exception("Calendar sync worker iteration failed")
+            db.rollback()
+            processed = 0
+        finally:
+            db.close()
+        
+        if once:
+            return
+        if not processed:
+            time.sleep(poll_interval)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JobSift calendar sync worker")
+    parser.add_argument("--once", action="store_true", help="Process a single batch and exit")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    run_worker(settings.CALENDAR_SYNC_POLL_INTERVAL_SECONDS, once=args.once)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Offline job maintaining the cross-user cohort funnel benchmarks.
+
+Only weekly (work_mode, week) cohorts queued in cohort_refresh_queue by
+interview writes are reprocessed: their interviews are streamed in chunks
+into NumPy arrays, reduced per cohort, and written back together with the
+week-over-week velocity and the trailing window the dashboard reads.
+
+Run with: python -m app.workers.cohorts
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.interview import ApplicationStatus, WorkMode, REACHED_INTERVIEW
+from app.repositories.cohort import ALL_MODES, TRAILING, CohortRepository
+from app.utils.cohorts import EPOCH, CohortAccumulator, iso_period, week_index, week_start
+
+logger = logging.getLogger(__name__)
+
+def _percent(part: int, whole: int) -> float:
+    return round(part / whole * 100, 2) if whole else 0.0
+
+def _with_rates(row: Dict[str, Any]) -> Dict[str, Any]:
+    row["interview_rate"] = _percent(row["interviews"], row["applications"])
+    row["offer_rate"] = _percent(row["offers"], row["applications"])
+    row["applications_per_user"] = round(row["applications"] / row["users"], 2) if row["users"] else 0.0
+    return row
+
+def _velocity(previous: Optional[float], current: float) -> Optional[float]:
+    return round((current - previous) / previous * 100, 2) if previous else None
+
+def _chunk_arrays(rows, modes: List[str]):
+    user_ids = np.fromiter((row[0].int & 0x7FFFFFFFFFFFFFFF for row in rows), dtype=np.int64, count=len(rows))
+    mode_codes = np.fromiter((modes.index(row[1].value) for row in rows), dtype=np.int64, count=len(rows))
+    days = np.fromiter((week_start(row[3]).toordinal() - EPOCH.toordinal() for row in rows), dtype=np.int64, count=len(rows))
+    reached = np.fromiter((row[2] in REACHED_INTERVIEW for row in rows), dtype=np.float64, count=len(rows))
+    offered = np.fromiter((row[2] == ApplicationStatus.OFFER for row in rows), dtype=np.float64, count=len(rows))
+    return user_ids, mode_codes, days, reached, offered
+
+def _refresh_velocity(repo: CohortRepository, since: date) -> None:
+    previous: Dict[str, Any] = {}
+    for row in repo.get_weekly(since - timedelta(days=7)):
+        before = previous.get(row.work_mode)
+        consecutive = before is not None and before.week_start == row.week_start - timedelta(days=7)
+        row.velocity = _velocity(before.applications_per_user if consecutive else None, row.applications_per_user)
+        previous[row.work_mode] = row
+
+def _refresh_trailing(repo: CohortRepository, weeks: int) -> None:
+    current = week_start(datetime.now(timezone.utc))
+    first_week = current - timedelta(weeks=weeks - 1)
+    series: Dict[str, Dict[date, Dict[str, int]]] = {}
+    for row in repo.get_weekly(first_week):
+        for mode in (row.work_mode, ALL_MODES):
+            week = series.setdefault(mode, {}).setdefault(
+                row.week_start, {"applications": 0, "users": 0, "interviews": 0, "offers": 0}
+            )
+            for field in week:
+                week[field] += getattr(row, field)
+    
+    # Weekly user counts can't be summed across weeks without counting
+    # user-weeks, so the window's distinct users come straight from interviews
+    window_users = repo.count_users_since(datetime.combine(first_week, time.min, tzinfo=timezone.utc))
+    
+    trailing = []
+    for mode, by_week in series.items():
+        totals = {field: sum(week[field] for week in by_week.values()) for field in ("applications", "interviews", "offers")}
+        totals["users"] = window_users.get(mode, 0)
+        last = by_week.get(current) or by_week.get(current - timedelta(days=7))
+        before = by_week.get(current - timedelta(days=7 if current in by_week else 14))
+        velocity = None
+        if last and before and before["users"] and last["users"]:
+            velocity = _velocity(before["applications"] / before["users"], last["applications"] / last["users"])
+        trailing.append(_with_rates({"work_mode": mode, "period": TRAILING, "week_start": None, "velocity": velocity, **totals}))
+    
+    stale = [(mode, TRAILING) for mode in [m.value for m in WorkMode] + [ALL_MODES]]
+    repo.replace_periods(stale, trailing)
+
+def refresh_cohort_benchmarks(db: Session) -> int:
+    """Recompute queued cohorts and the trailing window. Returns cohorts processed."""
+    repo = CohortRepository(db)
+    dirty = repo.get_dirty()
+    
+    if dirty:
+        modes = [mode.value for mode in WorkMode]
+        accumulator = CohortAccumulator(modes)
+        only = np.array([
+            week_index(np.int64(row.week_start.toordinal() - EPOCH.toordinal())) * len(modes) + modes.index(row.work_mode)
+            for row in dirty
+        ], dtype=np.int64)
+        first_week = min(row.week_start for row in dirty)
+        since = datetime.combine(first_week, time.min, tzinfo=timezone.utc)
+        until = datetime.combine(max(row.week_start for row in dirty) + timedelta(days=7), time.min, tzinfo=timezone.utc)
+        
+        dirty_modes = sorted({row.work_mode for row in dirty})
+        for rows in repo.iter_interview_chunks(
+            [WorkMode(mode) for mode in dirty_modes], since, until, settings.COHORT_BENCHMARK_CHUNK_SIZE
+        ):
+            accumulator.add_chunk(*_chunk_arrays(rows, modes), only=only)
+        
+        weekly = [
+            _with_rates({**row, "period": iso_period(row["week_start"])})
+            for row in accumulator.results()
+        ]
+        repo.replace_periods([(row.work_mode, iso_period(row.week_start)) for row in dirty], weekly)
+        db.flush()
+        _refresh_velocity(repo, first_week)
+    
+    _refresh_trailing(repo, settings.COHORT_BENCHMARK_TRAILING_WEEKS)
+    repo.clear_dirty(dirty)
+    db.commit()
+    logger.info("Recomputed %d cohorts", len(dirty))
+    return len(dirty)
+
+def main() -> None:
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    db = SessionLocal()
+    try:
+        refresh_cohort_benchmarks(db)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
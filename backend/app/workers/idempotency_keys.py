@@ -0,0 +1,34 @@
+"""
+Purge expired Idempotency-Key rows. Expired keys are already ignored by the
+API; this only keeps the table small.
+
+Run with: python -m app.workers.idempotency_keys
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories.idempotency_key import IdempotencyKeyRepository
+
+logger = logging.getLogger(__name__)
+
+def purge_idempotency_keys(db: Session) -> int:
+    """Delete every expired key. Returns rows removed."""
+    removed = IdempotencyKeyRepository(db).purge_expired(datetime.now(timezone.utc))
+    db.commit()
+    return removed
+
+def main() -> None:
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    db = SessionLocal()
+    try:
+        logger.info("Purged %d expired idempotency keys", purge_idempotency_keys(db))
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
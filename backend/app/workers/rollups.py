@@ -0,0 +1,62 @@
+"""
+Nightly maintenance for the daily_user_activity rollup.
+
+Compacts the append-only delta rows written on every interview change into a
+single row per (user, day, company), and can rebuild rollups from the
+interviews table for backfills or repairs.
+
+Run with: python -m app.workers.rollups [--rebuild-all]
+"""
+
+import argparse
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.user import User
+from app.repositories.daily_activity import DailyActivityRepository
+
+logger = logging.getLogger(__name__)
+
+def compact_daily_activity(db: Session, grace_days: int = 1) -> int:
+    """Compact every day older than grace_days. Returns rows removed."""
+    before = datetime.now(timezone.utc).date() - timedelta(days=grace_days)
+    repo = DailyActivityRepository(db)
+    
+    total = 0
+    while True:
+        removed = repo.compact(before)
+        db.commit()
+        total += removed
+        if not removed:
+            return total
+
+def rebuild_all(db: Session) -> int:
+    repo = DailyActivityRepository(db)
+    users = 0
+    for (user_id,) in db.query(User.id).all():
+        repo.rebuild_for_user(user_id)
+        db.commit()
+        users += 1
+    return users
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JobSift rollup maintenance")
+    parser.add_argument("--rebuild-all", action="store_true", help="Rebuild every user's rollup from interviews")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    db = SessionLocal()
+    try:
+        if args.rebuild_all:
+            logger.info("Rebuilt daily activity for %d users", rebuild_all(db))
+        removed = compact_daily_activity(db, settings.ROLLUP_COMPACTION_GRACE_DAYS)
+        logger.info("Compacted daily activity, removed %d delta rows", removed)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Batch job rebuilding the platform-wide salary_benchmarks table.
+
+Streams salary ranges out of interviews in fixed-size chunks into NumPy
+arrays, normalizes them to USD with the local FX table and folds them into
+per-(role, location) histograms, so memory stays bounded at
+SALARY_BENCHMARK_MAX_BUCKETS x SALARY_BENCHMARK_BINS counters whatever the
+row count.
+
+Run with: python -m app.workers.salary_benchmarks
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories.salary_benchmark import SalaryBenchmarkRepository
+from app.utils.salary import SalaryHistogram
+
+logger = logging.getLogger(__name__)
+
+def _column(rows, index: int) -> np.ndarray:
+    return np.array(["" if row[index] is None else getattr(row[index], "value", row[index]) for row in rows], dtype=str)
+
+def _user_ids(rows, index: int) -> np.ndarray:
+    return np.fromiter((row[index].int & 0x7FFFFFFFFFFFFFFF for row in rows), dtype=np.int64, count=len(rows))
+
+def _amounts(rows, index: int) -> np.ndarray:
+    return np.array([np.nan if row[index] is None else float(row[index]) for row in rows], dtype=np.float64)
+
+def compute_salary_benchmarks(db: Session, min_samples: Optional[int] = None) -> int:
+    """Rebuild every benchmark. Returns the number of buckets written."""
+    repo = SalaryBenchmarkRepository(db)
+    histogram = SalaryHistogram(
+        bins=settings.SALARY_BENCHMARK_BINS,
+        max_buckets=settings.SALARY_BENCHMARK_MAX_BUCKETS
+    )
+    
+    rows_read = 0
+    for rows in repo.iter_salary_chunks(settings.SALARY_BENCHMARK_CHUNK_SIZE):
+        histogram.add_chunk(
+            user_ids=_user_ids(rows, 0),
+            role_titles=_column(rows, 1),
+            locations=_column(rows, 2),
+            work_modes=_column(rows, 3),
+            salary_min=_amounts(rows, 4),
+            salary_max=_amounts(rows, 5),
+            currencies=_column(rows, 6)
+        )
+        rows_read += len(rows)
+    
+    if histogram.dropped:
+        logger.warning("Salary benchmark bucket limit reached, %d samples dropped", histogram.dropped)
+    
+    benchmarks = histogram.percentiles(
+        settings.SALARY_BENCHMARK_MIN_SAMPLES if min_samples is None else min_samples
+    )
+    repo.replace_all(benchmarks)
+    db.commit()
+    logger.info("Read %d salary rows into %d benchmarks", rows_read, len(benchmarks))
+    return len(benchmarks)
+
+def main() -> None:
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    db = SessionLocal()
+    try:
+        compute_salary_benchmarks(db)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
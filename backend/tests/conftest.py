@@ -1,12 +1,12 @@
 import pytest
 import asyncio
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.core.database import get_db, Base
+from app.core.database import get_db, Base, session_dependency
 from app.core.config import settings
 
 # Test database URL
@@ -19,12 +19,7 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+override_get_db = session_dependency(TestingSessionLocal)
 
 app.dependency_overrides[get_db] = override_get_db
 
@@ -35,6 +30,26 @@ def client():
         yield test_client
     Base.metadata.drop_all(bind=engine)
 
+@pytest.fixture
+def db_session(client):
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@pytest.fixture
+def query_log(client):
+    """SQL statements executed while the fixture is active"""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
 @pytest.fixture
 def test_user_data():
     return {
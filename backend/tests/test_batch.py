@@ -0,0 +1,53 @@
+DASHBOARD_PAGE = [
+    "/dashboard/summary",
+    "/dashboard/upcoming",
+    "/dashboard/recent-activity",
+    "/calendar/events",
+    "/interviews/metadata",
+]
+
+def test_batch_dashboard_page(client, authenticated_user, query_log):
+    """Test a batch answers like the separate calls with a single user lookup"""
+    client.post(
+        "/api/v1/interviews",
+        json={"company_name": "Acme", "role_title": "Engineer", "work_mode": "REMOTE"},
+        headers=authenticated_user
+    )
+    separate = {path: client.get(f"/api/v1{path}", headers=authenticated_user).json() for path in DASHBOARD_PAGE}
+    
+    query_log.clear()
+    response = client.post(
+        "/api/v1/batch",
+        json={"requests": [{"id": path, "path": path} for path in DASHBOARD_PAGE]},
+        headers=authenticated_user
+    )
+    assert response.status_code == 200
+    responses = response.json()["responses"]
+    assert [item["id"] for item in responses] == DASHBOARD_PAGE
+    assert all(item["status"] == 200 for item in responses)
+    assert {item["id"]: item["body"] for item in responses} == separate
+    assert len([s for s in query_log if "FROM users" in s]) == 1
+
+def test_batch_errors(client, authenticated_user):
+    """Test failing sub-requests are reported per item and bad batches are rejected"""
+    response = client.post(
+        "/api/v1/batch",
+        json={"requests": [
+            {"id": "missing", "path": "/interviews/00000000-0000-0000-0000-000000000000"},
+            {"id": "invalid", "path": "/interviews?limit=0"},
+            {"id": "stream", "path": "/dashboard/stream"},
+            {"id": "ok", "path": "/interviews?limit=5"},
+        ]},
+        headers=authenticated_user
+    )
+    assert [(item["id"], item["status"]) for item in response.json()["responses"]] == [
+        ("missing", 404), ("invalid", 422), ("stream", 400), ("ok", 200)
+    ]
+    
+    post = client.post("/api/v1/batch", json={"requests": [{"id": "a", "method": "POST", "path": "/interviews"}]}, headers=authenticated_user)
+    assert post.status_code == 422
+    duplicate_ids = client.post(
+        "/api/v1/batch", json={"requests": [{"id": "a", "path": "/dashboard/summary"}] * 2}, headers=authenticated_user
+    )
+    assert duplicate_ids.status_code == 422
+    assert client.post("/api/v1/batch", json={"requests": [{"id": "a", "path": "/dashboard/summary"}]}).status_code == 403
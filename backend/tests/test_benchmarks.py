@@ -0,0 +1,233 @@
+"""
+Latency benchmarks. Skipped by default; run with `make benchmark`
+(RUN_BENCHMARKS=1) against the test database.
+"""
+
+import os
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.cache import cache
+from app.models.interview import ApplicationStatus, WorkMode
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run benchmarks"),
+]
+
+def _current_user_id(client, headers):
+    return uuid.UUID(client.get("/api/v1/auth/me", headers=headers).json()["id"])
+
+def _seed_interviews(db_session, user_id, count):
+    from app.repositories.interview import InterviewRepository
+    
+    now = datetime.now(timezone.utc)
+    statuses = list(ApplicationStatus)
+    modes = list(WorkMode)
+    repo = InterviewRepository(db_session)
+    for start in range(0, count, 5000):
+        repo.bulk_insert([
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "company_name": f"Company {i % 500}",
+                "role_title": f"Engineer {i % 40}",
+                "work_mode": modes[i % len(modes)],
+                "application_status": statuses[i % len(statuses)],
+                "board_rank": f"{i:06d}",
+                "interview_date": now + timedelta(hours=i % 2000 - 1000),
+                "created_at": now - timedelta(minutes=i * 7),
+                "updated_at": now - timedelta(minutes=i * 3)
+            }
+            for i in range(start, min(start + 5000, count))
+        ])
+    db_session.commit()
+
+def _timed(call, runs=20):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+def test_dashboard_summary_latency_50k(client, authenticated_user, db_session):
+    """Dashboard summary at 50k interviews for one user"""
+    _seed_interviews(db_session, _current_user_id(client, authenticated_user), 50_000)
+    
+    def summary():
+        cache.clear()  # Time the computation, not the cached snapshot
+        response = client.get("/api/v1/dashboard/summary", headers=authenticated_user)
+        assert response.status_code == 200
+        assert response.json()["summary"]["total_interviews"] == 50_000
+    
+    p50, p95 = _timed(summary)
+    assert p95 < 250, f"p50={p50:.1f}ms p95={p95:.1f}ms"
+
+@pytest.mark.parametrize("count", [100, 10_000])
+def test_board_move_writes_one_row(client, authenticated_user, db_session, query_log, count):
+    """A board move rewrites one interview row however long the column is"""
+    _seed_interviews(db_session, _current_user_id(client, authenticated_user), count)
+    cards = client.get("/api/v1/interviews/board/APPLIED?limit=100", headers=authenticated_user).json()["cards"]
+    
+    query_log.clear()
+    started = time.perf_counter()
+    response = client.post(
+        f"/api/v1/interviews/{cards[-1]['id']}/move",
+        json={"before_id": cards[0]["id"], "after_id": cards[1]["id"]},
+        headers=authenticated_user
+    )
+    elapsed = (time.perf_counter() - started) * 1000
+    assert response.status_code == 200
+    
+    writes = [s for s in query_log if s.lstrip().upper().startswith("UPDATE INTERVIEWS")]
+    assert len(writes) == 1, f"count={count} writes={len(writes)} {elapsed:.1f}ms"
+
+def test_company_suggest_latency_50k(client, authenticated_user, db_session):
+    """Company autocomplete at 50k interviews (500 companies) for one user"""
+    _seed_interviews(db_session, _current_user_id(client, authenticated_user), 50_000)
+    from app.models.user import User
+    from app.services.interview import InterviewService
+    
+    user = db_session.query(User).one()
+    service = InterviewService(db_session)
+    assert service.suggest_companies(user, "company 1")  # builds the trie
+    
+    p50, p95 = _timed(lambda: service.suggest_companies(user, "company 1"), runs=200)
+    assert p95 < 5, f"p50={p50:.2f}ms p95={p95:.2f}ms"
+
+def test_duplicate_check_latency_100k(client, authenticated_user, db_session):
+    """Duplicate lookup for one insert at 100k interviews (200 per company)"""
+    from app.models.interview import Interview
+    from app.models.user import User
+    from app.repositories.interview_signature import InterviewSignatureRepository, signature_row
+    from app.services.interview import InterviewService
+    
+    user_id = _current_user_id(client, authenticated_user)
+    _seed_interviews(db_session, user_id, 100_000)
+    InterviewSignatureRepository(db_session).bulk_insert([
+        signature_row(user_id, interview_id, company_name, role_title)
+        for interview_id, company_name, role_title in
+        db_session.query(Interview.id, Interview.company_name, Interview.role_title)
+    ])
+    db_session.commit()
+    
+    user = db_session.query(User).one()
+    service = InterviewService(db_session)
+    assert service.find_duplicates(user, "Company 7, Inc.", "Engineer 7")
+    
+    p50, p95 = _timed(lambda: service.find_duplicates(user, "Company 7, Inc.", "Engineer 7"), runs=200)
+    assert p95 < 2, f"p50={p50:.2f}ms p95={p95:.2f}ms"
+
+def test_tag_filter_latency_100k(client, authenticated_user, db_session):
+    """Tag-filtered first page and tag facets at 100k interviews, 1% tagged"""
+    from app.models.interview import Interview
+    from app.repositories.interview_tag import InterviewTagRepository
+    
+    user_id = _current_user_id(client, authenticated_user)
+    _seed_interviews(db_session, user_id, 100_000)
+    ids = [interview_id for (interview_id,) in db_session.query(Interview.id)]
+    repo = InterviewTagRepository(db_session)
+    repo.add_tags(user_id, ids[::100], ["referral"])
+    repo.add_tags(user_id, ids[::2], ["remote"])
+    db_session.commit()
+    
+    def filtered():
+        response = client.get(
+            "/api/v1/interviews?tags_all=referral,remote&limit=50&facets=tags", headers=authenticated_user
+        )
+        assert response.status_code == 200
+        assert response.json()["facets"]["tags"] == {"referral": 1000, "remote": 1000}
+    
+    p50, p95 = _timed(filtered)
+    assert p95 < 250, f"p50={p50:.1f}ms p95={p95:.1f}ms"
+
+def test_dashboard_page_load_batched(client, authenticated_user, db_session):
+    """Dashboard page fan-out: five separate requests vs one POST /batch, at 5k interviews"""
+    from tests.test_batch import DASHBOARD_PAGE
+    
+    _seed_interviews(db_session, _current_user_id(client, authenticated_user), 5_000)
+    
+    def separate():
+        for path in DASHBOARD_PAGE:
+            assert client.get(f"/api/v1{path}", headers=authenticated_user).status_code == 200
+    
+    def batched():
+        response = client.post(
+            "/api/v1/batch",
+            json={"requests": [{"id": path, "path": path} for path in DASHBOARD_PAGE]},
+            headers=authenticated_user
+        )
+        assert all(item["status"] == 200 for item in response.json()["responses"])
+    
+    before = _timed(separate)
+    after = _timed(batched)
+    print(f"\ndashboard page: separate p50={before[0]:.1f}ms p95={before[1]:.1f}ms, "
+          f"batched p50={after[0]:.1f}ms p95={after[1]:.1f}ms")
+    assert after[0] < before[0]
+
+def test_pool_pressure_slow_clients(client, authenticated_user, db_session, monkeypatch):
+    """Peak pooled connections for 50 concurrent list requests whose clients read slowly, with and without early release"""
+    import asyncio
+    import httpx
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import sessionmaker
+    from app.api import deps
+    from app.core.database import LazySession, get_db
+    from app.main import app
+    
+    _seed_interviews(db_session, _current_user_id(client, authenticated_user), 2_000)
+    engine = create_engine(db_session.get_bind().url, connect_args={"check_same_thread": False}, pool_size=50, max_overflow=0)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    pool = {"checked_out": 0, "peak": 0}
+    
+    @event.listens_for(engine, "checkout")
+    def checkout(*args):
+        pool["checked_out"] += 1
+        pool["peak"] = max(pool["peak"], pool["checked_out"])
+    
+    @event.listens_for(engine, "checkin")
+    def checkin(*args):
+        pool["checked_out"] -= 1
+    
+    def bench_db():
+        db = LazySession(factory)
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    async def slow_client_app(scope, receive, send):
+        async def slow_send(message):
+            if message["type"] == "http.response.body":
+                await asyncio.sleep(0.01)  # The client drains the body over a slow link
+            await send(message)
+        await app(scope, receive, slow_send)
+    
+    async def load():
+        transport = httpx.ASGITransport(app=slow_client_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            responses = await asyncio.gather(*(
+                http.get("/api/v1/interviews?limit=100", headers=authenticated_user) for _ in range(50)
+            ))
+        assert all(response.status_code == 200 for response in responses)
+    
+    def peak_connections():
+        pool["peak"] = 0
+        started = time.perf_counter()
+        asyncio.run(load())
+        return pool["peak"], (time.perf_counter() - started) * 1000
+    
+    monkeypatch.setitem(app.dependency_overrides, get_db, bench_db)
+    after = peak_connections()
+    monkeypatch.setattr(deps, "release_connection", lambda db: None)
+    before = peak_connections()
+    engine.dispose()
+    print(f"\npool pressure (50 slow clients): held until sent peak={before[0]} in {before[1]:.0f}ms, "
+          f"released on return peak={after[0]} in {after[1]:.0f}ms")
+    assert after[0] < before[0]
@@ -0,0 +1,220 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.calendar_event import CalendarEvent
+from app.models.interview import Interview, WorkMode
+from app.models.calendar_sync_job import CalendarSyncJob, SyncJobAction, SyncJobStatus
+from app.workers.calendar_sync import CalendarSyncWorker
+
+def _create_interview(client, headers, **overrides):
+    interview_data = {
+        "company_name": "Calendar Corp",
+        "role_title": "Engineer",
+        "work_mode": "REMOTE",
+        "interview_date": "2030-01-15T10:00:00+00:00",
+        **overrides
+    }
+    response = client.post("/api/v1/interviews", json=interview_data, headers=headers)
+    return response.json()
+
+def test_google_sync_is_queued(client, authenticated_user, db_session):
+    """Test Google sync only writes the event and an outbox job"""
+    interview = _create_interview(client, authenticated_user)
+    
+    response = client.post(
+        "/api/v1/calendar/google/sync",
+        json={"interview_id": interview["id"]},
+        headers=authenticated_user
+    )
+    assert response.status_code == 202
+    assert response.json()["status"] == "queued"
+    assert response.json()["calendar_url"] == (
+        f"https://calendar.google.com/calendar/event?eid=google_event_{interview['id']}"
+    )
+    
+    event = db_session.query(CalendarEvent).one()
+    assert event.is_synced is False
+    job = db_session.query(CalendarSyncJob).one()
+    assert job.action == SyncJobAction.UPSERT
+    assert job.status == SyncJobStatus.PENDING
+
+def test_worker_marks_event_synced(client, authenticated_user, db_session):
+    """Test the sync worker drains the outbox and marks events synced"""
+    interview = _create_interview(client, authenticated_user)
+    client.post(
+        "/api/v1/calendar/google/sync",
+        json={"interview_id": interview["id"]},
+        headers=authenticated_user
+    )
+    
+    assert CalendarSyncWorker(db_session).run_once() == 1
+    
+    event = db_session.query(CalendarEvent).one()
+    assert event.is_synced is True
+    assert event.external_event_id
+    assert db_session.query(CalendarSyncJob).one().status == SyncJobStatus.DONE
+    assert CalendarSyncWorker(db_session).run_once() == 0
+
+def test_reschedule_queues_resync(client, authenticated_user, db_session):
+    """Test moving an interview date re-queues its synced calendar events"""
+    interview = _create_interview(client, authenticated_user)
+    client.post(
+        "/api/v1/calendar/google/sync",
+        json={"interview_id": interview["id"]},
+        headers=authenticated_user
+    )
+    CalendarSyncWorker(db_session).run_once()
+    
+    response = client.put(
+        f"/api/v1/interviews/{interview['id']}",
+        json={"interview_date": "2030-01-16T10:00:00+00:00"},
+        headers=authenticated_user
+    )
+    assert response.status_code == 200
+    
+    db_session.expire_all()
+    pending = (
+        db_session.query(CalendarSyncJob)
+        .filter(CalendarSyncJob.status == SyncJobStatus.PENDING)
+        .all()
+    )
+    assert len(pending) == 1
+    assert db_session.query(CalendarEvent).one().is_synced is False
+
+def test_delta_sync_only_pushes_changes(client, authenticated_user, db_session):
+    """Test delta sync queues new interviews once and is a no-op afterwards"""
+    for i in range(3):
+        _create_interview(client, authenticated_user, company_name=f"Delta {i}")
+    
+    response = client.post("/api/v1/calendar/google/delta-sync", headers=authenticated_user)
+    assert response.status_code == 202
+    assert response.json()["created"] == 3
+    
+    CalendarSyncWorker(db_session).run_once()
+    
+    response = client.post("/api/v1/calendar/google/delta-sync", headers=authenticated_user)
+    data = response.json()
+    assert data["created"] == 0
+    assert data["moved"] == 0
+    assert data["advanced_to"] is None
+
+def test_delta_sync_picks_up_late_commits(client, authenticated_user, db_session):
+    """Test a write stamped before the cursor (committed late) is still pushed, once"""
+    from app.models.calendar_sync_cursor import CalendarSyncCursor
+    
+    _create_interview(client, authenticated_user, company_name="Early")
+    client.post("/api/v1/calendar/google/delta-sync", headers=authenticated_user)
+    CalendarSyncWorker(db_session).run_once()
+    
+    # now() is the transaction start, so a slow transaction lands behind the cursor
+    cursor = db_session.query(CalendarSyncCursor).one()
+    late = Interview(
+        user_id=db_session.query(Interview.user_id).scalar(),
+        company_name="Late",
+        role_title="Engineer",
+        work_mode=WorkMode.REMOTE,
+        board_rank="i",
+        interview_date=datetime(2030, 1, 20, 10, tzinfo=timezone.utc),
+        updated_at=cursor.synced_until - timedelta(seconds=30)
+    )
+    db_session.add(late)
+    db_session.commit()
+    
+    data = client.post("/api/v1/calendar/google/delta-sync", headers=authenticated_user).json()
+    assert (data["created"], data["moved"], data["unchanged"]) == (1, 0, 1)
+    assert data["advanced_to"] is None
+    
+    CalendarSyncWorker(db_session).run_once()
+    data = client.post("/api/v1/calendar/google/delta-sync", headers=authenticated_user).json()
+    assert (data["created"], data["moved"]) == (0, 0)
+
+def test_integration_status_per_provider(client, authenticated_user, db_session):
+    """Test integration status aggregates synced counts per provider"""
+    next_week = (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()
+    interview = _create_interview(client, authenticated_user, interview_date=next_week)
+    client.post(
+        "/api/v1/calendar/google/sync",
+        json={"interview_id": interview["id"]},
+        headers=authenticated_user
+    )
+    CalendarSyncWorker(db_session).run_once()
+    
+    response = client.get("/api/v1/calendar/integration-status", headers=authenticated_user)
+    assert response.status_code == 200
+    
+    data = response.json()
+    assert data["total_events"] == 1
+    assert data["synced_events"] == 1
+    assert data["providers"][0]["provider"] == "google"
+    assert data["providers"][0]["last_synced_at"] is not None
+
+def test_schedule_conflicts(client, authenticated_user):
+    """Test back-to-back overlapping interviews are reported"""
+    start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=2)
+    _create_interview(client, authenticated_user, interview_date=start.isoformat())
+    created = _create_interview(
+        client, authenticated_user,
+        company_name="Overlap Inc",
+        interview_date=(start + timedelta(minutes=30)).isoformat()
+    )
+    assert len(created["conflicts"]) == 1
+    
+    response = client.get("/api/v1/calendar/conflicts", headers=authenticated_user)
+    assert response.status_code == 200
+    
+    data = response.json()
+    assert data["total"] == 1
+    assert data["conflicts"][0]["overlap_minutes"] == 30
+
+ICS_EXPORT = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:abc-1@google.com\r\n"
+    "DTSTART:20300301T090000Z\r\n"
+    "DTEND:20300301T100000Z\r\n"
+    "SUMMARY:Interview: Backend Engineer at \r\n"
+    " Acme\r\n"
+    "LOCATION:https://meet.google.com/xyz\r\n"
+    "BEGIN:VALARM\r\n"
+    "DESCRIPTION:Reminder\r\n"
+    "END:VALARM\r\n"
+    "END:VEVENT\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:abc-1@google.com\r\n"
+    "DTSTART:20300301T090000Z\r\n"
+    "SUMMARY:Interview: Backend Engineer at Acme\r\n"
+    "END:VEVENT\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:abc-2@google.com\r\n"
+    "DTSTART;VALUE=DATE:20300302\r\n"
+    "SUMMARY:Dentist\r\n"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+def test_ics_import(client, authenticated_user, db_session):
+    """Test ICS import unfolds lines, skips non-interviews and dedupes on UID"""
+    files = {"file": ("export.ics", ICS_EXPORT.encode(), "text/calendar")}
+    response = client.post("/api/v1/calendar/ics/import", files=files, headers=authenticated_user)
+    assert response.status_code == 200
+    assert response.json() == {"imported": 1, "duplicates": 1, "possible_duplicates": 0, "skipped": 1}
+    
+    interview = db_session.query(Interview).one()
+    assert interview.company_name == "Acme"
+    assert interview.role_title == "Backend Engineer"
+    assert interview.work_mode == WorkMode.REMOTE
+    assert interview.calendar_events[0].external_event_id == "abc-1@google.com"
+    
+    analytics = client.get("/api/v1/dashboard/analytics", headers=authenticated_user).json()["analytics"]
+    assert analytics["top_companies"][0]["company_name"] == "Acme"
+    assert sum(m["applications"] for m in analytics["monthly_trends"]) == 1
+    
+    # Re-importing the same export creates nothing new
+    response = client.post("/api/v1/calendar/ics/import", files=files, headers=authenticated_user)
+    assert response.json()["imported"] == 0
+    
+    # A new UID for what looks like the same application is imported but flagged
+    similar = ICS_EXPORT.replace("abc-1@", "abc-3@").replace("Backend Engineer at \r\n Acme", "Sr. Backend Engineer at ACME Inc.")
+    files = {"file": ("export.ics", similar.encode(), "text/calendar")}
+    response = client.post("/api/v1/calendar/ics/import", files=files, headers=authenticated_user)
+    assert response.json() == {"imported": 1, "duplicates": 1, "possible_duplicates": 1, "skipped": 1}
@@ -84,3 +84,319 @@ def test_dashboard_unauthorized(client):
     for endpoint in endpoints:
         response = client.get(endpoint)
         assert response.status_code == 401
+
+def test_dashboard_analytics(client, authenticated_user, db_session):
+    """Test analytics are served from the daily activity rollup"""
+    for company in ["Acme", "Acme", "Globex"]:
+        client.post(
+            "/api/v1/interviews",
+            json={"company_name": company, "role_title": "Engineer", "work_mode": "REMOTE"},
+            headers=authenticated_user
+        )
+    
+    from app.workers.rollups import compact_daily_activity
+    compact_daily_activity(db_session, grace_days=-1)
+    
+    response = client.get("/api/v1/dashboard/analytics", headers=authenticated_user)
+    assert response.status_code == 200
+    
+    analytics = response.json()["analytics"]
+    assert sum(m["applications"] for m in analytics["monthly_trends"]) == 3
+    assert analytics["top_companies"][0]["company_name"] == "Acme"
+    assert analytics["top_companies"][0]["total_applications"] == 2
+
+
+def test_dashboard_analytics_follow_updates_and_deletes(client, authenticated_user, db_session):
+    """Test every rollup counter an interview added moves with it and is reversed on delete"""
+    from sqlalchemy import func
+    from app.models.daily_user_activity import DailyUserActivity
+    from app.repositories.daily_activity import COUNTERS
+    
+    def totals(company=None):
+        query = db_session.query(*[func.coalesce(func.sum(getattr(DailyUserActivity, c)), 0) for c in COUNTERS])
+        if company:
+            query = query.filter(DailyUserActivity.company_name == company)
+        return dict(zip(COUNTERS, query.one()))
+    
+    response = client.post(
+        "/api/v1/interviews",
+        json={"company_name": "Acme", "role_title": "Engineer", "work_mode": "REMOTE", "application_status": "SCREENING"},
+        headers=authenticated_user
+    )
+    interview_id = response.json()["id"]
+    assert totals()["responses"] == 1
+    
+    for status in ("HR_INTERVIEW", "OFFER"):
+        client.put(f"/api/v1/interviews/{interview_id}", json={"application_status": status}, headers=authenticated_user)
+    client.put(f"/api/v1/interviews/{interview_id}", json={"company_name": "Globex"}, headers=authenticated_user)
+    
+    moved = totals("Globex")
+    assert (moved["applications"], moved["interviews"], moved["offers"], moved["responses"]) == (1, 1, 1, 1)
+    assert not any(totals("Acme").values())
+    
+    client.delete(f"/api/v1/interviews/{interview_id}", headers=authenticated_user)
+    assert not any(totals().values())
+
+
+def test_dashboard_funnel(client, authenticated_user):
+    """Test funnel conversion is maintained from status transitions"""
+    ids = []
+    for company in ["Acme", "Globex", "Initech", "Umbrella"]:
+        response = client.post(
+            "/api/v1/interviews",
+            json={"company_name": company, "role_title": "Engineer", "work_mode": "REMOTE"},
+            headers=authenticated_user
+        )
+        ids.append(response.json()["id"])
+    
+    for interview_id, path in zip(ids, [["SCREENING", "OFFER"], ["SCREENING", "REJECTED"], ["REJECTED"]]):
+        for status in path:
+            client.put(
+                f"/api/v1/interviews/{interview_id}",
+                json={"application_status": status},
+                headers=authenticated_user
+            )
+    
+    response = client.get("/api/v1/dashboard/funnel", headers=authenticated_user)
+    assert response.status_code == 200
+    
+    funnel = response.json()
+    assert funnel["applications"] == 4
+    assert funnel["offers"] == 1
+    assert funnel["offer_rate"] == 25.0
+    
+    stages = {stage["status"]: stage for stage in funnel["stages"]}
+    assert stages["APPLIED"]["entered"] == 4
+    assert stages["APPLIED"]["exited"] == 3
+    assert stages["APPLIED"]["conversions"]["SCREENING"] == 50.0
+    assert stages["SCREENING"]["conversions"] == {"OFFER": 50.0, "REJECTED": 50.0}
+    assert stages["SCREENING"]["median_days_in_stage"] is not None
+    
+    stats = client.get("/api/v1/dashboard/stats", headers=authenticated_user).json()
+    assert stats["conversion_rate"] == 25.0
+    
+    # An offer regained after going on hold is still one offer
+    for status in ["ON_HOLD", "OFFER"]:
+        client.put(f"/api/v1/interviews/{ids[0]}", json={"application_status": status}, headers=authenticated_user)
+    funnel = client.get("/api/v1/dashboard/funnel", headers=authenticated_user).json()
+    assert funnel["offers"] == 1
+    assert {stage["status"]: stage for stage in funnel["stages"]}["OFFER"]["entered"] == 2
+    
+    # A deleted interview leaves the funnel
+    client.delete(f"/api/v1/interviews/{ids[1]}", headers=authenticated_user)
+    funnel = client.get("/api/v1/dashboard/funnel", headers=authenticated_user).json()
+    assert funnel["applications"] == 3
+    assert funnel["offer_rate"] == 33.33
+    stages = {stage["status"]: stage for stage in funnel["stages"]}
+    assert stages["SCREENING"]["entered"] == 1
+    assert stages["SCREENING"]["conversions"] == {"OFFER": 100.0}
+
+
+def test_cohort_benchmarks(client, authenticated_user, db_session, monkeypatch):
+    """Test the cohort job only reprocesses queued cohorts and feeds insights"""
+    from app.core.config import settings
+    from app.models.cohort_benchmark import CohortBenchmark
+    from app.models.cohort_refresh import CohortRefresh
+    from app.workers.cohorts import refresh_cohort_benchmarks
+    
+    ids = []
+    for i in range(6):
+        response = client.post(
+            "/api/v1/interviews",
+            json={"company_name": f"Company {i}", "role_title": "Engineer", "work_mode": "REMOTE"},
+            headers=authenticated_user
+        )
+        ids.append(response.json()["id"])
+    client.put(f"/api/v1/interviews/{ids[0]}", json={"application_status": "HR_INTERVIEW"}, headers=authenticated_user)
+    
+    assert db_session.query(CohortRefresh).count() == 1
+    assert refresh_cohort_benchmarks(db_session) == 1
+    assert db_session.query(CohortRefresh).count() == 0
+    assert refresh_cohort_benchmarks(db_session) == 0
+    
+    trailing = db_session.query(CohortBenchmark).filter_by(work_mode="REMOTE", period="trailing").one()
+    assert trailing.applications == 6
+    assert trailing.users == 1
+    assert trailing.interviews == 1
+    
+    # Pull the platform average down so this user's pipeline beats it
+    trailing.interview_rate = 5.0
+    db_session.commit()
+    monkeypatch.setattr(settings, "COHORT_BENCHMARK_MIN_USERS", 1)
+    
+    response = client.get("/api/v1/dashboard/summary", headers=authenticated_user)
+    assert any("remote applications reach interviews" in insight for insight in response.json()["insights"])
+    
+    # One user active over several weeks is still one user, not one per week
+    from datetime import datetime, timedelta, timezone
+    from app.models.interview import Interview, WorkMode
+    from app.repositories.cohort import CohortRepository
+    from app.utils.cohorts import week_start
+    
+    user_id = db_session.query(Interview.user_id).first()[0]
+    created = [datetime.now(timezone.utc) - timedelta(weeks=weeks) for weeks in (1, 2, 3)]
+    db_session.add_all([
+        Interview(user_id=user_id, company_name="Past Co", role_title="Engineer", work_mode=WorkMode.REMOTE, board_rank="i", created_at=at)
+        for at in created
+    ])
+    CohortRepository(db_session).mark_dirty(("REMOTE", week_start(at)) for at in created)
+    db_session.commit()
+    assert refresh_cohort_benchmarks(db_session) == 3
+    
+    for mode in ("REMOTE", "ALL"):
+        trailing = db_session.query(CohortBenchmark).filter_by(work_mode=mode, period="trailing").one()
+        db_session.refresh(trailing)
+        assert (trailing.applications, trailing.users, trailing.applications_per_user) == (9, 1, 9.0)
+
+
+def test_dashboard_summary_query_count(client, authenticated_user, query_log):
+    """Test the summary costs a fixed number of queries however many interviews exist"""
+    from datetime import datetime, timedelta, timezone
+    
+    def summary_queries():
+        query_log.clear()
+        response = client.get("/api/v1/dashboard/summary", headers=authenticated_user)
+        assert response.status_code == 200
+        return len([s for s in query_log if s.lstrip().upper().startswith(("SELECT", "WITH"))]), response.json()
+    
+    soon = (datetime.now(timezone.utc) + timedelta(days=2)).isoformat()
+    
+    def create_interviews(n):
+        for i in range(n):
+            client.post(
+                "/api/v1/interviews",
+                json={"company_name": f"Company {i}", "role_title": "Engineer", "work_mode": "REMOTE", "interview_date": soon},
+                headers=authenticated_user
+            )
+    
+    create_interviews(2)
+    small_count, _ = summary_queries()
+    create_interviews(6)
+    count, data = summary_queries()
+    
+    # Current user, summary statement, funnel, cohort benchmarks
+    assert count == small_count <= 4
+    assert data["summary"]["this_week_applications"] == 8
+    assert len(data["upcoming_interviews"]) == 5
+    assert len(data["recent_activity"]) == 5
+    assert "📅 You have 8 upcoming interviews this week!" in data["insights"]
+
+
+def test_dashboard_heatmap(client, authenticated_user):
+    """Test the weekday x hour heatmap and its per-user version cache"""
+    import calendar
+    from datetime import datetime, timezone
+    
+    ids = []
+    for i in range(3):
+        response = client.post(
+            "/api/v1/interviews",
+            json={"company_name": f"Company {i}", "role_title": "Engineer", "work_mode": "REMOTE"},
+            headers=authenticated_user
+        )
+        ids.append(response.json()["id"])
+    client.put(f"/api/v1/interviews/{ids[0]}", json={"application_status": "SCREENING"}, headers=authenticated_user)
+    client.put(f"/api/v1/interviews/{ids[1]}", json={"application_status": "REJECTED"}, headers=authenticated_user)
+    
+    response = client.get("/api/v1/dashboard/heatmap", headers=authenticated_user)
+    assert response.status_code == 200
+    
+    heatmap = response.json()
+    assert heatmap["timezone"] == "UTC"
+    assert len(heatmap["applications"]) == 7
+    assert all(len(day) == 24 for day in heatmap["applications"])
+    assert sum(map(sum, heatmap["applications"])) == 3
+    assert sum(map(sum, heatmap["positive_transitions"])) == 1
+    
+    now = datetime.now(timezone.utc)
+    assert heatmap["best_performing_day"] == calendar.day_name[now.weekday()]
+    assert heatmap["applications"][now.weekday()][now.hour] == 3
+    
+    # A write bumps the user's data version, so the cached matrix is replaced
+    client.post(
+        "/api/v1/interviews",
+        json={"company_name": "Company 3", "role_title": "Engineer", "work_mode": "REMOTE"},
+        headers=authenticated_user
+    )
+    heatmap = client.get("/api/v1/dashboard/heatmap", headers=authenticated_user).json()
+    assert sum(map(sum, heatmap["applications"])) == 4
+    
+    response = client.get("/api/v1/dashboard/heatmap?tz=Mars/Olympus", headers=authenticated_user)
+    assert response.status_code == 400
+
+
+def test_dashboard_heatmap_uses_offset_at_each_timestamp(client, authenticated_user, db_session):
+    """Test DST and half-hour zones convert each row with its own UTC offset"""
+    from datetime import datetime, timezone
+    from app.models.interview import Interview, WorkMode
+    from app.models.user import User
+    
+    user = db_session.query(User).one()
+    for created_at in (
+        datetime(2026, 1, 15, 14, 0, tzinfo=timezone.utc),   # Thu 09:00 EST (UTC-5)
+        datetime(2026, 7, 16, 13, 0, tzinfo=timezone.utc),   # Thu 09:00 EDT (UTC-4)
+        datetime(2026, 1, 15, 3, 45, tzinfo=timezone.utc),   # Thu 09:15 IST (UTC+5:30)
+    ):
+        db_session.add(Interview(
+            user_id=user.id, company_name="Acme", role_title="Engineer",
+            work_mode=WorkMode.REMOTE, board_rank="i", created_at=created_at
+        ))
+    db_session.commit()
+    
+    new_york = client.get("/api/v1/dashboard/heatmap?tz=America/New_York", headers=authenticated_user).json()
+    assert new_york["applications"][3][9] == 2
+    assert new_york["applications"][2][22] == 1  # 03:45 UTC is Wednesday 22:45 in New York
+    
+    kolkata = client.get("/api/v1/dashboard/heatmap?tz=Asia/Kolkata", headers=authenticated_user).json()
+    assert kolkata["applications"][3][9] == 1
+    assert kolkata["applications"][3][19] == 1  # 14:00 UTC
+    assert kolkata["applications"][3][18] == 1  # 13:00 UTC
+
+def test_dashboard_stream(client, authenticated_user, db_session, monkeypatch):
+    """Test the live dashboard sends a snapshot, then diffs of committed writes and heartbeats"""
+    import asyncio
+    import json
+    from app.api.v1.dashboard import dashboard_events
+    from app.core.config import settings
+    from app.core.events import broker
+    from app.models.user import User
+    from app.schemas.interview import InterviewCreate
+    from sqlalchemy.orm import Session
+    from app.services.interview import InterviewService
+    
+    monkeypatch.setattr(settings, "DASHBOARD_STREAM_HEARTBEAT_SECONDS", 0.05)
+    user = db_session.query(User).one()
+    
+    def parse(message):
+        fields = dict(line.split(": ", 1) for line in message.strip().splitlines() if not line.startswith("retry"))
+        return fields["event"], json.loads(fields["data"])
+    
+    async def scenario():
+        events = dashboard_events(db_session, user.id)
+        kind, snapshot = parse(await events.__anext__())
+        assert kind == "snapshot"
+        assert snapshot["summary"]["total_interviews"] == 0
+        assert snapshot["calendar_events"] == []
+        assert await events.__anext__() == ": heartbeat\n\n"
+        
+        # A rolled-back write notifies nobody; a committed one arrives as a diff
+        writer = Session(bind=db_session.get_bind())
+        try:
+            InterviewService(writer).user_repo.bump_data_version(user.id)
+            writer.rollback()
+            assert await events.__anext__() == ": heartbeat\n\n"
+            InterviewService(writer).create_interview(
+                writer.get(User, user.id),
+                InterviewCreate(company_name="Acme", role_title="Engineer", work_mode="REMOTE")
+            )
+        finally:
+            writer.close()
+        kind, diff = parse(await events.__anext__())
+        assert kind == "diff"
+        assert diff["summary"]["total_interviews"] == 1
+        assert "calendar_events" not in diff  # Unchanged keys are not resent
+        
+        await events.aclose()
+        assert user.id not in broker._subscribers
+    
+    asyncio.run(scenario())
@@ -74,3 +74,463 @@ def test_get_interviews_with_data(client, authenticated_user):
     data = response.json()
     assert len(data["interviews"]) == 3
     assert data["total"] == 3
+
+
+def test_salary_benchmark(client, authenticated_user, db_session):
+    """Test benchmarks are computed in batch and served per interview"""
+    interview_ids = []
+    for salary in [80000, 90000, 100000, 110000, 120000]:
+        response = client.post(
+            "/api/v1/interviews",
+            json={
+                "company_name": "Acme",
+                "role_title": "Sr. Software Engineer",
+                "work_mode": "ONSITE",
+                "location": "Berlin, Germany",
+                "salary_range_min": salary - 5000,
+                "salary_range_max": salary + 5000,
+                "currency": "EUR"
+            },
+            headers=authenticated_user
+        )
+        interview_ids.append(response.json()["id"])
+    
+    response = client.get(f"/api/v1/interviews/{interview_ids[0]}/salary-benchmark", headers=authenticated_user)
+    assert response.status_code == 404
+    
+    # Five offers from one person don't make a benchmark
+    from app.workers.salary_benchmarks import compute_salary_benchmarks
+    assert compute_salary_benchmarks(db_session, min_samples=5) == 0
+    
+    from app.models.interview import Interview, WorkMode
+    from app.models.user import User
+    for i, salary in enumerate([80000, 90000, 100000, 110000]):
+        user = User(email=f"peer{i}@example.com", password_hash="x", full_name=f"Peer {i}")
+        db_session.add(user)
+        db_session.flush()
+        db_session.add(Interview(
+            user_id=user.id, company_name="Globex", role_title="Senior Software Engineer",
+            work_mode=WorkMode.ONSITE, location="Berlin", salary_range_min=salary - 5000,
+            salary_range_max=salary + 5000, currency="EUR", board_rank="i"
+        ))
+    db_session.commit()
+    assert compute_salary_benchmarks(db_session, min_samples=5) == 2  # Berlin + role-wide
+    
+    response = client.get(f"/api/v1/interviews/{interview_ids[0]}/salary-benchmark", headers=authenticated_user)
+    assert response.status_code == 200
+    
+    benchmark = response.json()
+    assert benchmark["role_key"] == "senior software engineer"
+    assert benchmark["location_key"] == "berlin"
+    assert benchmark["currency"] == "EUR"
+    assert benchmark["sample_size"] == 5
+    assert abs(benchmark["p50"] - 100000) / 100000 < 0.02
+    assert benchmark["p25"] <= benchmark["p50"] <= benchmark["p75"] <= benchmark["p90"]
+    assert benchmark["offer_midpoint"] == 80000
+    
+    # No FX rate: percentiles can't be expressed in the offer's currency
+    client.put(f"/api/v1/interviews/{interview_ids[0]}", json={"currency": "XYZ"}, headers=authenticated_user)
+    response = client.get(f"/api/v1/interviews/{interview_ids[0]}/salary-benchmark", headers=authenticated_user)
+    assert response.status_code == 422
+
+
+def test_interview_board(client, authenticated_user):
+    """Test the board returns capped columns with totals and pages by cursor"""
+    for i in range(5):
+        client.post(
+            "/api/v1/interviews",
+            json={"company_name": f"Company {i}", "role_title": "Engineer", "work_mode": "REMOTE"},
+            headers=authenticated_user
+        )
+    client.post(
+        "/api/v1/interviews",
+        json={"company_name": "Offer Co", "role_title": "Engineer", "work_mode": "ONSITE", "application_status": "OFFER"},
+        headers=authenticated_user
+    )
+    
+    response = client.get("/api/v1/interviews/board?per_column=2", headers=authenticated_user)
+    assert response.status_code == 200
+    
+    columns = {column["status"]: column for column in response.json()["columns"]}
+    assert len(columns) == 8
+    assert columns["APPLIED"]["total"] == 5
+    assert len(columns["APPLIED"]["cards"]) == 2
+    assert columns["OFFER"]["total"] == 1
+    assert columns["OFFER"]["next_cursor"] is None
+    assert columns["REJECTED"] == {"status": "REJECTED", "total": 0, "cards": [], "next_cursor": None}
+    
+    seen = [card["id"] for card in columns["APPLIED"]["cards"]]
+    cursor = columns["APPLIED"]["next_cursor"]
+    for expected in ([2, True], [1, False]):
+        page = client.get(
+            f"/api/v1/interviews/board/APPLIED?limit=2&cursor={cursor}", headers=authenticated_user
+        ).json()
+        assert page["total"] == 5
+        ids = [card["id"] for card in page["cards"]]
+        assert [len(ids), page["next_cursor"] is not None] == expected
+        assert not set(ids) & set(seen)
+        seen += ids
+        cursor = page["next_cursor"]
+    assert len(seen) == len(set(seen)) == 5
+    
+    response = client.get("/api/v1/interviews/board/APPLIED?cursor=garbage", headers=authenticated_user)
+    assert response.status_code == 400
+
+def test_move_interview_on_board(client, authenticated_user, db_session):
+    """Test moving a card rewrites only its own rank and keeps board order"""
+    from app.workers.board_ranks import rebalance_board_ranks
+    
+    ids = []
+    for i in range(3):
+        response = client.post(
+            "/api/v1/interviews",
+            json={"company_name": f"Company {i}", "role_title": "Engineer", "work_mode": "REMOTE"},
+            headers=authenticated_user
+        )
+        ids.append(response.json()["id"])
+    
+    def column(status="APPLIED"):
+        page = client.get(f"/api/v1/interviews/board/{status}", headers=authenticated_user).json()
+        return [card["id"] for card in page["cards"]]
+    
+    # Newest on top
+    assert column() == ids[::-1]
+    
+    response = client.post(
+        f"/api/v1/interviews/{ids[0]}/move",
+        json={"before_id": ids[2], "after_id": ids[1]},
+        headers=authenticated_user
+    )
+    assert response.status_code == 200
+    assert column() == [ids[2], ids[0], ids[1]]
+    
+    response = client.post(
+        f"/api/v1/interviews/{ids[2]}/move",
+        json={"application_status": "SCREENING"},
+        headers=authenticated_user
+    )
+    assert response.status_code == 200
+    assert response.json()["application_status"] == "SCREENING"
+    assert column() == [ids[0], ids[1]]
+    assert column("SCREENING") == [ids[2]]
+    
+    # Neighbours must sit in the target column, in order
+    response = client.post(
+        f"/api/v1/interviews/{ids[0]}/move",
+        json={"after_id": ids[2]},
+        headers=authenticated_user
+    )
+    assert response.status_code == 400
+    response = client.post(
+        f"/api/v1/interviews/{ids[2]}/move",
+        json={"application_status": "APPLIED", "before_id": ids[1], "after_id": ids[0]},
+        headers=authenticated_user
+    )
+    assert response.status_code == 400
+    
+    # Repeated drops into the same gap grow the key until the rebalance respaces it
+    client.post(f"/api/v1/interviews/{ids[2]}/move", json={"application_status": "APPLIED"}, headers=authenticated_user)
+    top, upper, lower = column()
+    for _ in range(20):
+        for moved, after in ((lower, upper), (upper, lower)):
+            client.post(
+                f"/api/v1/interviews/{moved}/move",
+                json={"before_id": top, "after_id": after},
+                headers=authenticated_user
+            )
+    assert column() == [top, upper, lower]
+    assert rebalance_board_ranks(db_session, max_length=4) == 1
+    assert column() == [top, upper, lower]
+    ranks = [card["board_rank"] for card in client.get("/api/v1/interviews/board/APPLIED", headers=authenticated_user).json()["cards"]]
+    assert max(len(rank) for rank in ranks) == 1
+
+def test_interview_facets(client, authenticated_user):
+    """Test facet histograms follow the active filters"""
+    for company, mode, currency, status in (
+        ("Acme", "REMOTE", "EUR", "APPLIED"),
+        ("Acme Labs", "ONSITE", "EUR", "SCREENING"),
+        ("Acme", "REMOTE", "USD", "SCREENING"),
+        ("Globex", "REMOTE", None, "APPLIED"),
+    ):
+        client.post(
+            "/api/v1/interviews",
+            json={
+                "company_name": company, "role_title": "Engineer", "work_mode": mode,
+                "currency": currency, "application_status": status
+            },
+            headers=authenticated_user
+        )
+    
+    response = client.get("/api/v1/interviews?company=acme&facets=status,work_mode,currency", headers=authenticated_user)
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["interviews"]) == 3
+    assert body["facets"] == {
+        "status": {"APPLIED": 1, "SCREENING": 2},
+        "work_mode": {"REMOTE": 2, "ONSITE": 1},
+        "currency": {"EUR": 2, "USD": 1},
+    }
+    
+    response = client.get("/api/v1/interviews?status=APPLIED&facets=all", headers=authenticated_user)
+    assert response.json()["facets"]["currency"] == {"EUR": 1, "USD": 1}  # USD is the default
+    assert set(response.json()["facets"]) == {"status", "work_mode", "currency", "language", "location", "tags"}
+    
+    assert client.get("/api/v1/interviews", headers=authenticated_user).json()["facets"] is None
+    assert client.get("/api/v1/interviews?facets=salary", headers=authenticated_user).status_code == 400
+
+def test_suggest_companies(client, authenticated_user, monkeypatch):
+    """Test company autocomplete follows writes, with and without the trie"""
+    from app.core.config import settings
+    
+    ids = {}
+    for company in ("Acme", "Acme", "Acme Labs", "Globex", "100%_Co"):
+        response = client.post(
+            "/api/v1/interviews",
+            json={"company_name": company, "role_title": "Engineer", "work_mode": "REMOTE"},
+            headers=authenticated_user
+        )
+        ids[company] = response.json()["id"]
+    
+    def suggest(q):
+        response = client.get(f"/api/v1/interviews/companies/suggest?q={q}", headers=authenticated_user)
+        assert response.status_code == 200
+        return [(item["company_name"], item["interviews"]) for item in response.json()]
+    
+    assert suggest("ac") == [("Acme", 2), ("Acme Labs", 1)]
+    assert suggest("100%25_") == [("100%_Co", 1)]
+    
+    client.put(f"/api/v1/interviews/{ids['Acme Labs']}", json={"company_name": "Globex"}, headers=authenticated_user)
+    client.delete(f"/api/v1/interviews/{ids['Acme']}", headers=authenticated_user)
+    assert suggest("ac") == [("Acme", 1)]
+    assert suggest("G") == [("Globex", 2)]
+    
+    # Over the cap: served by the prefix index instead
+    monkeypatch.setattr(settings, "COMPANY_TRIE_MAX_NAMES", 1)
+    client.post(
+        "/api/v1/interviews",
+        json={"company_name": "Acme Robotics", "role_title": "Engineer", "work_mode": "REMOTE"},
+        headers=authenticated_user
+    )
+    assert suggest("ACME") == [("Acme", 1), ("Acme Robotics", 1)]
+    assert suggest("1%") == []
+    assert client.get("/api/v1/interviews/companies/suggest?q=", headers=authenticated_user).status_code == 422
+
+def test_duplicate_interviews(client, authenticated_user):
+    """Test near-duplicate warnings on create and the duplicates report"""
+    def create(company, role):
+        response = client.post(
+            "/api/v1/interviews",
+            json={"company_name": company, "role_title": role, "work_mode": "REMOTE"},
+            headers=authenticated_user
+        )
+        assert response.status_code == 201
+        return response.json()
+    
+    first = create("Acme Inc", "Sr. Backend Engineer")
+    assert first["duplicates"] == []
+    second = create("ACME", "Senior Backend Engineer II")
+    assert [match["interview_id"] for match in second["duplicates"]] == [first["id"]]
+    assert 0.6 <= second["duplicates"][0]["similarity"] < 1
+    third = create("Acme", "Data Scientist")
+    assert third["duplicates"] == []
+    assert create("Globex", "Backend Engineer")["duplicates"] == []
+    
+    def report():
+        response = client.get("/api/v1/interviews/duplicates", headers=authenticated_user)
+        assert response.status_code == 200
+        return sorted(sorted(item["interview_id"] for item in group["interviews"]) for group in response.json())
+    
+    assert report() == [sorted([first["id"], second["id"]])]
+    
+    client.put(f"/api/v1/interviews/{second['id']}", json={"role_title": "Data Scientist"}, headers=authenticated_user)
+    assert report() == [sorted([second["id"], third["id"]])]
+    
+    client.delete(f"/api/v1/interviews/{third['id']}", headers=authenticated_user)
+    assert report() == []
+
+def test_interview_tags(client, authenticated_user):
+    """Test tags on write, tag filters, tag facets and bulk edits"""
+    def create(company, tags):
+        response = client.post(
+            "/api/v1/interviews",
+            json={"company_name": company, "role_title": "Engineer", "work_mode": "REMOTE", "tags": tags},
+            headers=authenticated_user
+        )
+        assert response.status_code == 201
+        return response.json()
+    
+    acme = create("Acme", ["Referral", " dream job ", "referral"])
+    assert acme["tags"] == ["dream job", "referral"]
+    globex = create("Globex", ["referral"])
+    initech = create("Initech", [])
+    
+    def companies(query):
+        response = client.get(f"/api/v1/interviews?{query}", headers=authenticated_user)
+        assert response.status_code == 200
+        return sorted(interview["company_name"] for interview in response.json()["interviews"])
+    
+    assert companies("tags_any=referral,remote") == ["Acme", "Globex"]
+    assert companies("tags_all=referral,Dream Job") == ["Acme"]
+    assert companies("tags_all=referral,remote") == []
+    
+    facets = client.get("/api/v1/interviews?facets=tags&company=acme", headers=authenticated_user).json()["facets"]
+    assert facets == {"tags": {"dream job": 1, "referral": 1}}
+    
+    response = client.put(f"/api/v1/interviews/{acme['id']}", json={"tags": ["referral", "onsite"]}, headers=authenticated_user)
+    assert response.json()["tags"] == ["onsite", "referral"]
+    
+    response = client.post(
+        "/api/v1/interviews/tags",
+        json={"interview_ids": [acme["id"], globex["id"], initech["id"]], "add": ["Q4"], "remove": ["referral"]},
+        headers=authenticated_user
+    )
+    assert response.json() == {"updated": 3}
+    assert companies("tags_any=referral") == []
+    facets = client.get("/api/v1/interviews?facets=tags", headers=authenticated_user).json()["facets"]
+    assert facets == {"tags": {"q4": 3, "onsite": 1}}
+    
+    client.delete(f"/api/v1/interviews/{acme['id']}", headers=authenticated_user)
+    facets = client.get("/api/v1/interviews?facets=tags", headers=authenticated_user).json()["facets"]
+    assert facets == {"tags": {"q4": 2}}
+
+def test_saved_views(client, authenticated_user, query_log):
+    """Test saved views reuse the filters and serve counts from cache until a write"""
+    for company, status, tags in (
+        ("Acme", "SCREENING", ["referral"]),
+        ("Acme Labs", "APPLIED", ["referral"]),
+        ("Globex", "SCREENING", []),
+    ):
+        client.post(
+            "/api/v1/interviews",
+            json={
+                "company_name": company, "role_title": "Engineer", "work_mode": "REMOTE",
+                "application_status": status, "tags": tags
+            },
+            headers=authenticated_user
+        )
+    
+    response = client.post(
+        "/api/v1/interviews/views",
+        json={"name": "Acme referrals", "filters": {"company": " acme ", "tags_any": ["Referral"]}},
+        headers=authenticated_user
+    )
+    assert response.status_code == 201
+    view = response.json()
+    assert view["filters"]["company"] == "acme"
+    assert view["filters"]["tags_any"] == ["referral"]
+    assert view["count"] == 2
+    client.post(
+        "/api/v1/interviews/views",
+        json={"name": "Screening", "filters": {"status": "SCREENING"}},
+        headers=authenticated_user
+    )
+    duplicate = client.post("/api/v1/interviews/views", json={"name": "Screening"}, headers=authenticated_user)
+    assert duplicate.status_code == 400
+    
+    page = client.get(f"/api/v1/interviews/views/{view['id']}?limit=1", headers=authenticated_user).json()
+    assert page["view"]["count"] == 2
+    assert len(page["interviews"]) == 1
+    page = client.get(f"/api/v1/interviews/views/{view['id']}", headers=authenticated_user).json()
+    acme_labs = next(i for i in page["interviews"] if i["company_name"] == "Acme Labs")
+    
+    # Sidebar: every count from cache, no interview queries
+    query_log.clear()
+    views = client.get("/api/v1/interviews/views", headers=authenticated_user).json()
+    assert {v["name"]: v["count"] for v in views} == {"Acme referrals": 2, "Screening": 2}
+    assert not [s for s in query_log if "FROM interviews" in s]
+    
+    client.put(
+        f"/api/v1/interviews/{acme_labs['id']}", json={"application_status": "SCREENING"},
+        headers=authenticated_user
+    )
+    views = client.get("/api/v1/interviews/views", headers=authenticated_user).json()
+    assert {v["name"]: v["count"] for v in views} == {"Acme referrals": 2, "Screening": 3}
+    
+    response = client.put(
+        f"/api/v1/interviews/views/{view['id']}", json={"filters": {"tags_all": ["referral"], "status": "SCREENING"}},
+        headers=authenticated_user
+    )
+    assert response.json()["count"] == 2
+    assert client.delete(f"/api/v1/interviews/views/{view['id']}", headers=authenticated_user).status_code == 204
+    assert client.get(f"/api/v1/interviews/views/{view['id']}", headers=authenticated_user).status_code == 404
+
+def test_interview_changes(client, authenticated_user, query_log):
+    """Test the change feed pages writes in order, reports deletions and idles without queries"""
+    ids = []
+    for company in ("Acme", "Globex", "Initech"):
+        response = client.post(
+            "/api/v1/interviews",
+            json={"company_name": company, "role_title": "Engineer", "work_mode": "REMOTE"},
+            headers=authenticated_user
+        )
+        ids.append(response.json()["id"])
+    
+    page = client.get("/api/v1/interviews/changes?limit=2", headers=authenticated_user).json()
+    assert [i["company_name"] for i in page["changes"]] == ["Acme", "Globex"]
+    assert page["has_more"]
+    page = client.get(f"/api/v1/interviews/changes?since={page['cursor']}&limit=2", headers=authenticated_user).json()
+    assert [i["company_name"] for i in page["changes"]] == ["Initech"]
+    assert not page["has_more"]
+    cursor = page["cursor"]
+    
+    # Nothing written since: answered without touching interviews or tombstones
+    query_log.clear()
+    idle = client.get(f"/api/v1/interviews/changes?since={cursor}", headers=authenticated_user).json()
+    assert idle == {"changes": [], "deleted": [], "cursor": cursor, "has_more": False}
+    assert not [s for s in query_log if "FROM interviews" in s or "FROM interview_tombstones" in s]
+    
+    client.put(f"/api/v1/interviews/{ids[0]}", json={"notes": "Called back"}, headers=authenticated_user)
+    client.delete(f"/api/v1/interviews/{ids[1]}", headers=authenticated_user)
+    client.post("/api/v1/interviews/tags", json={"interview_ids": [ids[2]], "add": ["q4"]}, headers=authenticated_user)
+    page = client.get(f"/api/v1/interviews/changes?since={cursor}", headers=authenticated_user).json()
+    assert [(i["company_name"], i["notes"], i["tags"]) for i in page["changes"]] == [
+        ("Acme", "Called back", []), ("Initech", None, ["q4"])
+    ]
+    assert page["deleted"] == [ids[1]]
+    
+    assert client.get("/api/v1/interviews/changes?since=bogus", headers=authenticated_user).status_code == 400
+
+def test_create_interview_idempotency_key(client, authenticated_user, db_session, query_log):
+    """Test retries with an Idempotency-Key replay the first response instead of creating again"""
+    from datetime import datetime, timedelta, timezone
+    from app.models.idempotency_key import IdempotencyKey
+    from app.workers.idempotency_keys import purge_idempotency_keys
+    
+    payload = {"company_name": "Acme", "role_title": "Engineer", "work_mode": "REMOTE"}
+    headers = {**authenticated_user, "Idempotency-Key": "create-acme-1"}
+    first = client.post("/api/v1/interviews", json=payload, headers=headers)
+    assert first.status_code == 201
+    
+    query_log.clear()
+    retry = client.post("/api/v1/interviews", json=payload, headers=headers)
+    assert retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    # The user lookup, then the key; nothing reaches the service layer
+    assert [s.split("FROM ")[1].split()[0] for s in query_log] == ["users", "idempotency_keys"]
+    assert client.get("/api/v1/interviews", headers=authenticated_user).json()["total"] == 1
+    
+    other_body = client.post("/api/v1/interviews", json={**payload, "company_name": "Globex"}, headers=headers)
+    assert other_body.status_code == 422
+    
+    # A duplicate arriving while the first request holds the key is turned away
+    now = datetime.now(timezone.utc)
+    in_progress = client.post("/api/v1/interviews", json=payload, headers={**headers, "Idempotency-Key": "busy"})
+    db_session.query(IdempotencyKey).filter(IdempotencyKey.key == "busy").update(
+        {"status_code": None, "response_body": None, "locked_until": now + timedelta(minutes=1)}
+    )
+    db_session.commit()
+    assert in_progress.status_code == 201
+    assert client.post("/api/v1/interviews", json=payload, headers={**headers, "Idempotency-Key": "busy"}).status_code == 409
+    
+    # Failed requests release their key
+    no_date = client.post(
+        "/api/v1/calendar/google/sync", json={"interview_id": first.json()["id"]},
+        headers={**headers, "Idempotency-Key": "bad-sync"}
+    )
+    assert no_date.status_code == 404
+    assert db_session.query(IdempotencyKey).filter(IdempotencyKey.key == "bad-sync").count() == 0
+    
+    db_session.query(IdempotencyKey).update({"expires_at": now - timedelta(seconds=1)})
+    db_session.commit()
+    assert purge_idempotency_keys(db_session) == 2
@@ -20,3 +20,132 @@ def test_cors_headers(client):
     response = client.options("/api/v1/auth/login")
     assert response.status_code == 200
     # Basic CORS check - specific headers depend on configuration
+
+def test_response_compression(client, authenticated_user):
+    """Test large responses are gzipped, small ones are not, and cached feeds are compressed once"""
+    from datetime import datetime, timedelta, timezone
+    from app.core.compression import stats
+    
+    soon = (datetime.now(timezone.utc) + timedelta(days=2)).isoformat()
+    for i in range(20):
+        client.post(
+            "/api/v1/interviews",
+            json={
+                "company_name": f"Company {i}", "role_title": "Engineer", "work_mode": "REMOTE",
+                "notes": "Panel interview with the platform team. " * 20,
+                "interview_date": soon
+            },
+            headers=authenticated_user
+        )
+    gzip_only = {**authenticated_user, "Accept-Encoding": "gzip"}
+    
+    response = client.get("/api/v1/interviews", headers=gzip_only)
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert len(response.json()["interviews"]) == 20
+    assert int(response.headers["content-length"]) < len(response.content) / 5
+    
+    assert "content-encoding" not in client.get("/api/v1/interviews", headers={**authenticated_user, "Accept-Encoding": "identity"}).headers
+    assert "content-encoding" not in client.get("/health", headers={"Accept-Encoding": "gzip"}).headers
+    
+    stats.clear()
+    first = client.get("/api/v1/calendar/ics", headers=gzip_only)
+    second = client.get("/api/v1/calendar/ics", headers=gzip_only)
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["content-disposition"] == "attachment; filename=jobsift_interviews.ics"
+    assert second.content == first.content
+    assert first.text.count("BEGIN:VEVENT") == 20
+    
+    metrics = client.get("/metrics/compression", headers={"Accept-Encoding": "identity"}).json()
+    assert metrics["gzip"]["compressions"] == 1
+    assert metrics["gzip"]["bytes_saved"] > 0
+
+def test_lazy_session_releases_connection(client, authenticated_user, db_session, query_log):
+    """Test the request session is built on first use and its connection released without expiring objects"""
+    from sqlalchemy.orm import sessionmaker
+    from app.core.database import LazySession, release_connection
+    from app.models.user import User
+    
+    built = []
+    factory = sessionmaker(bind=db_session.get_bind())
+    
+    def counting_factory():
+        built.append(True)
+        return factory()
+    
+    unused = LazySession(counting_factory)
+    unused.close()
+    assert built == []
+    
+    db = LazySession(counting_factory)
+    user = db.query(User).one()
+    assert db.in_transaction()
+    release_connection(db)
+    assert not db.in_transaction()
+    query_log.clear()
+    assert user.email == "test@jobsift.com"
+    assert query_log == []  # Still loaded; nothing re-fetched
+    db.close()
+    assert len(built) == 1
+
+# Counts to 50M; seconds of work unless something interrupts it
+SLOW_QUERY = "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n LIMIT 50000000) SELECT count(*) FROM n"
+
+def _slow_interview_list(monkeypatch):
+    from sqlalchemy import text
+    from app.services.interview import InterviewService
+    
+    def get_user_interviews(self, *args, **kwargs):
+        self.db.execute(text(SLOW_QUERY))
+        return []
+    
+    monkeypatch.setattr(InterviewService, "get_user_interviews", get_user_interviews)
+
+def test_route_time_budget(client, authenticated_user, monkeypatch, caplog):
+    """Test a query running past its route's budget is interrupted, answered 503 and logged with the route"""
+    import time
+    from app.core.config import settings
+    
+    _slow_interview_list(monkeypatch)
+    monkeypatch.setattr(settings, "ROUTE_TIME_BUDGETS_MS", {"GET /api/v1/interviews": 100})
+    
+    started = time.monotonic()
+    response = client.get("/api/v1/interviews", headers=authenticated_user)
+    assert response.status_code == 503
+    assert time.monotonic() - started < 2
+    assert "GET /api/v1/interviews (get_interviews) exceeded its 100 ms database budget" in caplog.text
+    
+    # The connection is handed back without the budget
+    monkeypatch.setattr(settings, "ROUTE_TIME_BUDGETS_MS", {})
+    assert client.get("/api/v1/dashboard/summary", headers=authenticated_user).status_code == 200
+
+def test_client_disconnect_cancels_query(client, authenticated_user, monkeypatch, caplog):
+    """Test the in-flight query of a request is interrupted when its client disconnects"""
+    import asyncio
+    import logging
+    import time
+    from app.main import app
+    
+    _slow_interview_list(monkeypatch)
+    caplog.set_level(logging.INFO, logger="app.core.database")
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/api/v1/interviews", "raw_path": b"/api/v1/interviews", "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"test"), (b"authorization", authenticated_user["Authorization"].encode())],
+        "client": ("127.0.0.1", 50000), "server": ("test", 80),
+    }
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+    
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.sleep(0.1)  # The client gives up
+        return {"type": "http.disconnect"}
+    
+    async def send(message):
+        pass
+    
+    started = time.monotonic()
+    asyncio.run(app(scope, receive, send))
+    assert time.monotonic() - started < 2
+    assert "Cancelled GET /api/v1/interviews (get_interviews): client disconnected" in caplog.text